@@ -0,0 +1,224 @@
+"""
+Session Export — kayıtlı oturumu CSV / Parquet'e chunk chunk aktarır.
+
+İki mod:
+  - ham:      her sinyal kendi dosyasına (time_s, value) — örnekler olduğu gibi
+  - resample: tüm sinyaller ortak zaman tabanında tek dosyada (vektörel np.interp)
+
+Dosya hiçbir zaman tamamen belleğe alınmaz; bellek kullanımı chunk boyutuyla
+sınırlıdır. Resample modunda bir chunk ileriye bakılır, böylece chunk
+sınırlarında da gerçek interpolasyon yapılır. `stale_after_s`'den uzun
+boşluklar NaN olarak yazılır (kopukluğun üzerinden interpolasyon yapılmaz).
+
+Parquet için pyarrow gerekir (opsiyonel); birimler ve limitler kolon
+metadata'sına yazılır. CSV'de birim kolon başlığındadır: `rpm [rpm]`.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+
+from core.session_log import DEFAULT_CHUNK_RECORDS, SessionReader, split_by_signal
+from core.signals_def import SignalDef
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # opsiyonel bağımlılık
+    pa = None
+    pq = None
+
+FORMATS = ("csv", "parquet")
+CSV_BLOCK_ROWS = 1 << 16       # tek % formatlamada yazılan satır (geçici string ~birkaç MB)
+
+Series = Tuple[np.ndarray, np.ndarray]
+
+
+# ── Writers ─────────────────────────────────────────────────
+class _CsvWriter:
+    """
+    np.savetxt satır başına Python'da formatlar. Burada blok başına tek bir
+    `(satır_kalıbı * n) % değerler` — formatlama C'de, blok başına tek write;
+    çıktı savetxt(fmt="%.9g") ile bayt bayt aynı.
+    """
+
+    def __init__(self, path: Path, columns: Sequence[str]):
+        self._f: TextIO = path.open("w", encoding="utf-8", newline="")
+        self._f.write(",".join(columns) + "\n")
+        self._row = ",".join(["%.9g"] * len(columns)) + "\n"
+
+    def write(self, cols: List[np.ndarray]) -> None:
+        n = len(cols[0])
+        if not n:
+            return
+        table = np.column_stack(cols)
+        for s in range(0, n, CSV_BLOCK_ROWS):
+            block = table[s:s + CSV_BLOCK_ROWS]
+            self._f.write((self._row * len(block)) % tuple(block.ravel().tolist()))
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path, fields: List["pa.Field"], created: float):
+        schema = pa.schema(fields, metadata={"created": str(created)})
+        self._schema = schema
+        self._writer = pq.ParquetWriter(str(path), schema, compression="zstd")
+
+    def write(self, cols: List[np.ndarray]) -> None:
+        if len(cols[0]):
+            self._writer.write_table(pa.Table.from_arrays(cols, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _field(name: str, d: Optional[SignalDef]) -> "pa.Field":
+    meta = None
+    if d is not None:
+        meta = {
+            "unit": d.unit,
+            "min": json.dumps(d.min),
+            "max": json.dumps(d.max),
+            "description": d.description,
+        }
+    return pa.field(name, pa.float64(), metadata=meta)
+
+
+def _open_writer(path: Path, fmt: str, defs: Sequence[Optional[SignalDef]],
+                 names: Sequence[str], created: float):
+    if fmt == "csv":
+        headers = [n if d is None else f"{n} [{d.unit}]" for n, d in zip(names, defs)]
+        return _CsvWriter(path, headers)
+    return _ParquetWriter(path, [_field(n, d) for n, d in zip(names, defs)], created)
+
+
+# ── Resampling ──────────────────────────────────────────────
+def _interp(grid: np.ndarray, ts: np.ndarray, vs: np.ndarray, max_gap: float) -> np.ndarray:
+    if len(ts) == 0:
+        return np.full(len(grid), np.nan)
+    out = np.interp(grid, ts, vs, left=np.nan, right=np.nan)
+    # Kopukluk (stale) üzerinden interpolasyon yapma
+    idx = np.searchsorted(ts, grid, side="right")
+    i0 = np.clip(idx - 1, 0, len(ts) - 1)
+    i1 = np.clip(idx, 0, len(ts) - 1)
+    out[(ts[i1] - ts[i0]) > max_gap] = np.nan
+    return out
+
+
+def _concat(*parts: Series) -> Series:
+    return (np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts]))
+
+
+def _tail(s: Series) -> Series:
+    return (s[0][-1:], s[1][-1:])
+
+
+def iter_resampled(reader: SessionReader, hz: float,
+                   chunk_records: int = DEFAULT_CHUNK_RECORDS) -> Iterator[List[np.ndarray]]:
+    """
+    Ortak zaman tabanında [t, sig0, sig1, ...] kolon blokları üret.
+    Bir chunk geride emit edilir: mevcut chunk ileriye bakış (look-ahead) sağlar.
+    """
+    span = reader.time_range()
+    if span is None:
+        return
+    n = len(reader.defs)
+    max_gaps = [d.stale_after_s for d in reader.defs]
+    dt = 1.0 / hz
+    start = math.ceil(span[0] / dt) * dt
+    next_i = 0
+
+    empty: Series = (np.empty(0), np.empty(0))
+    carry: List[Series] = [empty] * n       # emit penceresinden önceki son örnek
+    pending: Optional[List[Series]] = None
+    pending_end = 0.0
+
+    def emit(until: float, data: List[Series]) -> Optional[List[np.ndarray]]:
+        nonlocal next_i
+        last_i = int(math.floor((until - start) / dt))
+        if last_i < next_i:
+            return None
+        grid = start + np.arange(next_i, last_i + 1) * dt
+        next_i = last_i + 1
+        cols = [grid]
+        for (ts, vs), gap in zip(data, max_gaps):
+            cols.append(_interp(grid, ts, vs, gap))
+        return cols
+
+    for chunk in reader.iter_chunks(chunk_records):
+        cur = split_by_signal(chunk, n)
+        if pending is not None:
+            merged = [_concat(c, p) for c, p in zip(carry, pending)]
+            block = emit(pending_end, [_concat(m, c) for m, c in zip(merged, cur)])
+            if block is not None:
+                yield block
+            carry = [_tail(m) for m in merged]
+        pending = cur
+        pending_end = float(chunk["ts"].max())
+
+    if pending is not None:
+        block = emit(span[1], [_concat(c, p) for c, p in zip(carry, pending)])
+        if block is not None:
+            yield block
+
+
+# ── Export ──────────────────────────────────────────────────
+def export_session(
+    log_path: str | Path,
+    out_dir: str | Path,
+    fmt: str = "csv",
+    resample_hz: float | None = None,
+    chunk_records: int = DEFAULT_CHUNK_RECORDS,
+) -> List[Path]:
+    """Oturumu `out_dir` altına yaz; oluşturulan dosyaları döndür."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}', expected one of {FORMATS}")
+    if fmt == "parquet" and pa is None:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+    if resample_hz is not None and resample_hz <= 0:
+        raise ValueError("resample_hz must be > 0")
+
+    reader = SessionReader(log_path)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    t0 = reader.t0
+    defs = reader.defs
+
+    if resample_hz is not None:
+        path = out / f"{reader.path.stem}_{resample_hz:g}hz.{fmt}"
+        writer = _open_writer(path, fmt, [None] + defs, ["time_s"] + [d.name for d in defs],
+                              reader.created)
+        try:
+            for cols in iter_resampled(reader, resample_hz, chunk_records):
+                cols[0] = cols[0] - t0
+                writer.write(cols)
+        finally:
+            writer.close()
+        return [path]
+
+    # Ham mod: sinyal başına bir dosya, ilk örnek geldiğinde açılır
+    paths: List[Path] = []
+    writers: List[Optional[object]] = [None] * len(defs)
+    try:
+        for chunk in reader.iter_chunks(chunk_records):
+            for i, (ts, vs) in enumerate(split_by_signal(chunk, len(defs))):
+                if len(ts) == 0:
+                    continue
+                if writers[i] is None:
+                    d = defs[i]
+                    path = out / f"{d.name}.{fmt}"
+                    writers[i] = _open_writer(path, fmt, [None, d], ["time_s", d.name], reader.created)
+                    paths.append(path)
+                writers[i].write([ts - t0, vs])
+    finally:
+        for w in writers:
+            if w is not None:
+                w.close()
+    return paths
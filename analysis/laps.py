@@ -0,0 +1,239 @@
+"""
+Offline Lap Analysis — kayıtlı oturumu turlara böl, turları karşılaştır.
+
+Akış:
+  1. Session log chunk chunk okunur; sadece gereken sinyaller tutulur
+  2. Tur sınırları: log'daki tur işaretleri (LapTimer) veya GPS gate geçişleri
+  3. Her tur process pool'da işlenir: hız entegre edilerek mesafe ekseni çıkarılır,
+     hız / gaz / zaman ortak mesafe eksenine np.interp ile örneklenir
+  4. Referans (en hızlı) tura göre zaman deltası ve viraj min hızları hesaplanır
+
+Sonuç tek bir sıkıştırılmış .npz dosyasıdır; pit UI `LapAnalysis.load()` ile
+anında açar (trace'ler float32).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.session_log import DEFAULT_CHUNK_RECORDS, SessionReader, split_by_signal
+
+SPEED = "speed"
+THROTTLE = "tps"
+GPS_LAT = "gps_lat"
+GPS_LON = "gps_lon"
+
+EARTH_RADIUS_M = 6371000.0
+
+
+@dataclass(frozen=True, slots=True)
+class GpsGate:
+    lat: float
+    lon: float
+    radius_m: float = 15.0
+
+
+@dataclass(frozen=True, slots=True)
+class LapAnalysis:
+    lap_numbers: np.ndarray       # (n_laps,)
+    lap_times: np.ndarray         # (n_laps,) saniye
+    reference: int                # en hızlı turun indeksi
+    distance: np.ndarray          # (n_d,) metre
+    speed: np.ndarray             # (n_laps, n_d) km/h, tur bittiyse NaN
+    throttle: np.ndarray          # (n_laps, n_d) %
+    time_delta: np.ndarray        # (n_laps, n_d) s, referansa göre (+ = yavaş)
+    corner_distance: np.ndarray   # (n_corners,) metre
+    corner_min_speed: np.ndarray  # (n_laps, n_corners) km/h
+
+    def save(self, path: str | Path) -> None:
+        np.savez_compressed(
+            path,
+            lap_numbers=self.lap_numbers,
+            lap_times=self.lap_times,
+            reference=np.int64(self.reference),
+            distance=self.distance,
+            speed=self.speed,
+            throttle=self.throttle,
+            time_delta=self.time_delta,
+            corner_distance=self.corner_distance,
+            corner_min_speed=self.corner_min_speed,
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LapAnalysis":
+        with np.load(path) as z:
+            return cls(**{k: (int(z[k]) if k == "reference" else z[k]) for k in z.files})
+
+
+# ── Loading ─────────────────────────────────────────────────
+def _load_signals(reader: SessionReader, names: Sequence[str],
+                  chunk_records: int) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    index = {d.name: i for i, d in enumerate(reader.defs)}
+    wanted = {n: index[n] for n in names if n in index}
+    parts: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {n: [] for n in wanted}
+    for chunk in reader.iter_chunks(chunk_records):
+        split = split_by_signal(chunk, len(reader.defs))
+        for n, i in wanted.items():
+            parts[n].append(split[i])
+    return {
+        n: (np.concatenate([p[0] for p in ps]), np.concatenate([p[1] for p in ps]))
+        for n, ps in parts.items() if ps
+    }
+
+
+def gate_crossings(t: np.ndarray, lat: np.ndarray, lon: np.ndarray, gate: GpsGate) -> np.ndarray:
+    """Gate yarıçapına her girişte gate'e en yakın anı döndür."""
+    lat0 = math.radians(gate.lat)
+    dx = np.radians(lon - gate.lon) * math.cos(lat0) * EARTH_RADIUS_M
+    dy = np.radians(lat - gate.lat) * EARTH_RADIUS_M
+    dist = np.hypot(dx, dy)
+    inside = dist < gate.radius_m
+    if not inside.any():
+        return np.empty(0)
+    edges = np.diff(inside.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+    return np.array([t[a + np.argmin(dist[a:b])] for a, b in zip(starts, stops)])
+
+
+def lap_bounds(reader: SessionReader, signals: Dict[str, Tuple[np.ndarray, np.ndarray]],
+               gate: Optional[GpsGate], chunk_records: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(lap_numbers, [start, end] zamanları) — sadece tamamlanmış turlar."""
+    if gate is not None:
+        if GPS_LAT not in signals or GPS_LON not in signals:
+            raise ValueError(f"GPS gate requires '{GPS_LAT}' and '{GPS_LON}' in the log")
+        t, lat = signals[GPS_LAT]
+        lon = np.interp(t, *signals[GPS_LON])
+        cross = gate_crossings(t, lat, lon, gate)
+        numbers = np.arange(1, len(cross))
+        return numbers, np.column_stack([cross[:-1], cross[1:]])
+
+    ends, numbers = reader.lap_markers(chunk_records)
+    if len(ends) == 0:
+        return np.empty(0, dtype=np.int64), np.empty((0, 2))
+    # İlk tur oturum başında (ilk örnek) başlar
+    span = reader.time_range()
+    starts = np.concatenate([[span[0]], ends[:-1]])
+    return numbers, np.column_stack([starts, ends])
+
+
+# ── Per-lap work (process pool) ─────────────────────────────
+def _analyze_lap(args) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    t, speed, thr_t, thr, t_start, grid = args
+    # Hız (km/h) → mesafe: trapez entegrasyonu
+    v = speed / 3.6
+    dist = np.concatenate([[0.0], np.cumsum(0.5 * (v[1:] + v[:-1]) * np.diff(t))])
+    lap_len = dist[-1] if len(dist) else 0.0
+
+    inside = grid <= lap_len
+    out_speed = np.full(len(grid), np.nan)
+    out_thr = np.full(len(grid), np.nan)
+    out_time = np.full(len(grid), np.nan)
+    if len(dist) > 1:
+        # Durma anlarında mesafe sabit kalır; interp için kesin artan olmalı
+        keep = np.concatenate([[True], np.diff(dist) > 0])
+        d, tt = dist[keep], t[keep]
+        g = grid[inside]
+        out_time[inside] = np.interp(g, d, tt) - t_start
+        out_speed[inside] = np.interp(g, d, speed[keep])
+        if len(thr_t):
+            out_thr[inside] = np.interp(out_time[inside] + t_start, thr_t, thr)
+    return out_speed, out_thr, out_time, lap_len
+
+
+def _find_corners(speed: np.ndarray, step: float, window_m: float = 60.0,
+                  min_drop_kmh: float = 5.0) -> np.ndarray:
+    """Referans hız izindeki yerel minimumlar (viraj apeksleri) — indeks."""
+    valid = ~np.isnan(speed)
+    v = speed[valid]
+    half = max(1, int(window_m / step / 2))
+    if len(v) < 2 * half + 1:
+        return np.empty(0, dtype=np.int64)
+    # Tam pencere olmayan uçlar aranmaz: tur başı/sonu hızı sahte apeks olmasın
+    win = np.lib.stride_tricks.sliding_window_view(v, 2 * half + 1)
+    center = v[half:len(v) - half]
+    # İki yanda da gerçek düşüş: sadece tek taraflı frenleme/çıkış apeks sayılmaz
+    left = win[:, :half].max(axis=1)
+    right = win[:, half + 1:].max(axis=1)
+    is_min = ((center == win.min(axis=1)) & (left - center >= min_drop_kmh)
+              & (right - center >= min_drop_kmh))
+    idx = np.flatnonzero(is_min) + half
+    # Düz minimum platolarında tek apeks kalsın
+    if len(idx):
+        idx = idx[np.concatenate([[True], np.diff(idx) > half])]
+    return np.flatnonzero(valid)[idx]
+
+
+def analyze_session(
+    log_path: str | Path,
+    step_m: float = 1.0,
+    gate: Optional[GpsGate] = None,
+    workers: Optional[int] = None,
+    chunk_records: int = DEFAULT_CHUNK_RECORDS,
+) -> LapAnalysis:
+    reader = SessionReader(log_path)
+    signals = _load_signals(reader, [SPEED, THROTTLE, GPS_LAT, GPS_LON], chunk_records)
+    if SPEED not in signals:
+        raise ValueError(f"Session log has no '{SPEED}' samples")
+
+    numbers, bounds = lap_bounds(reader, signals, gate, chunk_records)
+    if len(numbers) == 0:
+        raise ValueError("No completed laps found (no lap markers / gate crossings)")
+
+    st, sv = signals[SPEED]
+    tt, tv = signals.get(THROTTLE, (np.empty(0), np.empty(0)))
+    lap_times = bounds[:, 1] - bounds[:, 0]
+
+    # Ortak mesafe ekseni: en uzun tur kadar (tahmini, hızdan)
+    jobs = []
+    max_len = 0.0
+    for t0, t1 in bounds:
+        a, b = np.searchsorted(st, [t0, t1])
+        c, d = np.searchsorted(tt, [t0, t1])
+        seg_t, seg_v = st[a:b], sv[a:b]
+        if len(seg_t) > 1:
+            max_len = max(max_len, float(np.sum(0.5 * (seg_v[1:] + seg_v[:-1]) / 3.6 * np.diff(seg_t))))
+        jobs.append((seg_t, seg_v, tt[c:d], tv[c:d], t0))
+    grid = np.arange(0.0, max_len + step_m, step_m)
+
+    args = [job + (grid,) for job in jobs]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(args) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_analyze_lap, args, chunksize=max(1, len(args) // (4 * workers))))
+    else:
+        results = [_analyze_lap(a) for a in args]
+
+    speed = np.vstack([r[0] for r in results])
+    throttle = np.vstack([r[1] for r in results])
+    time_at = np.vstack([r[2] for r in results])
+
+    ref = int(np.argmin(lap_times))
+    time_delta = time_at - time_at[ref]
+
+    corners = _find_corners(speed[ref], step_m)
+    half = max(1, int(30.0 / step_m))
+    corner_min = np.full((len(numbers), len(corners)), np.nan)
+    for j, c in enumerate(corners):
+        window = speed[:, max(0, c - half):c + half + 1]
+        has = ~np.all(np.isnan(window), axis=1)
+        corner_min[has, j] = np.nanmin(window[has], axis=1)
+
+    return LapAnalysis(
+        lap_numbers=numbers.astype(np.int64),
+        lap_times=lap_times,
+        reference=ref,
+        distance=grid.astype(np.float32),
+        speed=speed.astype(np.float32),
+        throttle=throttle.astype(np.float32),
+        time_delta=time_delta.astype(np.float32),
+        corner_distance=grid[corners].astype(np.float32),
+        corner_min_speed=corner_min.astype(np.float32),
+    )
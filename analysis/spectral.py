@@ -0,0 +1,75 @@
+"""
+Spectral / statistical analysis — FFT, histogram ve kayan istatistikler.
+
+Saf NumPy, vektörel fonksiyonlar; Qt'ye dokunmaz. `compute` modül seviyesinde
+olduğu için process pool'a da gönderilebilir (pickle edilebilir).
+
+  - fft:       düzgün zaman tabanına interp + Hann penceresi → genlik spektrumu
+  - histogram: SignalDef min/max aralığında sabit kovalar (pencereler arası kıyaslanabilir)
+  - rolling:   `window_s` kayan ortalama / std / min / max (en fazla MAX_POINTS nokta)
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+KINDS = ("fft", "histogram", "rolling")
+MAX_POINTS = 2000
+
+Series = Dict[str, np.ndarray]
+
+
+def _uniform(t: np.ndarray, v: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Düzensiz örnekleri medyan adımla düzgün tabana taşı."""
+    dt = float(np.median(np.diff(t)))
+    if dt <= 0:
+        raise ValueError("timestamps must be increasing")
+    grid = np.arange(t[0], t[-1], dt)
+    return np.interp(grid, t, v), dt
+
+
+def fft_spectrum(t: np.ndarray, v: np.ndarray) -> Tuple[np.ndarray, Series]:
+    if len(t) < 8:
+        return np.empty(0), {"amplitude": np.empty(0)}
+    vu, dt = _uniform(t, v)
+    vu = vu - vu.mean()
+    w = np.hanning(len(vu))
+    spec = np.fft.rfft(vu * w)
+    amp = 2.0 * np.abs(spec) / w.sum()
+    freqs = np.fft.rfftfreq(len(vu), dt)
+    return freqs, {"amplitude": amp}
+
+
+def histogram(v: np.ndarray, bins: int = 50,
+              value_range: Tuple[float, float] | None = None) -> Tuple[np.ndarray, Series]:
+    counts, edges = np.histogram(v, bins=bins, range=value_range)
+    return 0.5 * (edges[:-1] + edges[1:]), {"count": counts.astype(np.float64)}
+
+
+def rolling_stats(t: np.ndarray, v: np.ndarray, window_s: float = 1.0) -> Tuple[np.ndarray, Series]:
+    if len(t) < 2:
+        return np.empty(0), {k: np.empty(0) for k in ("mean", "std", "min", "max")}
+    dt = float(np.median(np.diff(t)))
+    w = int(min(len(v), max(1, round(window_s / dt))))
+    step = max(1, math.ceil((len(v) - w + 1) / MAX_POINTS))
+    win = np.lib.stride_tricks.sliding_window_view(v, w)[::step]
+    return t[w - 1::step][:len(win)], {
+        "mean": win.mean(axis=1),
+        "std": win.std(axis=1),
+        "min": win.min(axis=1),
+        "max": win.max(axis=1),
+    }
+
+
+def compute(kind: str, t: np.ndarray, v: np.ndarray, params: Dict[str, Any]) -> Tuple[np.ndarray, Series]:
+    """Tek giriş noktası (thread veya process pool'da çalışır)."""
+    if kind == "fft":
+        return fft_spectrum(t, v)
+    if kind == "histogram":
+        return histogram(v, params.get("bins", 50), params.get("range"))
+    if kind == "rolling":
+        return rolling_stats(t, v, params.get("window_s", 1.0))
+    raise ValueError(f"Unknown analysis '{kind}', expected one of {KINDS}")
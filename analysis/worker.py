@@ -0,0 +1,124 @@
+"""
+Analysis worker pool — pit UI analizleri Qt thread'i dışında.
+
+Her iş bir thread'de çalışır: SignalHistory'den pencereyi dilim dilim çeker
+(kilit dilim başına kısa süre tutulur, acquisition append'i beklemez), sonra
+hesaplar. NumPy büyük dizilerde GIL'i bırakır; `HEAVY_SAMPLES`'tan büyük
+pencereler process pool'a gönderilir (ilk ağır işte açılır). Pool `spawn` ile
+başlar: çok thread'li process'i fork etmek, fork anında tutulan bir kilit
+yüzünden çocukta kilitlenebilir.
+
+İptal: `cancel_all()` kuyruktaki işleri iptal eder ve nesli (generation)
+artırır; çalışmakta olan iş veri çektikten sonra neslini kontrol eder ve
+eskiyse hesaplamadan CancelledError ile biter.
+
+Sonuçlar (kind, sinyal, pencere, parametre) anahtarıyla LRU önbellekte tutulur;
+aynı pencere tekrar istenirse hesaplanmadan döner. Sonu en yeni örnekten ileride
+olan pencere (canlı uç, veri henüz eksik) önbelleğe girmez.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from analysis.spectral import KINDS, Series, compute
+from core.lod import SignalHistory
+
+HEAVY_SAMPLES = 1 << 18          # bu kadar örnekten büyük pencere → process pool
+MAX_PULL = 1 << 22               # history'den çekilecek en fazla nokta
+DEFAULT_CACHE = 64
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisResult:
+    kind: str
+    signal: str
+    t0: float
+    t1: float
+    x: np.ndarray                # fft: Hz, histogram: değer, rolling: zaman
+    series: Series
+    n_samples: int
+    level: int                   # kullanılan LOD seviyesi (0 = ham)
+
+
+class AnalysisPool:
+    def __init__(self, history: SignalHistory, threads: int = 2, processes: int = 2,
+                 cache_size: int = DEFAULT_CACHE):
+        self._history = history
+        self._threads = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="analysis")
+        self._n_processes = processes
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple, AnalysisResult]" = OrderedDict()
+        self._cache_size = cache_size
+        self._generation = 0
+        self._queued: list[Future] = []
+
+    def submit(self, kind: str, signal: str, t0: float, t1: float,
+               params: Dict[str, Any] | None = None) -> Future:
+        if kind not in KINDS:
+            raise ValueError(f"Unknown analysis '{kind}', expected one of {KINDS}")
+        params = params or {}
+        key = (kind, signal, t0, t1, tuple(sorted(params.items())))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                fut: Future = Future()
+                fut.set_result(cached)
+                return fut
+            gen = self._generation
+            fut = self._threads.submit(self._run, key, gen, kind, signal, t0, t1, params)
+            self._queued = [f for f in self._queued if not f.done()] + [fut]
+        return fut
+
+    def cancel_all(self) -> None:
+        """Görünüm değişti: kuyruktakileri iptal et, çalışanların sonucu atılsın."""
+        with self._lock:
+            self._generation += 1
+            for f in self._queued:
+                f.cancel()
+            self._queued = []
+
+    def close(self) -> None:
+        self.cancel_all()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, key: Tuple, gen: int, kind: str, signal: str, t0: float, t1: float,
+             params: Dict[str, Any]) -> AnalysisResult:
+        span = self._history.span(signal)
+        w = self._history.query_sliced(signal, t0, t1, MAX_PULL)
+        t, v = w.t, w.vmean
+        if gen != self._generation:
+            raise CancelledError()
+
+        if len(t) >= HEAVY_SAMPLES and self._n_processes > 0:
+            x, series = self._process_pool().submit(compute, kind, t, v, params).result()
+        else:
+            x, series = compute(kind, t, v, params)
+
+        result = AnalysisResult(kind=kind, signal=signal, t0=t0, t1=t1, x=x, series=series,
+                                n_samples=len(t), level=w.level)
+        if span is None or t1 > span[1]:
+            return result       # pencere henüz dolmadı; sonraki istek yeniden hesaplar
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(
+                    max_workers=self._n_processes, mp_context=multiprocessing.get_context("spawn"))
+            return self._processes
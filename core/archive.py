@@ -0,0 +1,271 @@
+"""
+Session Archive — sıkıştırılmış, kolon bazlı, chunk indeksli arşiv formatı.
+
+Ham session log (sabit 18 byte/kayıt) yüzlerce sinyalde hızla büyür; arşiv
+etkinlikte diske / USB'ye taşımak için kompakt formattır.
+
+Dosya düzeni:
+    magic(8s) header_len(I) header(JSON, utf-8)
+    chunk*:  count(I) t_first(d) v_first(q) ts_code(b) val_code(b) zlib(ts + values)
+    index:   INDEX_DTYPE kayıtları — chunk başına sinyal, zaman aralığı, offset
+    laps:    LAP_DTYPE kayıtları
+    footer:  index_offset(Q) n_index(Q) n_laps(Q) magic(8s)
+
+Her chunk tek bir sinyalin en fazla `chunk_s` saniyelik bölümüdür ve bağımsız
+sıkıştırılır:
+  - zaman: t_first'e göre TS_RESOLUTION (1 µs) adımlı tamsayı, delta-of-delta
+    (sabit örnekleme → çoğu sıfır)
+  - değer: SignalDef.resolution varsa (v - min) / resolution tamsayısının
+    deltası; yoksa float64, byte-shuffle edilmiş (kayıpsız)
+Tamsayı diziler sığdıkları en dar tipte (i1..i8) saklanır.
+
+Okuyucu sadece footer'daki indeksi okur; bir sinyalin bir zaman aralığı için
+yalnızca o aralıkla kesişen chunk'lar açılır.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import time
+import zlib
+from dataclasses import asdict
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.session_log import DEFAULT_CHUNK_RECORDS, LAP_MARKER, SessionReader, split_by_signal
+from core.signals_def import SignalDef
+
+MAGIC = b"FSTARC1\0"
+FOOTER_MAGIC = b"FSTIDX1\0"
+_PREFIX = struct.Struct("<8sI")
+_CHUNK = struct.Struct("<Idqbb")
+_FOOTER = struct.Struct("<QQQ8s")
+
+INDEX_DTYPE = np.dtype([
+    ("sig", "<u2"), ("t_start", "<f8"), ("t_end", "<f8"),
+    ("offset", "<u8"), ("length", "<u4"), ("count", "<u4"),
+])
+LAP_DTYPE = np.dtype([("ts", "<f8"), ("lap", "<i8")])
+
+TS_RESOLUTION = 1e-6          # saniye
+DEFAULT_CHUNK_S = 10.0
+_INT_TYPES = (np.dtype("<i1"), np.dtype("<i2"), np.dtype("<i4"), np.dtype("<i8"))
+_RAW_FLOAT = -1               # val_code: nicemlenmemiş float64
+
+Series = Tuple[np.ndarray, np.ndarray]
+
+
+# ── Encoding ────────────────────────────────────────────────
+def _narrow(a: np.ndarray) -> Tuple[int, np.ndarray]:
+    lo, hi = int(a.min()), int(a.max())
+    for code, dt in enumerate(_INT_TYPES[:-1]):
+        info = np.iinfo(dt)
+        if info.min <= lo and hi <= info.max:
+            return code, a.astype(dt)
+    return len(_INT_TYPES) - 1, a.astype(_INT_TYPES[-1])
+
+
+def _encode(ts: np.ndarray, vs: np.ndarray, d: SignalDef, level: int) -> bytes:
+    ticks = np.rint((ts - ts[0]) / TS_RESOLUTION).astype(np.int64)
+    dd = np.diff(np.diff(ticks, prepend=0), prepend=0)
+    ts_code, ts_arr = _narrow(dd)
+
+    if d.resolution is not None and np.isfinite(vs).all():
+        q = np.rint((vs - d.min) / d.resolution).astype(np.int64)
+        v_first = int(q[0])
+        val_code, val_arr = _narrow(np.diff(q, prepend=q[0]))
+        val_bytes = val_arr.tobytes()
+    else:
+        v_first = 0
+        val_code = _RAW_FLOAT
+        # Byte-shuffle: aynı anlamlı byte'lar yan yana → zlib çok daha iyi sıkıştırır
+        val_bytes = np.ascontiguousarray(vs, dtype="<f8").view(np.uint8).reshape(-1, 8).T.tobytes()
+
+    payload = zlib.compress(ts_arr.tobytes() + val_bytes, level)
+    return _CHUNK.pack(len(ts), float(ts[0]), v_first, ts_code, val_code) + payload
+
+
+def _decode(blob: bytes, d: SignalDef) -> Series:
+    count, t_first, v_first, ts_code, val_code = _CHUNK.unpack_from(blob)
+    raw = zlib.decompress(blob[_CHUNK.size:])
+    ts_dt = _INT_TYPES[ts_code]
+    split = count * ts_dt.itemsize
+
+    dd = np.frombuffer(raw, dtype=ts_dt, count=count).astype(np.int64)
+    ts = t_first + np.cumsum(np.cumsum(dd)) * TS_RESOLUTION
+
+    if val_code == _RAW_FLOAT:
+        shuffled = np.frombuffer(raw, dtype=np.uint8, offset=split).reshape(8, count)
+        vs = shuffled.T.copy().view("<f8").ravel()
+    else:
+        deltas = np.frombuffer(raw, dtype=_INT_TYPES[val_code], offset=split, count=count)
+        vs = d.min + (v_first + np.cumsum(deltas, dtype=np.int64)) * d.resolution
+    return ts, vs
+
+
+# ── Writer ──────────────────────────────────────────────────
+class ArchiveWriter:
+    """Sinyal başına zaman sıralı bloklar al, `chunk_s`'lik chunk'lar halinde yaz."""
+
+    def __init__(self, path: str | Path, defs: Sequence[SignalDef], chunk_s: float = DEFAULT_CHUNK_S,
+                 created: float | None = None, t0: float | None = None, level: int = 6):
+        if chunk_s <= 0:
+            raise ValueError("chunk_s must be > 0")
+        self._path = Path(path)
+        self._defs = list(defs)
+        self._chunk_s = chunk_s
+        self._level = level
+        empty: Series = (np.empty(0), np.empty(0))
+        self._pending: List[Series] = [empty] * len(self._defs)
+        self._index: List[Tuple[int, float, float, int, int, int]] = []
+        self._laps: List[Tuple[float, int]] = []
+
+        header = json.dumps({
+            "version": 1,
+            "created": time.time() if created is None else created,
+            "t0": time.monotonic() if t0 is None else t0,
+            "chunk_s": chunk_s,
+            "ts_resolution": TS_RESOLUTION,
+            "signals": [asdict(d) for d in self._defs],
+        }).encode("utf-8")
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[BinaryIO] = self._path.open("wb")
+        self._file.write(_PREFIX.pack(MAGIC, len(header)))
+        self._file.write(header)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def append(self, sig: int, ts: np.ndarray, values: np.ndarray) -> None:
+        """`sig` indeksli sinyale zaman sıralı örnekler ekle; dolan chunk'lar yazılır."""
+        if len(ts) == 0:
+            return
+        pts, pvs = self._pending[sig]
+        if len(pts):
+            ts = np.concatenate([pts, ts])
+            values = np.concatenate([pvs, values])
+        while ts[-1] - ts[0] >= self._chunk_s:
+            cut = int(np.searchsorted(ts, ts[0] + self._chunk_s))
+            self._write_chunk(sig, ts[:cut], values[:cut])
+            ts, values = ts[cut:], values[cut:]
+        self._pending[sig] = (ts, values)
+
+    def mark_lap(self, ts: float, lap_number: int) -> None:
+        self._laps.append((ts, lap_number))
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        for sig, (ts, vs) in enumerate(self._pending):
+            if len(ts):
+                self._write_chunk(sig, ts, vs)
+        index = np.array(self._index, dtype=INDEX_DTYPE)
+        laps = np.array(self._laps, dtype=LAP_DTYPE)
+        offset = self._file.tell()
+        self._file.write(index.tobytes())
+        self._file.write(laps.tobytes())
+        self._file.write(_FOOTER.pack(offset, len(index), len(laps), FOOTER_MAGIC))
+        self._file.close()
+        self._file = None
+
+    def _write_chunk(self, sig: int, ts: np.ndarray, vs: np.ndarray) -> None:
+        blob = _encode(ts, vs, self._defs[sig], self._level)
+        offset = self._file.tell()
+        self._file.write(blob)
+        self._index.append((sig, float(ts[0]), float(ts[-1]), offset, len(blob), len(ts)))
+
+
+# ── Reader ──────────────────────────────────────────────────
+class ArchiveReader:
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        if not self._path.exists():
+            raise FileNotFoundError(f"archive not found: {self._path}")
+
+        with self._path.open("rb") as f:
+            prefix = f.read(_PREFIX.size)
+            if len(prefix) < _PREFIX.size:
+                raise ValueError(f"{self._path} is not a session archive")
+            magic, header_len = _PREFIX.unpack(prefix)
+            if magic != MAGIC:
+                raise ValueError(f"{self._path} is not a session archive")
+            header = json.loads(f.read(header_len).decode("utf-8"))
+
+            f.seek(-_FOOTER.size, 2)
+            offset, n_index, n_laps, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+            if magic != FOOTER_MAGIC:
+                raise ValueError(f"{self._path} has no index footer (incomplete archive?)")
+            f.seek(offset)
+            self.index: np.ndarray = np.fromfile(f, dtype=INDEX_DTYPE, count=n_index)
+            self._laps: np.ndarray = np.fromfile(f, dtype=LAP_DTYPE, count=n_laps)
+
+        self.created: float = header["created"]
+        self.t0: float = header["t0"]
+        self.chunk_s: float = header["chunk_s"]
+        self.defs: List[SignalDef] = [
+            SignalDef(**{**s, "sources": tuple(s.get("sources", ()))}) for s in header["signals"]
+        ]
+        self._by_name = {d.name: i for i, d in enumerate(self.defs)}
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def chunks(self, name: str, t0: float = -np.inf, t1: float = np.inf) -> np.ndarray:
+        """[t0, t1] ile kesişen chunk'ların indeks kayıtları (zaman sıralı)."""
+        if name not in self._by_name:
+            raise KeyError(f"unknown signal '{name}'")
+        ix = self.index
+        rows = ix[(ix["sig"] == self._by_name[name]) & (ix["t_end"] >= t0) & (ix["t_start"] <= t1)]
+        return rows[np.argsort(rows["t_start"], kind="stable")]
+
+    def read(self, name: str, t0: float = -np.inf, t1: float = np.inf) -> Series:
+        """Tek sinyalin [t0, t1] aralığı — sadece gereken chunk'lar açılır."""
+        rows = self.chunks(name, t0, t1)
+        d = self.defs[self._by_name[name]]
+        parts: List[Series] = []
+        with self._path.open("rb") as f:
+            for row in rows:
+                f.seek(int(row["offset"]))
+                parts.append(_decode(f.read(int(row["length"])), d))
+        if not parts:
+            return np.empty(0), np.empty(0)
+        ts = np.concatenate([p[0] for p in parts])
+        vs = np.concatenate([p[1] for p in parts])
+        keep = (ts >= t0) & (ts <= t1)
+        return ts[keep], vs[keep]
+
+    def lap_markers(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Tur bitiş zamanları ve tur numaraları."""
+        return self._laps["ts"].copy(), self._laps["lap"].copy()
+
+    def time_range(self) -> Optional[Tuple[float, float]]:
+        if len(self.index) == 0:
+            return None
+        return float(self.index["t_start"].min()), float(self.index["t_end"].max())
+
+
+def archive_session(
+    log_path: str | Path,
+    out_path: str | Path,
+    chunk_s: float = DEFAULT_CHUNK_S,
+    chunk_records: int = DEFAULT_CHUNK_RECORDS,
+) -> Path:
+    """Ham session log'u arşive dönüştür; bellek kullanımı chunk boyutuyla sınırlı."""
+    reader = SessionReader(log_path)
+    n = len(reader.defs)
+    writer = ArchiveWriter(out_path, reader.defs, chunk_s, created=reader.created, t0=reader.t0)
+    try:
+        for chunk in reader.iter_chunks(chunk_records):
+            for sig, (ts, vs) in enumerate(split_by_signal(chunk, n)):
+                writer.append(sig, ts, vs)
+            for m in chunk[chunk["sig"] == LAP_MARKER]:
+                writer.mark_lap(float(m["ts"]), int(m["value"]))
+    finally:
+        writer.close()
+    return writer.path
@@ -0,0 +1,313 @@
+"""
+Triggered capture — osiloskop gibi tetiklemeli tam çözünürlüklü kayıt.
+
+Her SignalStore güncellemesi iki iş yapar (store listener'ı, producer thread'i):
+  1. Örnek başta ayrılmış bir ring buffer'a yazılır (sinyal, ts, değer). Ring
+     kilitsizdir: slot `itertools.count` sıra numarasıyla seçilir, slotun sıra
+     numarası en son yazılır → okuyucu üzerine yazılan slotu atlar (events.py
+     ile aynı seqlock fikri).
+  2. O sinyale bağlı tetikler değerlendirilir; tetiği olmayan sinyal için tek
+     bir dict okuması.
+
+Tetik türleri:
+  - above / below:   seviye aşıldı; `hold_s` boyunca sürmesi gerekir (40 ms'lik dip)
+  - rising / falling: seviyeyi yukarı / aşağı kesen kenar
+  - rate:            |dv/dt| > seviye (birim/s)
+
+Tetiklenince sadece (tetik, an) kuyruğa eklenir. Worker thread `post_s`
+dolunca ring'den [an - pre_s, an + post_s] penceresini kopyalar ve dondurulmuş
+bir Capture üretir; istenirse .npz olarak diske yazar. Aynı tetik
+max(`post_s`, `rearm_s`) boyunca (holdoff) ve seviye tetiklerinde koşul bitene
+kadar tekrar tetiklenmez; gürültülü sinyal capture listesini doldurmaz.
+
+Config reload'da sinyal indeksleri sadece eklenir (ring'deki eski örnekler
+doğru sinyale bağlı kalır); çıkarılan sinyal yeni capture'lara girmez.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.lod import LODWindow
+from core.signals_def import SignalDef, SignalDefDiff
+from core.trigger_def import TRIGGER_KINDS, TriggerDef
+
+DEFAULT_RING = 1 << 20          # ~26 MB; bus hızında pre+post penceresini tutmalı
+DEFAULT_MAX_CAPTURES = 100
+
+
+@dataclass(frozen=True, slots=True)
+class Capture:
+    id: int
+    trigger: TriggerDef
+    ts: float                       # tetik anı (monotonic)
+    value: float                    # tetikleyen örneğin değeri
+    created: float                  # wall clock
+    data: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    truncated: bool                 # ring pre_s'yi kapsamıyordu
+
+    @property
+    def t0(self) -> float:
+        return self.ts - self.trigger.pre_s
+
+    @property
+    def t1(self) -> float:
+        return self.ts + self.trigger.post_s
+
+    @property
+    def signals(self) -> List[str]:
+        return list(self.data)
+
+    def query(self, name: str, t0: float, t1: float, max_points: int) -> LODWindow:
+        """SignalHistory.query ile aynı imza → LanePlot capture'ı doğrudan çizer."""
+        t, v = self.data.get(name, (np.empty(0), np.empty(0)))
+        lo, hi = np.searchsorted(t, [t0, t1])
+        v = v[lo:hi]
+        return LODWindow(t=t[lo:hi], vmin=v, vmax=v, vmean=v, level=0)
+
+    def describe(self) -> str:
+        tr = self.trigger
+        return f"#{self.id} {tr.name}: {tr.signal} {tr.kind} {tr.level:g} ({self.value:g})"
+
+
+CaptureListener = Callable[[Capture], None]
+
+
+class _TriggerState:
+    __slots__ = ("d", "prev_v", "prev_t", "since", "armed", "holdoff")
+
+    def __init__(self, d: TriggerDef):
+        self.d = d
+        self.prev_v: Optional[float] = None
+        self.prev_t: Optional[float] = None
+        self.since: Optional[float] = None    # koşulun başladığı an
+        self.armed = True
+        self.holdoff = -np.inf
+
+    def feed(self, v: float, t: float) -> bool:
+        d = self.d
+        kind = d.kind
+        pv, pt = self.prev_v, self.prev_t
+        self.prev_v, self.prev_t = v, t
+
+        if kind == "above":
+            cond = v > d.level
+        elif kind == "below":
+            cond = v < d.level
+        elif kind == "rising":
+            return pv is not None and pv <= d.level < v and self._fire(t)
+        elif kind == "falling":
+            return pv is not None and pv >= d.level > v and self._fire(t)
+        else:
+            cond = pt is not None and t > pt and abs(v - pv) / (t - pt) > d.level
+
+        if not cond:
+            self.since = None
+            self.armed = True
+            return False
+        if self.since is None:
+            self.since = t
+        if self.armed and t - self.since >= d.hold_s and self._fire(t):
+            self.armed = False          # koşul bitene kadar tekrar yok
+            return True
+        return False
+
+    def _fire(self, t: float) -> bool:
+        if t < self.holdoff:
+            return False
+        self.holdoff = t + max(self.d.post_s, self.d.rearm_s)
+        return True
+
+
+class SampleRing:
+    """Tüm sinyallerin son `capacity` örneği, kilitsiz çok üreticili ring."""
+
+    def __init__(self, capacity: int = DEFAULT_RING):
+        if capacity < 2 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two >= 2")
+        self._mask = capacity - 1
+        self._sig = np.zeros(capacity, dtype=np.uint16)
+        self._ts = np.zeros(capacity)
+        self._v = np.zeros(capacity)
+        self._seq = np.full(capacity, -1, dtype=np.int64)
+        # Sıcak yol memoryview üzerinden yazar (NumPy skaler indekslemesinden ucuz)
+        self._msig = memoryview(self._sig)
+        self._mts = memoryview(self._ts)
+        self._mv = memoryview(self._v)
+        self._mseq = memoryview(self._seq)
+        self._counter = itertools.count()
+
+    @property
+    def capacity(self) -> int:
+        return self._mask + 1
+
+    def push(self, sig: int, v: float, t: float) -> None:
+        seq = next(self._counter)
+        slot = seq & self._mask
+        self._mseq[slot] = -1                 # yazılıyor
+        self._msig[slot] = sig
+        self._mts[slot] = t
+        self._mv[slot] = v
+        self._mseq[slot] = seq                # yayınla
+
+    def window(self, t0: float, t1: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """[t0, t1] örnekleri (sig, ts, v; zaman sıralı) ve ring'deki en eski zaman."""
+        seq = self._seq.copy()
+        sig, ts, v = self._sig.copy(), self._ts.copy(), self._v.copy()
+        # Kopyalama sırasında üzerine yazılan slotlar atılır
+        valid = (seq >= 0) & (seq == self._seq)
+        oldest = float(ts[valid].min()) if valid.any() else np.inf
+        sel = valid & (ts >= t0) & (ts <= t1)
+        order = np.argsort(ts[sel], kind="stable")
+        return sig[sel][order], ts[sel][order], v[sel][order], oldest
+
+
+class CaptureManager:
+    def __init__(self, defs: Dict[str, SignalDef], triggers: Sequence[TriggerDef] = (),
+                 ring_capacity: int = DEFAULT_RING, max_captures: int = DEFAULT_MAX_CAPTURES,
+                 save_dir: str | Path | None = None):
+        self._names = list(defs)                                      # aktif sinyaller
+        self._index = {n: i for i, n in enumerate(self._names)}      # emekliler dahil
+        self._ring = SampleRing(ring_capacity)
+        self._by_signal: Dict[str, Tuple[_TriggerState, ...]] = {}
+        self._captures: Deque[Capture] = deque(maxlen=max_captures)
+        self._ids = itertools.count(1)
+        self._pending: Deque[Tuple[_TriggerState, float, float]] = deque()
+        self._listeners: Tuple[CaptureListener, ...] = ()
+        self._save_dir = Path(save_dir) if save_dir else None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.set_triggers(triggers)
+
+    @property
+    def max_captures(self) -> int:
+        return self._captures.maxlen
+
+    @property
+    def triggers(self) -> List[TriggerDef]:
+        return [s.d for states in self._by_signal.values() for s in states]
+
+    def set_triggers(self, triggers: Sequence[TriggerDef]) -> None:
+        by_signal: Dict[str, List[_TriggerState]] = {}
+        for d in triggers:
+            if d.kind not in TRIGGER_KINDS:
+                raise ValueError(f"Unknown trigger kind '{d.kind}', expected one of {TRIGGER_KINDS}")
+            by_signal.setdefault(d.signal, []).append(_TriggerState(d))
+        # Copy-on-write: update() kilitsiz okur
+        self._by_signal = {s: tuple(states) for s, states in by_signal.items()}
+
+    def apply_defs(self, defs: Dict[str, SignalDef], diff: SignalDefDiff | None = None) -> None:
+        """SignalStore defs listener'ı: yeni sinyallere ring indeksi aç."""
+        index = dict(self._index)
+        for n in defs:
+            index.setdefault(n, len(index))
+        self._index = index
+        self._names = list(defs)
+
+    def add_listener(self, fn: CaptureListener) -> None:
+        """Yeni capture hazır olunca worker thread'inde çağrılır."""
+        self._listeners = self._listeners + (fn,)
+
+    def remove_listener(self, fn: CaptureListener) -> None:
+        self._listeners = tuple(l for l in self._listeners if l is not fn)
+
+    def captures(self) -> List[Capture]:
+        return list(self._captures)
+
+    def clear(self) -> None:
+        self._captures.clear()
+
+    # ── Sıcak yol (store listener) ──────────────────────────
+    def on_update(self, name: str, value: float, ts: float) -> None:
+        self._ring.push(self._index[name], value, ts)
+        states = self._by_signal.get(name)
+        if states:
+            for st in states:
+                if st.feed(value, ts):
+                    self._pending.append((st, ts, value))
+                    self._wake.set()
+
+    # ── Worker ──────────────────────────────────────────────
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="capture", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if not self._pending:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            st, ts, value = self._pending[0]
+            # post penceresi dolana kadar bekle (ts store saatinde → monotonic)
+            wait = ts + st.d.post_s - time.monotonic()
+            if wait > 0 and self._stop.wait(wait):
+                break
+            self._pending.popleft()
+            self._freeze(st.d, ts, value)
+
+    def _freeze(self, d: TriggerDef, ts: float, value: float) -> None:
+        t0, t1 = ts - d.pre_s, ts + d.post_s
+        sig, t, v, oldest = self._ring.window(t0, t1)
+        wanted = d.signals or self._names
+        data = {}
+        for name in wanted:
+            mask = sig == self._index[name]
+            data[name] = (t[mask], v[mask])
+        cap = Capture(id=next(self._ids), trigger=d, ts=ts, value=value, created=time.time(),
+                      data=data, truncated=oldest > t0)
+        self._captures.append(cap)
+        if self._save_dir is not None:
+            try:
+                save_capture(cap, self._save_dir)
+            except OSError as e:
+                print(f"Capture save failed: {e}")
+        for fn in self._listeners:
+            fn(cap)
+
+
+def save_capture(cap: Capture, directory: str | Path) -> Path:
+    """Capture'ı `capture_<id>_<tetik>.npz` olarak yaz (zamanlar tetik anına göre)."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"capture_{cap.id:04d}_{cap.trigger.name}.npz"
+    arrays = {}
+    for name, (t, v) in cap.data.items():
+        arrays[f"t/{name}"] = t - cap.ts
+        arrays[f"v/{name}"] = v
+    meta = {"id": cap.id, "trigger": asdict(cap.trigger), "value": cap.value,
+            "created": cap.created, "truncated": cap.truncated}
+    np.savez_compressed(path, meta=np.array(json.dumps(meta)), **arrays)
+    return path
+
+
+def load_capture(path: str | Path) -> Capture:
+    """save_capture çıktısını oku; tetik anı 0 kabul edilir."""
+    with np.load(path) as z:
+        meta = json.loads(str(z["meta"]))
+        raw = meta["trigger"]
+        trigger = TriggerDef(**{**raw, "signals": tuple(raw["signals"])})
+        data = {key[2:]: (z[key], z["v/" + key[2:]]) for key in z.files if key.startswith("t/")}
+    return Capture(id=meta["id"], trigger=trigger, ts=0.0, value=meta["value"],
+                   created=meta["created"], data=data, truncated=meta["truncated"])
@@ -0,0 +1,195 @@
+"""
+Checkpoint — çökme / yeniden başlatma sonrası oturuma kaldığı yerden devam.
+
+Belirli aralıklarla LapTimer durumu ve SignalHistory'nin son `window_s`
+saniyelik ham örnekleri tek bir küçük binary dosyaya yazılır:
+
+    magic(8s) header_len(I) header(JSON, utf-8)
+    sinyal başına SAMPLE_DTYPE kayıtları (header'daki sırayla ve sayıda)
+
+Zamanlar checkpoint anına göre (≤ 0) saklanır; monotonic saat yeniden
+başlatmada sıfırlanacağı için geri yüklerken aradaki kesinti (wall clock
+farkı) hesaba katılarak yeni saate taşınır.
+
+Yazma atomiktir: geçici dosyaya yazılır, fsync, sonra os.replace. Yazma işi
+ayrı bir thread'de yapılır; UI ve acquisition thread'leri beklemez.
+
+Okunamayan checkpoint (bozuk / yarım dosya, başka format veya sürüm) uyarıyla
+yok sayılır; uygulama checkpoint'siz başlar. Geri yüklemede geçmiş sinyal başına
+tek `SignalHistory.extend` çağrısıyla toplu yazılır.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from core.lap_timer import LapTimer, LapTimerState
+from core.lod import SignalHistory
+
+MAGIC = b"FSTCKP1\0"
+VERSION = 1
+_PREFIX = struct.Struct("<8sI")
+
+SAMPLE_DTYPE = np.dtype([("t", "<f4"), ("v", "<f4")])   # t: checkpoint anına göre saniye
+DEFAULT_INTERVAL_S = 5.0
+DEFAULT_WINDOW_S = 60.0
+DEFAULT_MAX_AGE_S = 1800.0   # daha eski checkpoint başka bir oturumdur
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    saved_at: float                          # wall clock (time.time())
+    lap: Optional[LapTimerState]
+    history: Dict[str, Tuple[np.ndarray, np.ndarray]]   # (göreli t ≤ 0, değer)
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.saved_at)
+
+
+def write_checkpoint(path: str | Path, lap_timer: LapTimer | None = None,
+                     history: SignalHistory | None = None,
+                     window_s: float = DEFAULT_WINDOW_S) -> None:
+    """Anlık durumu atomik olarak `path`'e yaz."""
+    path = Path(path)
+    now = time.monotonic()
+    saved_at = time.time()
+
+    lap = lap_timer.state() if lap_timer else None
+    arrays = []
+    counts = []
+    if history is not None:
+        for name in history.names:
+            t, v = history.raw(name, now - window_s)
+            rec = np.empty(len(t), dtype=SAMPLE_DTYPE)
+            rec["t"] = t - now
+            rec["v"] = v
+            arrays.append(rec)
+            counts.append([name, len(rec)])
+
+    header = json.dumps({
+        "version": VERSION,
+        "saved_at": saved_at,
+        "lap": asdict(lap) if lap else None,
+        "signals": counts,
+    }).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(_PREFIX.pack(MAGIC, len(header)))
+        f.write(header)
+        for rec in arrays:
+            f.write(rec.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str | Path, max_age_s: float | None = None) -> Optional[Checkpoint]:
+    """Checkpoint'i oku; yoksa, `max_age_s`'den eskiyse veya okunamıyorsa None."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        return _parse(path.read_bytes(), max_age_s)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError, struct.error) as e:
+        # Yarım yazılmış / bozuk / eski formatlı dosya başlatmayı engellemesin
+        print(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+
+
+def _parse(data: bytes, max_age_s: float | None) -> Optional[Checkpoint]:
+    if len(data) < _PREFIX.size:
+        raise ValueError("not a checkpoint")
+    magic, header_len = _PREFIX.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a checkpoint")
+    header = json.loads(data[_PREFIX.size:_PREFIX.size + header_len].decode("utf-8"))
+    if header.get("version") != VERSION:
+        raise ValueError(f"unsupported version {header.get('version')!r}")
+
+    if max_age_s is not None and time.time() - header["saved_at"] > max_age_s:
+        return None
+
+    lap = None
+    if header["lap"] is not None:
+        raw = header["lap"]
+        lap = LapTimerState(**{**raw, "laps": tuple(raw["laps"])})
+
+    history: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    offset = _PREFIX.size + header_len
+    for name, count in header["signals"]:
+        rec = np.frombuffer(data, dtype=SAMPLE_DTYPE, count=count, offset=offset)
+        offset += rec.nbytes
+        history[name] = (rec["t"].astype(np.float64), rec["v"].astype(np.float64))
+    return Checkpoint(saved_at=header["saved_at"], lap=lap, history=history)
+
+
+def restore_checkpoint(cp: Checkpoint, lap_timer: LapTimer | None = None,
+                       history: SignalHistory | None = None) -> None:
+    """Checkpoint'i canlı nesnelere uygula; kesinti süresi kadar ileri kaydırılır."""
+    downtime = cp.age
+    if lap_timer is not None and cp.lap is not None:
+        lap_timer.restore(cp.lap, downtime)
+    if history is not None:
+        # Checkpoint anı yeni monotonic saatte: şimdi - kesinti
+        base = time.monotonic() - downtime
+        known = set(history.names)
+        for name, (t, v) in cp.history.items():
+            if name in known:
+                history.extend(name, t + base, v)
+
+
+class Checkpointer:
+    """`interval` saniyede bir checkpoint yazan arka plan thread'i."""
+
+    def __init__(self, path: str | Path, lap_timer: LapTimer | None = None,
+                 history: SignalHistory | None = None,
+                 interval: float = DEFAULT_INTERVAL_S, window_s: float = DEFAULT_WINDOW_S):
+        self._path = Path(path)
+        self._lap_timer = lap_timer
+        self._history = history
+        self._interval = interval
+        self._window_s = window_s
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="checkpointer", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Thread'i durdur ve son durumu yaz."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._write()
+
+    def _write(self) -> None:
+        try:
+            write_checkpoint(self._path, self._lap_timer, self._history, self._window_s)
+        except OSError as e:
+            print(f"Checkpoint write failed: {e}")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._write()
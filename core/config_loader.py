@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 import yaml
 
+from core.layout_def import PIT_MODES, SLOTS, DashboardLayout, DriverLayout, PitLayout, WidgetDef
 from core.signals_def import SignalDef
+from core.trigger_def import TRIGGER_KINDS, TriggerDef
 
 
 def load_signal_defs(yaml_path: str | Path) -> Dict[str, SignalDef]:
@@ -49,6 +51,16 @@ def load_signal_defs(yaml_path: str | Path) -> Dict[str, SignalDef]:
 
         description = str(cfg.get("description", "")).strip()
 
+        sources = cfg.get("sources", [])
+        if isinstance(sources, str):
+            sources = [sources]
+        if not isinstance(sources, list) or not all(isinstance(s, str) and s for s in sources):
+            raise ValueError(f"Signal '{name}' sources must be a list of source names")
+
+        resolution = _opt_float(cfg, "resolution", f"Signal '{name}'")
+        if resolution is not None and resolution <= 0:
+            raise ValueError(f"Signal '{name}' resolution must be > 0")
+
         defs[name] = SignalDef(
             name=name,
             unit=unit,
@@ -56,6 +68,169 @@ def load_signal_defs(yaml_path: str | Path) -> Dict[str, SignalDef]:
             max=vmax,
             stale_after_s=stale_after_s,
             description=description,
+            sources=tuple(sources),
+            resolution=resolution,
         )
 
     return defs
+
+
+def _known_signal(name: Any, defs: Dict[str, SignalDef], where: str) -> str:
+    if not isinstance(name, str) or name not in defs:
+        raise ValueError(f"{where}: unknown signal '{name}'")
+    return name
+
+
+def _opt_float(cfg: Dict[str, Any], key: str, where: str) -> float | None:
+    if cfg.get(key) is None:
+        return None
+    try:
+        return float(cfg[key])
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{where}: '{key}' must be numeric") from e
+
+
+def load_dashboard_layout(yaml_path: str | Path, defs: Dict[str, SignalDef]) -> DashboardLayout:
+    path = Path(yaml_path)
+    if not path.exists():
+        raise FileNotFoundError(f"dashboard layout not found: {path}")
+
+    with path.open("r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+
+    if not isinstance(raw, dict) or "driver" not in raw:
+        raise ValueError("Layout YAML must be a mapping with a top-level 'driver:' key")
+
+    drv = raw["driver"]
+    if not isinstance(drv, dict):
+        raise ValueError("'driver' must be a mapping")
+
+    critical = tuple(_known_signal(s, defs, "driver.critical") for s in drv.get("critical", []))
+
+    bar = drv.get("rpm_bar") or {}
+    rpm_signal = _known_signal(bar.get("signal", "rpm"), defs, "driver.rpm_bar")
+    rpm_max = _opt_float(bar, "max", "driver.rpm_bar") or defs[rpm_signal].max
+    rpm_redline = _opt_float(bar, "redline", "driver.rpm_bar") or rpm_max
+
+    widgets = []
+    for i, w in enumerate(drv.get("widgets", [])):
+        where = f"driver.widgets[{i}]"
+        if not isinstance(w, dict):
+            raise ValueError(f"{where} must be a mapping")
+        signal = _known_signal(w.get("signal"), defs, where)
+        slot = w.get("slot", "bottom")
+        if slot not in SLOTS:
+            raise ValueError(f"{where}: slot must be one of {SLOTS}")
+        fmt = str(w.get("format", "{:.1f}"))
+        if fmt != "gear" and "{" not in fmt:
+            raise ValueError(f"{where}: format must be 'gear' or a str.format pattern")
+
+        widgets.append(WidgetDef(
+            signal=signal,
+            slot=slot,
+            format=fmt,
+            stale_text=str(w.get("stale_text", "–")),
+            unit=str(w.get("unit", "")),
+            font_size=int(w.get("font_size", 32)),
+            weight=int(w.get("weight", 500)),
+            color=str(w.get("color", "#AAAAAA")),
+            warn_above=_opt_float(w, "warn_above", where),
+            warn_below=_opt_float(w, "warn_below", where),
+            warn_color=str(w.get("warn_color", "#CC1100")),
+        ))
+
+    frame_rate = drv.get("frame_rate", "off")
+    # YAML 1.1: tırnaksız `off` False olarak gelir
+    if frame_rate in ("off", None) or frame_rate is False:
+        frame_hz = None
+    elif frame_rate == "display":
+        frame_hz = 0.0
+    else:
+        frame_hz = _opt_float(drv, "frame_rate", "driver")
+        if frame_hz <= 0:
+            raise ValueError("driver.frame_rate must be 'off', 'display' or > 0")
+    interpolate = tuple(_known_signal(s, defs, "driver.interpolate") for s in drv.get("interpolate") or [])
+
+    pit_raw = raw.get("pit") or {}
+    pit_signals = tuple(_known_signal(s, defs, "pit.signals") for s in pit_raw.get("signals") or [])
+    columns = int(pit_raw.get("columns", 3))
+    if columns < 1:
+        raise ValueError("pit.columns must be >= 1")
+    mode = pit_raw.get("mode", "grid")
+    if mode not in PIT_MODES:
+        raise ValueError(f"pit.mode must be one of {PIT_MODES}")
+    lanes = []
+    for i, group in enumerate(pit_raw.get("lanes") or []):
+        members = [group] if isinstance(group, str) else group
+        if not isinstance(members, list) or not members:
+            raise ValueError(f"pit.lanes[{i}] must be a signal name or a non-empty list")
+        lanes.append(tuple(_known_signal(s, defs, f"pit.lanes[{i}]") for s in members))
+
+    return DashboardLayout(
+        driver=DriverLayout(
+            critical=critical,
+            rpm_signal=rpm_signal,
+            rpm_max=rpm_max,
+            rpm_redline=rpm_redline,
+            widgets=tuple(widgets),
+            frame_hz=frame_hz,
+            interpolate=interpolate,
+        ),
+        pit=PitLayout(
+            signals=pit_signals or tuple(defs),
+            columns=columns,
+            mode=mode,
+            lanes=tuple(lanes),
+        ),
+    )
+
+
+def load_triggers(yaml_path: str | Path, defs: Dict[str, SignalDef]) -> Tuple[TriggerDef, ...]:
+    path = Path(yaml_path)
+    if not path.exists():
+        raise FileNotFoundError(f"triggers file not found: {path}")
+
+    with path.open("r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+
+    if not isinstance(raw, dict) or not isinstance(raw.get("triggers"), list):
+        raise ValueError("Trigger YAML must be a mapping with a top-level 'triggers:' list")
+
+    triggers = []
+    names = set()
+    for i, t in enumerate(raw["triggers"]):
+        where = f"triggers[{i}]"
+        if not isinstance(t, dict):
+            raise ValueError(f"{where} must be a mapping")
+        signal = _known_signal(t.get("signal"), defs, where)
+        name = str(t.get("name") or f"{signal}_{t.get('kind')}")
+        if name in names:
+            raise ValueError(f"{where}: duplicate trigger name '{name}'")
+        names.add(name)
+        kind = t.get("kind")
+        if kind not in TRIGGER_KINDS:
+            raise ValueError(f"{where}: kind must be one of {TRIGGER_KINDS}")
+        level = _opt_float(t, "level", where)
+        if level is None:
+            raise ValueError(f"{where}: 'level' is required")
+        hold_s = _opt_float(t, "hold_s", where) or 0.0
+        pre_s = _opt_float(t, "pre_s", where)
+        post_s = _opt_float(t, "post_s", where)
+        rearm_s = _opt_float(t, "rearm_s", where) or 0.0
+        pre_s = 0.5 if pre_s is None else pre_s
+        post_s = 0.5 if post_s is None else post_s
+        if hold_s < 0 or pre_s < 0 or post_s < 0 or rearm_s < 0:
+            raise ValueError(f"{where}: hold_s / pre_s / post_s / rearm_s must be >= 0")
+
+        triggers.append(TriggerDef(
+            name=name,
+            signal=signal,
+            kind=kind,
+            level=level,
+            hold_s=hold_s,
+            pre_s=pre_s,
+            post_s=post_s,
+            rearm_s=rearm_s,
+            signals=tuple(_known_signal(s, defs, where) for s in t.get("signals") or []),
+        ))
+    return tuple(triggers)
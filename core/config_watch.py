@@ -0,0 +1,92 @@
+"""
+Config watcher — signals.yaml değişince tanımları çalışırken yeniden yükler.
+
+Watcher thread'i dosyanın mtime / boyutunu `interval` aralıkla yoklar (ek
+bağımlılık yok; editörlerin atomik rename'i de yakalanır). Değişen damga bir
+yoklama boyunca sabit kalınca (yarım yazılmış dosya okunmasın) dosya
+baştan parse edilir ve SignalStore.apply_defs'e verilir: yeni sinyal slot
+alır, değişen limit / stale_after_s yerinde güncellenir, çıkarılan sinyal
+emekli olur. Acquisition durmaz; değişmeyen sinyallerin geçmişine dokunulmaz.
+
+Hatalı dosya (parse / doğrulama hatası) veya `pinned` bir sinyali çıkaran
+değişiklik reddedilir; çalışan tanımlar aynen kalır. Pinned sinyaller ekran
+yerleşiminin (driver göstergeleri, pit sinyalleri ve şeritleri) ve capture
+tetiklerinin (tetik sinyali ve kaydedilen sinyaller) bağlı olduğu sinyallerdir.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import yaml
+
+from core.config_loader import load_signal_defs
+from core.signal_store import SignalStore
+from core.signals_def import SignalDefDiff
+
+DEFAULT_INTERVAL_S = 1.0
+
+
+class SignalConfigWatcher:
+    def __init__(self, path: str | Path, store: SignalStore, pinned: Iterable[str] = (),
+                 interval: float = DEFAULT_INTERVAL_S):
+        self._path = Path(path)
+        self._store = store
+        self._pinned = frozenset(pinned)
+        self._interval = interval
+        self._stamp = self._stat()
+        self._settling = self._stamp
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> Optional[SignalDefDiff]:
+        """Dosya değiştiyse yeniden yükle ve uygula; uygulanan farkı döndür."""
+        stamp = self._stat()
+        if stamp == self._stamp:
+            return None
+        if stamp != self._settling:
+            self._settling = stamp      # hâlâ yazılıyor olabilir: bir tur bekle
+            return None
+        self._stamp = stamp
+        try:
+            defs = load_signal_defs(self._path)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            print(f"Signal config reload failed, keeping current definitions: {e}")
+            return None
+
+        lost = sorted(self._pinned - defs.keys())
+        if lost:
+            print(f"Signal config reload rejected: {', '.join(lost)} still used by layout/triggers")
+            return None
+        diff = self._store.apply_defs(defs)
+        if diff:
+            print(f"Signal config reloaded: {diff.describe()}")
+        return diff
+
+    # ── Thread ──────────────────────────────────────────────
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="config-watch", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.check()
+
+    def _stat(self) -> Tuple[int, int]:
+        try:
+            st = self._path.stat()
+        except OSError:
+            return (0, 0)      # geçici olarak yok (editör kaydediyor); gelince değişmiş sayılır
+        return (st.st_mtime_ns, st.st_size)
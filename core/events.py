@@ -0,0 +1,190 @@
+"""
+Event Channel — sayısal store'un yanında ayrık, zaman damgalı olaylar.
+
+Tur bitişi, vites değişimi, mod değişimi, fault / DTC gibi olaylar sabit
+kapasiteli, başta ayrılmış bir ring buffer'da tutulur; dolunca en eski olay
+düşer. Her olay tipi için ayrıca bir indeks ring'i (global sıra numaraları)
+vardır → "X tipinin son N olayı" ring'i taramadan cevaplanır.
+
+Üretici tarafı hafif: sıra numarası `itertools.count`'tan alınır (GIL
+altında atomik), slot kilitsiz doldurulur ve en son slotun sıra numarası
+yazılır. Sadece baş göstergeleri küçük bir kilit altında `max` ile ilerler
+(iki üretici araya girerse eski olan yeni başı geri almasın).
+Okuyucu slotun sıra numarası beklenenle eşleşmiyorsa (üzerine yazılmış /
+yazılıyor) o olayı atlar — shm_store'daki seqlock ile aynı fikir.
+
+Subscriber callback'leri `emit`'i çağıran thread'de çalışır; kısa tutulmalı
+(UI için Qt köprüsüyle UI thread'ine taşınır).
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Olay tipleri
+LAP = "lap"
+SHIFT = "shift"
+MODE = "mode"
+FAULT = "fault"
+DTC = "dtc"
+
+# Önem seviyeleri
+INFO = 0
+WARN = 1
+CRITICAL = 2
+
+DEFAULT_CAPACITY = 4096
+DEFAULT_PER_TYPE = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    seq: int          # kanal içinde artan sıra numarası
+    type: str
+    ts: float         # monotonic
+    level: int = INFO
+    code: int = 0     # tur no, vites, DTC kodu ...
+    value: float = 0.0
+    text: str = ""
+
+    def describe(self) -> str:
+        return f"[{self.type}] {self.text}" if self.text else f"[{self.type}] {self.code} {self.value:g}"
+
+
+EventCallback = Callable[[Event], None]
+
+
+class _TypeIndex:
+    __slots__ = ("id", "seqs", "counter", "head")
+
+    def __init__(self, type_id: int, capacity: int):
+        self.id = type_id
+        self.seqs = np.full(capacity, -1, dtype=np.int64)
+        self.counter = itertools.count()
+        self.head = 0          # yazılan eleman sayısı (yaklaşık, okuyucu için)
+
+
+class EventChannel:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, per_type: int = DEFAULT_PER_TYPE):
+        if capacity < 1 or per_type < 1:
+            raise ValueError("capacity and per_type must be >= 1")
+        self._capacity = capacity
+        self._per_type = per_type
+        self._events: List[Optional[Event]] = [None] * capacity
+        self._ts = np.zeros(capacity)
+        self._type = np.zeros(capacity, dtype=np.uint16)
+        self._seq = np.full(capacity, -1, dtype=np.int64)
+        self._counter = itertools.count()
+        self._head = 0
+        self._types: Dict[str, _TypeIndex] = {}
+        self._types_lock = threading.Lock()     # sadece yeni tip kaydında
+        self._head_lock = threading.Lock()      # baş göstergeleri (birkaç karşılaştırma)
+        self._subscribers: Tuple[Tuple[EventCallback, Optional[FrozenSet[str]], int], ...] = ()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """Kanal açıldığından beri yayınlanan olay sayısı."""
+        return self._head
+
+    def subscribe(self, fn: EventCallback, types: Iterable[str] | None = None,
+                  min_level: int = INFO) -> None:
+        wanted = frozenset(types) if types is not None else None
+        self._subscribers = self._subscribers + ((fn, wanted, min_level),)
+
+    def unsubscribe(self, fn: EventCallback) -> None:
+        self._subscribers = tuple(s for s in self._subscribers if s[0] is not fn)
+
+    # ── Producer ────────────────────────────────────────────
+    def emit(self, type: str, code: int = 0, value: float = 0.0, text: str = "",
+             level: int = INFO, ts: float | None = None) -> Event:
+        idx = self._types.get(type) or self._register(type)
+        seq = next(self._counter)
+        ev = Event(seq=seq, type=type, ts=time.monotonic() if ts is None else ts,
+                   level=level, code=code, value=value, text=text)
+
+        slot = seq % self._capacity
+        self._seq[slot] = -1                 # yazılıyor
+        self._events[slot] = ev
+        self._ts[slot] = ev.ts
+        self._type[slot] = idx.id
+        self._seq[slot] = seq                # yayınla
+
+        tseq = next(idx.counter)
+        idx.seqs[tseq % self._per_type] = seq
+        with self._head_lock:
+            if tseq + 1 > idx.head:
+                idx.head = tseq + 1
+            if seq + 1 > self._head:
+                self._head = seq + 1
+
+        for fn, types, min_level in self._subscribers:
+            if level >= min_level and (types is None or type in types):
+                fn(ev)
+        return ev
+
+    def _register(self, type: str) -> _TypeIndex:
+        with self._types_lock:
+            idx = self._types.get(type)
+            if idx is None:
+                idx = _TypeIndex(len(self._types), self._per_type)
+                self._types[type] = idx
+            return idx
+
+    # ── Queries ─────────────────────────────────────────────
+    def _get(self, seq: int) -> Optional[Event]:
+        slot = seq % self._capacity
+        if self._seq[slot] != seq:
+            return None
+        ev = self._events[slot]
+        return ev if ev is not None and ev.seq == seq else None
+
+    def last(self, type: str | None = None, n: int = 10) -> List[Event]:
+        """En yeni `n` olay (eskiden yeniye), isteğe bağlı tip filtresiyle."""
+        out: List[Event] = []
+        if type is None:
+            head = self._head
+            for seq in range(head - 1, max(-1, head - 1 - self._capacity), -1):
+                if len(out) == n:
+                    break
+                ev = self._get(seq)
+                if ev is not None:
+                    out.append(ev)
+        else:
+            idx = self._types.get(type)
+            if idx is None:
+                return out
+            head = idx.head
+            for t in range(head - 1, max(-1, head - 1 - self._per_type), -1):
+                if len(out) == n:
+                    break
+                ev = self._get(int(idx.seqs[t % self._per_type]))
+                if ev is not None:
+                    out.append(ev)
+        out.reverse()
+        return out
+
+    def between(self, t0: float, t1: float, type: str | None = None) -> List[Event]:
+        """[t0, t1] aralığındaki olaylar (zaman sırasıyla)."""
+        mask = (self._seq >= 0) & (self._ts >= t0) & (self._ts <= t1)
+        if type is not None:
+            idx = self._types.get(type)
+            if idx is None:
+                return []
+            mask &= self._type == idx.id
+        seqs = np.sort(self._seq[mask])
+        events = [ev for ev in (self._get(int(s)) for s in seqs) if ev is not None]
+        events.sort(key=lambda e: (e.ts, e.seq))
+        return events
+
+    def types(self) -> List[str]:
+        return list(self._types)
@@ -0,0 +1,168 @@
+"""
+Signal health — sinyal başına veri kalitesi / bus sağlığı sayaçları.
+
+SignalStore her `update()`'te buraya birkaç sayaç yazar:
+
+  - güncelleme sayısı, etkin hız (geliş aralığının EWMA'sı)
+  - jitter histogramı: her aralığın beklenen periyottan (EWMA) göreli sapması
+  - en uzun boşluk, stale episode sayısı (stale_after_s'den uzun boşluklar)
+  - SignalDef min/max dışı değerler (değer yine yazılır)
+  - NaN/inf yüzünden atılan örnekler
+
+Sayaçlar tek bir float64 matristedir (sinyal başına bir satır); böylece
+SharedSignalStore aynı matrisi shared memory'ye koyar ve acquisition ayrı
+process'teyken de UI okuyabilir. Sıcak yol düz bir memoryview üzerinden
+yazar (NumPy skaler indekslemesinden birkaç kat ucuz). Okuma kilitsizdir;
+değerler yaklaşıktır ama sayaçlar sadece artar.
+
+Config reload'da satırlar sadece eklenir: mevcut sinyalin satır indeksi hiç
+değişmez, emekli sinyalin satırı kalır (tekrar eklenirse sıfırlanıp kullanılır).
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from core.signals_def import SignalDef
+
+# Göreli sapma kova sınırları: |dt / periyot - 1|
+JITTER_EDGES = (0.1, 0.25, 0.5, 1.0, 2.0)
+JITTER_LABELS = ("≤10%", "≤25%", "≤50%", "≤100%", "≤200%", ">200%")
+PERIOD_ALPHA = 0.05
+
+# Matris kolonları
+_UPDATES, _LAST_TS, _PERIOD, _MAX_GAP, _STALE, _RANGE, _DROPPED, _JITTER = range(8)
+N_COLUMNS = _JITTER + len(JITTER_EDGES) + 1
+
+
+@dataclass(frozen=True, slots=True)
+class SignalHealth:
+    name: str
+    updates: int
+    rate_hz: Optional[float]        # son aralıkların EWMA'sından
+    jitter: Tuple[int, ...]         # JITTER_LABELS kovaları
+    max_gap_s: float
+    gap_s: Optional[float]          # son örnekten bu yana
+    stale_episodes: int             # süren kopukluk dahil
+    out_of_range: int
+    dropped: int
+
+    @property
+    def jitter_ratio(self) -> float:
+        """Periyottan %25'ten fazla sapan aralıkların oranı."""
+        total = sum(self.jitter)
+        return sum(self.jitter[2:]) / total if total else 0.0
+
+
+class HealthCounters:
+    def __init__(self, defs: Dict[str, SignalDef], buffer=None):
+        """buffer verilirse (shared memory) matris onun üzerinde açılır."""
+        self._names = list(defs)
+        self._index = {n: i for i, n in enumerate(self._names)}     # emekliler dahil
+        self._stale_after = [defs[n].stale_after_s for n in self._names]
+        self._limits = [(defs[n].min, defs[n].max) for n in self._names]
+        self._shared = buffer is not None
+        if buffer is None:
+            buffer = bytearray(self.nbytes(len(self._names)))
+        self._m = np.ndarray((len(self._names), N_COLUMNS), dtype=np.float64, buffer=buffer)
+        self._flat = memoryview(buffer).cast("B").cast("d")
+
+    @staticmethod
+    def nbytes(n_signals: int) -> int:
+        return n_signals * N_COLUMNS * 8
+
+    def record(self, name: str, v: float, t: float) -> None:
+        i = self._index[name]
+        m = self._flat
+        b = i * N_COLUMNS
+        lo, hi = self._limits[i]
+        if v < lo or v > hi:
+            m[b + _RANGE] += 1
+
+        n = m[b + _UPDATES]
+        m[b + _UPDATES] = n + 1
+        if n:
+            dt = t - m[b + _LAST_TS]
+            if dt > m[b + _MAX_GAP]:
+                m[b + _MAX_GAP] = dt
+            if dt > self._stale_after[i]:
+                m[b + _STALE] += 1
+            period = m[b + _PERIOD]
+            if period > 0:
+                dev = abs(dt / period - 1.0)
+                m[b + _JITTER + bisect.bisect_left(JITTER_EDGES, dev)] += 1
+                m[b + _PERIOD] = period + PERIOD_ALPHA * (dt - period)
+            elif dt > 0:
+                m[b + _PERIOD] = dt
+        m[b + _LAST_TS] = t
+
+    def apply_defs(self, defs: Dict[str, SignalDef]) -> None:
+        """Config reload: yeni sinyale satır aç, limitleri yerinde güncelle."""
+        active = set(self._names)
+        index = dict(self._index)
+        for n in defs:
+            index.setdefault(n, len(index))
+        if len(index) > len(self._m) and self._shared:
+            raise ValueError("shared health counters cannot grow")
+        stale_after = self._stale_after + [0.0] * (len(index) - len(self._stale_after))
+        limits = self._limits + [(-np.inf, np.inf)] * (len(index) - len(self._limits))
+        for n, d in defs.items():
+            stale_after[index[n]] = d.stale_after_s
+            limits[index[n]] = (d.min, d.max)
+
+        if len(index) > len(self._m):
+            # Sadece sayaç matrisi büyür (sinyal başına ~100 B); kopya sırasında
+            # yazılan bir iki sayaç kaybolabilir
+            buffer = bytearray(self.nbytes(len(index)))
+            m = np.ndarray((len(index), N_COLUMNS), dtype=np.float64, buffer=buffer)
+            m[:len(self._m)] = self._m
+            self._flat = memoryview(buffer).cast("B").cast("d")
+            self._m = m
+        for n in defs:
+            if n not in active and n in self._index:
+                self._m[index[n]] = 0.0        # tekrar eklenen sinyal sıfırdan başlar
+        self._stale_after = stale_after
+        self._limits = limits
+        # En son: yeni isimler görünür olduğunda satırları hazır
+        self._index = index
+        self._names = list(defs)
+
+    def drop(self, name: str) -> None:
+        self._flat[self._index[name] * N_COLUMNS + _DROPPED] += 1
+
+    def release(self) -> None:
+        """Buffer referanslarını bırak (shared memory kapatılmadan önce)."""
+        self._flat.release()
+        self._flat = None
+        self._m = None
+
+    def reset(self) -> None:
+        self._m[:] = 0.0
+
+    def get(self, name: str, now: float | None = None) -> SignalHealth:
+        i = self._index[name]
+        row = self._m[i].tolist()
+        n = time.monotonic() if now is None else float(now)
+        updates = int(row[_UPDATES])
+        gap = n - row[_LAST_TS] if updates else None
+        stale = int(row[_STALE]) + (1 if gap is not None and gap > self._stale_after[i] else 0)
+        return SignalHealth(
+            name=name,
+            updates=updates,
+            rate_hz=1.0 / row[_PERIOD] if row[_PERIOD] > 0 else None,
+            jitter=tuple(int(c) for c in row[_JITTER:]),
+            max_gap_s=row[_MAX_GAP],
+            gap_s=gap,
+            stale_episodes=stale,
+            out_of_range=int(row[_RANGE]),
+            dropped=int(row[_DROPPED]),
+        )
+
+    def get_all(self, now: float | None = None) -> Dict[str, SignalHealth]:
+        n = time.monotonic() if now is None else float(now)
+        return {name: self.get(name, n) for name in self._names}
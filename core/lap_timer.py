@@ -10,7 +10,7 @@ from __future__ import annotations
 import threading
 import time
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,6 +20,18 @@ class LapInfo:
     is_personal_best: bool
 
 
+@dataclass(frozen=True, slots=True)
+class LapTimerState:
+    """Checkpoint için LapTimer'ın tam durumu (monotonic saatten bağımsız)."""
+    current_lap: int
+    laps: Tuple[float, ...]          # tamamlanan tur süreleri
+    best_time: Optional[float]
+    elapsed: Optional[float]         # mevcut turda geçen süre, None = oturum başlamadı
+
+
+LapListener = Callable[[LapInfo], None]
+
+
 class LapTimer:
     def __init__(self):
         self._lock = threading.Lock()
@@ -28,6 +40,11 @@ class LapTimer:
         self._laps: List[float] = []         # tamamlanan tur süreleri
         self._best_time: Optional[float] = None
         self._last_lap: Optional[LapInfo] = None
+        self._listeners: Tuple[LapListener, ...] = ()
+
+    def add_listener(self, fn: LapListener) -> None:
+        """Tur tamamlanınca çağrılır (complete_lap'i çağıran thread'de)."""
+        self._listeners = self._listeners + (fn,)
 
     def start_session(self) -> None:
         """Oturumu başlat, ilk tur sayacını çalıştır."""
@@ -35,6 +52,42 @@ class LapTimer:
             self._lap_start = time.monotonic()
             self._current_lap = 1
 
+    @property
+    def started(self) -> bool:
+        with self._lock:
+            return self._lap_start is not None
+
+    def state(self) -> LapTimerState:
+        with self._lock:
+            elapsed = None if self._lap_start is None else time.monotonic() - self._lap_start
+            return LapTimerState(
+                current_lap=self._current_lap,
+                laps=tuple(self._laps),
+                best_time=self._best_time,
+                elapsed=elapsed,
+            )
+
+    def restore(self, state: LapTimerState, downtime: float = 0.0) -> None:
+        """
+        Checkpoint'ten devam et. `downtime`: checkpoint'ten bu yana geçen süre;
+        mevcut tur o süre kadar ileri sayılır (araç bu arada yolda).
+        """
+        with self._lock:
+            self._current_lap = state.current_lap
+            self._laps = list(state.laps)
+            self._best_time = state.best_time
+            self._lap_start = None
+            if state.elapsed is not None:
+                self._lap_start = time.monotonic() - state.elapsed - max(0.0, downtime)
+            self._last_lap = None
+            if self._laps:
+                last = self._laps[-1]
+                self._last_lap = LapInfo(
+                    lap_number=len(self._laps),
+                    lap_time=last,
+                    is_personal_best=all(last < t for t in self._laps[:-1]),
+                )
+
     def complete_lap(self) -> Optional[LapInfo]:
         """
         Mevcut turu tamamla, yeni turu başlat.
@@ -65,7 +118,9 @@ class LapTimer:
             self._lap_start = now
             self._current_lap += 1
 
-            return info
+        for fn in self._listeners:
+            fn(info)
+        return info
 
     @property
     def elapsed(self) -> float:
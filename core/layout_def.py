@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# Driver dashboard yerleşim bölgeleri
+SLOTS = ("center", "main", "bottom")
+
+# Pit grafik modları: ayrı PlotWidget ızgarası veya tek canvas üzerinde şeritler
+PIT_MODES = ("grid", "lanes")
+
+
+@dataclass(frozen=True, slots=True)
+class WidgetDef: #ekrandaki tek sayısal gösterge
+    signal: str
+    slot: str
+    format: str                      # "gear" veya str.format kalıbı: "OIL  {:.1f} bar"
+    stale_text: str = "–"
+    unit: str = ""                   # main slot'ta değerin yanındaki küçük birim
+    font_size: int = 32
+    weight: int = 500
+    color: str = "#AAAAAA"
+    warn_above: Optional[float] = None
+    warn_below: Optional[float] = None
+    warn_color: str = "#CC1100"
+
+
+@dataclass(frozen=True, slots=True)
+class DriverLayout:
+    critical: Tuple[str, ...]        # biri stale → NO SIGNAL
+    rpm_signal: str
+    rpm_max: float
+    rpm_redline: float
+    widgets: Tuple[WidgetDef, ...]
+    frame_hz: Optional[float] = None     # None = sadece 20 Hz tick, 0 = ekran yenileme hızı
+    interpolate: Tuple[str, ...] = ()    # son iki örnek arasında interpolasyonla gösterilenler
+
+
+@dataclass(frozen=True, slots=True)
+class PitLayout:
+    signals: Tuple[str, ...]         # grafik sırası
+    columns: int = 3
+    mode: str = "grid"
+    lanes: Tuple[Tuple[str, ...], ...] = ()   # lanes modunda aynı şeride bindirilen gruplar
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardLayout:
+    driver: DriverLayout
+    pit: PitLayout
@@ -0,0 +1,460 @@
+"""
+Level-of-detail pyramid — tüm oturumu kaydırmak için çok çözünürlüklü geçmiş.
+
+Seviye 0 ham örnekleri (t, v) tutar. Seviye k'daki her kova, seviye k-1'deki
+`factor` kovanın min/max/mean özetidir. Örnek geldikçe artımlı güncellenir:
+her seviye bir öncekinin 1/factor'ü kadar iş görür → örnek başına amortize O(1).
+
+Her seviye sabit kapasiteli bir ring buffer'dır; bellek başta ayrılır ve
+append sırasında büyümez. Eski ham veri düşse de üst seviyelerde özet olarak
+kalır. Seviye kapasiteleri `resize` ile değiştirilebilir (RetentionManager
+bellek bütçesine göre ayarlar).
+
+Sorgu, istenen zaman aralığını `max_points` noktayla karşılayabilen en ince
+seviyeyi seçer; ham örneklere dokunmadan her zoom seviyesi sunulur.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.signals_def import SignalDef, SignalDefDiff
+
+SLICE_POINTS = 1 << 16     # query_sliced: kilit başına kopyalanan en fazla kova
+
+
+@dataclass(frozen=True, slots=True)
+class LODWindow:
+    t: np.ndarray       # kova başlangıç zamanı (seviye 0: örnek zamanı)
+    vmin: np.ndarray
+    vmax: np.ndarray
+    vmean: np.ndarray
+    level: int
+
+    def trace(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Çizilecek (x, y): ham seviyede örnekler, özet seviyede min/max zarfı."""
+        if self.level == 0:
+            return self.t, self.vmean
+        # Her kova için dikey çizgi: tepe değerler kaybolmaz
+        ys = np.empty(2 * len(self.t))
+        ys[0::2] = self.vmin
+        ys[1::2] = self.vmax
+        return np.repeat(self.t, 2), ys
+
+
+class _Level:
+    __slots__ = ("t", "vmin", "vmax", "vmean", "head", "count", "capacity", "raw",
+                 "acc_t0", "acc_min", "acc_max", "acc_sum", "acc_cnt", "acc_n")
+
+    def __init__(self, capacity: int, raw: bool):
+        self.capacity = capacity
+        self.raw = raw
+        self.t = np.empty(capacity)
+        self.vmin = np.empty(capacity)
+        # Seviye 0'da min = max = mean = v → tek dizi paylaşılır
+        self.vmax = self.vmin if raw else np.empty(capacity)
+        self.vmean = self.vmin if raw else np.empty(capacity)
+        self.head = 0
+        self.count = 0
+        # Bu seviyeye yazılacak bir sonraki kovanın birikimi
+        self.acc_t0 = 0.0
+        self.acc_min = 0.0
+        self.acc_max = 0.0
+        self.acc_sum = 0.0
+        self.acc_cnt = 0       # ham örnek sayısı (mean için ağırlık)
+        self.acc_n = 0         # alt seviyeden gelen kova sayısı
+
+    @property
+    def nbytes(self) -> int:
+        return self.t.nbytes + self.vmin.nbytes + (0 if self.raw else self.vmax.nbytes + self.vmean.nbytes)
+
+    def chronological(self) -> np.ndarray:
+        """Dolu slotların kronolojik indeksleri."""
+        if self.count < self.capacity:
+            return np.arange(self.count)
+        return np.concatenate([np.arange(self.head, self.capacity), np.arange(self.head)])
+
+    def resize(self, capacity: int) -> None:
+        """Kapasiteyi değiştir; sığmayan en eski kovalar düşer."""
+        keep = self.chronological()[-capacity:]
+        n = len(keep)
+        old = (self.t, self.vmin, self.vmax, self.vmean)
+        self.t = np.empty(capacity)
+        self.vmin = np.empty(capacity)
+        self.vmax = self.vmin if self.raw else np.empty(capacity)
+        self.vmean = self.vmin if self.raw else np.empty(capacity)
+        self.t[:n] = old[0][keep]
+        self.vmin[:n] = old[1][keep]
+        if not self.raw:
+            self.vmax[:n] = old[2][keep]
+            self.vmean[:n] = old[3][keep]
+        self.capacity = capacity
+        self.count = n
+        self.head = n % capacity
+
+    def write(self, t: np.ndarray, vmin: np.ndarray, vmax: np.ndarray, vmean: np.ndarray) -> None:
+        """Kovaları head'den itibaren toplu yaz; ring'e sığmayan en eskiler düşer."""
+        n = len(t)
+        cap = self.capacity
+        start = self.head
+        if n > cap:
+            start = (start + n - cap) % cap
+            t, vmin, vmax, vmean = t[-cap:], vmin[-cap:], vmax[-cap:], vmean[-cap:]
+        idx = (start + np.arange(len(t))) % cap
+        self.t[idx] = t
+        self.vmin[idx] = vmin
+        if not self.raw:
+            self.vmax[idx] = vmax
+            self.vmean[idx] = vmean
+        self.head = (self.head + n) % cap
+        self.count = min(cap, self.count + n)
+
+
+class LODPyramid:
+    def __init__(self, capacity: int = 8192, factor: int = 4, levels: int = 8):
+        if capacity < 2 or factor < 2 or levels < 1:
+            raise ValueError("capacity >= 2, factor >= 2, levels >= 1 required")
+        self._factor = factor
+        self._levels: List[_Level] = [_Level(capacity, raw=(k == 0)) for k in range(levels)]
+
+    @property
+    def levels(self) -> int:
+        return len(self._levels)
+
+    @property
+    def factor(self) -> int:
+        return self._factor
+
+    @property
+    def nbytes(self) -> int:
+        return sum(lv.nbytes for lv in self._levels)
+
+    @property
+    def capacities(self) -> Tuple[int, ...]:
+        return tuple(lv.capacity for lv in self._levels)
+
+    def resize(self, capacities: Tuple[int, ...]) -> None:
+        """Seviye başına kapasiteyi değiştir (retention); en yeni veri korunur."""
+        if len(capacities) != len(self._levels) or min(capacities) < 2:
+            raise ValueError("one capacity >= 2 per level required")
+        for lv, cap in zip(self._levels, capacities):
+            if cap != lv.capacity:
+                lv.resize(cap)
+
+    def raw_rate(self) -> Optional[float]:
+        """Seviye 0'daki örneklerden ortalama örnekleme hızı (Hz)."""
+        raw = self._levels[0]
+        if raw.count < 2:
+            return None
+        idx = raw.chronological()
+        dt = raw.t[idx[-1]] - raw.t[idx[0]]
+        return (raw.count - 1) / dt if dt > 0 else None
+
+    def __len__(self) -> int:
+        return self._levels[0].count
+
+    def append(self, t: float, v: float) -> None:
+        lv = self._levels[0]
+        i = lv.head
+        lv.t[i] = t
+        lv.vmin[i] = v
+        lv.head = (i + 1) % lv.capacity
+        if lv.count < lv.capacity:
+            lv.count += 1
+
+        # Yukarı doğru birikim: kova dolunca bir üst seviyeye yaz ve devam et
+        t0, vmin, vmax, vsum, cnt = t, v, v, v, 1
+        for k in range(1, len(self._levels)):
+            up = self._levels[k]
+            if up.acc_n == 0:
+                up.acc_t0, up.acc_min, up.acc_max, up.acc_sum, up.acc_cnt = t0, vmin, vmax, vsum, cnt
+            else:
+                if vmin < up.acc_min:
+                    up.acc_min = vmin
+                if vmax > up.acc_max:
+                    up.acc_max = vmax
+                up.acc_sum += vsum
+                up.acc_cnt += cnt
+            up.acc_n += 1
+            if up.acc_n < self._factor:
+                return
+
+            t0, vmin, vmax, vsum, cnt = up.acc_t0, up.acc_min, up.acc_max, up.acc_sum, up.acc_cnt
+            j = up.head
+            up.t[j] = t0
+            up.vmin[j] = vmin
+            up.vmax[j] = vmax
+            up.vmean[j] = vsum / cnt
+            up.head = (j + 1) % up.capacity
+            if up.count < up.capacity:
+                up.count += 1
+            up.acc_n = 0
+
+    def extend(self, t: np.ndarray, v: np.ndarray) -> None:
+        """
+        Örnekleri toplu ekle: sonuç tek tek `append` ile aynı, ama seviye başına
+        birkaç numpy işlemi (checkpoint geri yükleme). `t` artan sırada ve
+        mevcut örneklerden yeni olmalı.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        v = np.asarray(v, dtype=np.float64)
+        if not len(t):
+            return
+        self._levels[0].write(t, v, v, v)
+
+        # Alt seviyeden gelen kovalar (t0, min, max, toplam, ham örnek sayısı)
+        t0, vmin, vmax, vsum, cnt = t, v, v, v, np.ones(len(t), dtype=np.int64)
+        f = self._factor
+        for k in range(1, len(self._levels)):
+            up = self._levels[k]
+            need = f - up.acc_n
+            if len(t0) < need:
+                self._accumulate(up, t0, vmin, vmax, vsum, cnt)
+                return
+
+            # Açık kova ilk `need` kovayla kapanır
+            self._accumulate(up, t0[:need], vmin[:need], vmax[:need], vsum[:need], cnt[:need])
+            head = (up.acc_t0, up.acc_min, up.acc_max, up.acc_sum, up.acc_cnt)
+            up.acc_n = 0
+
+            # Kalanlar factor'lük gruplar; artan kısım yeni açık kova
+            rest = slice(need, need + (len(t0) - need) // f * f)
+            g = (rest.stop - rest.start) // f
+            tail = slice(rest.stop, len(t0))
+            nt0 = np.concatenate([[head[0]], t0[rest][::f]])
+            nmin = np.concatenate([[head[1]], vmin[rest].reshape(g, f).min(axis=1)])
+            nmax = np.concatenate([[head[2]], vmax[rest].reshape(g, f).max(axis=1)])
+            nsum = np.concatenate([[head[3]], vsum[rest].reshape(g, f).sum(axis=1)])
+            ncnt = np.concatenate([[head[4]], cnt[rest].reshape(g, f).sum(axis=1)])
+            if tail.stop > tail.start:
+                self._accumulate(up, t0[tail], vmin[tail], vmax[tail], vsum[tail], cnt[tail])
+
+            up.write(nt0, nmin, nmax, nsum / ncnt)
+            t0, vmin, vmax, vsum, cnt = nt0, nmin, nmax, nsum, ncnt
+
+    def span(self) -> Optional[Tuple[float, float]]:
+        """Pyramid'in kapsadığı (en eski, en yeni) zaman."""
+        raw = self._levels[0]
+        if raw.count == 0:
+            return None
+        newest = raw.t[(raw.head - 1) % raw.capacity]
+        for lv in reversed(self._levels):
+            if lv.count:
+                return (float(self._oldest(lv)), float(newest))
+        return None
+
+    def query(self, t0: float, t1: float, max_points: int) -> LODWindow:
+        """[t0, t1] aralığını en fazla ~max_points noktayla döndür."""
+        return self.query_level(self.level_for(t0, t1, max_points), t0, t1)[0]
+
+    def level_for(self, t0: float, t1: float, max_points: int) -> int:
+        """[t0, t1]'i max_points noktayla karşılayan en ince seviye."""
+        return self._pick_level(t0, t1, max_points)
+
+    def query_level(self, k: int, t0: float, t1: float,
+                    limit: Optional[int] = None) -> Tuple[LODWindow, bool]:
+        """Seviye k'da [t0, t1]'in ilk `limit` kovası; ikinci değer: pencere bitti mi."""
+        lv = self._levels[k]
+        idx = []
+        n = 0
+        for s, e in self._window(lv, t0, t1):
+            if limit is not None:
+                e = min(e, s + limit - n)
+            idx.append(np.arange(s, e))
+            n += e - s
+            if limit is not None and n >= limit:
+                break
+        sel = np.concatenate(idx) if idx else np.empty(0, dtype=np.intp)
+        complete = limit is None or n < limit
+
+        t = lv.t[sel]
+        vmin = lv.vmin[sel]
+        vmax = lv.vmax[sel]
+        vmean = lv.vmean[sel]
+
+        # Henüz kapanmamış son kova: canlı uçta boşluk kalmasın
+        if complete and k > 0 and lv.acc_n and lv.acc_t0 <= t1:
+            t = np.append(t, lv.acc_t0)
+            vmin = np.append(vmin, lv.acc_min)
+            vmax = np.append(vmax, lv.acc_max)
+            vmean = np.append(vmean, lv.acc_sum / lv.acc_cnt)
+
+        return LODWindow(t=t, vmin=vmin, vmax=vmax, vmean=vmean, level=k), complete
+
+    def raw(self, t0: float, t1: float = np.inf) -> Tuple[np.ndarray, np.ndarray]:
+        """Seviye 0'daki ham (t, v) örnekleri — kronolojik kopya."""
+        lv = self._levels[0]
+        idx = [np.arange(s, e) for s, e in self._window(lv, t0, t1)]
+        sel = np.concatenate(idx) if idx else np.empty(0, dtype=np.intp)
+        return lv.t[sel], lv.vmin[sel]
+
+    # ── Internals ───────────────────────────────────────────
+    @staticmethod
+    def _accumulate(up: _Level, t0: np.ndarray, vmin: np.ndarray, vmax: np.ndarray,
+                    vsum: np.ndarray, cnt: np.ndarray) -> None:
+        """Alt seviye kovalarını up'ın açık kovasına kat (kova kapanmaz)."""
+        mn, mx = float(vmin.min()), float(vmax.max())
+        s, c = float(vsum.sum()), int(cnt.sum())
+        if up.acc_n == 0:
+            up.acc_t0, up.acc_min, up.acc_max, up.acc_sum, up.acc_cnt = float(t0[0]), mn, mx, s, c
+        else:
+            up.acc_min = min(up.acc_min, mn)
+            up.acc_max = max(up.acc_max, mx)
+            up.acc_sum += s
+            up.acc_cnt += c
+        up.acc_n += len(t0)
+
+    def _oldest(self, lv: _Level) -> float:
+        return lv.t[lv.head] if lv.count == lv.capacity else lv.t[0]
+
+    def _segments(self, lv: _Level) -> List[Tuple[int, int]]:
+        """Ring içindeki kronolojik (start, stop) aralıkları."""
+        if lv.count < lv.capacity:
+            return [(0, lv.count)]
+        return [(lv.head, lv.capacity), (0, lv.head)]
+
+    def _window(self, lv: _Level, t0: float, t1: float) -> List[Tuple[int, int]]:
+        out = []
+        for s, e in self._segments(lv):
+            seg = lv.t[s:e]
+            a = int(np.searchsorted(seg, t0, side="left"))
+            b = int(np.searchsorted(seg, t1, side="right"))
+            if b > a:
+                out.append((s + a, s + b))
+        return out
+
+    def _pick_level(self, t0: float, t1: float, max_points: int) -> int:
+        last = len(self._levels) - 1
+        for k, lv in enumerate(self._levels):
+            if lv.count == 0:
+                continue
+            # Seviye hiç taşmadıysa oturum başından beri her şeyi içerir
+            covers = lv.count < lv.capacity or self._oldest(lv) <= t0
+            if not covers and k < last:
+                continue
+            n = sum(e - s for s, e in self._window(lv, t0, t1))
+            if n <= max_points or k == last:
+                return k
+        return 0
+
+
+class SignalHistory:
+    """
+    Her sinyal için bir LODPyramid. `append` SignalStore listener'ı olarak
+    bağlanır; acquisition hızında beslenir, UI sadece sorgular.
+
+    Config reload'da (`apply_defs`) yeni sinyale boş pyramid açılır; mevcut
+    pyramid'lere dokunulmaz. Çıkarılan sinyalin geçmişi oturum boyunca
+    sorgulanabilir kalır (sadece yeni örnek gelmez).
+    """
+
+    def __init__(self, defs: Dict[str, SignalDef], capacity: int = 8192,
+                 factor: int = 4, levels: int = 8):
+        self._lock = threading.Lock()
+        self._capacity = capacity
+        self._levels = levels
+        self._factor = factor
+        self._pyramids: Dict[str, LODPyramid] = {
+            name: LODPyramid(capacity, factor, levels) for name in defs
+        }
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._pyramids)
+
+    @property
+    def levels(self) -> int:
+        return self._levels
+
+    @property
+    def factor(self) -> int:
+        return self._factor
+
+    def apply_defs(self, defs: Dict[str, SignalDef], diff: SignalDefDiff | None = None) -> None:
+        """SignalStore defs listener'ı: yeni sinyallere pyramid aç."""
+        new = [n for n in defs if n not in self._pyramids]
+        if not new:
+            return
+        with self._lock:
+            # Copy-on-write: append() kilitsiz okur
+            pyramids = dict(self._pyramids)
+            for n in new:
+                pyramids[n] = LODPyramid(self._capacity, self._factor, self._levels)
+            self._pyramids = pyramids
+
+    def append(self, name: str, value: float, ts: float) -> None:
+        pyr = self._pyramids.get(name)
+        if pyr is None:
+            return
+        with self._lock:
+            pyr.append(ts, value)
+
+    def extend(self, name: str, t: np.ndarray, v: np.ndarray) -> None:
+        """Toplu ekleme (checkpoint geri yükleme); `t` artan ve mevcut örneklerden yeni."""
+        pyr = self._pyramids.get(name)
+        if pyr is None:
+            return
+        with self._lock:
+            pyr.extend(t, v)
+
+    def query(self, name: str, t0: float, t1: float, max_points: int) -> LODWindow:
+        with self._lock:
+            return self._pyramids[name].query(t0, t1, max_points)
+
+    def query_sliced(self, name: str, t0: float, t1: float, max_points: int,
+                     slice_points: int = SLICE_POINTS) -> LODWindow:
+        """
+        query ile aynı sonuç, ama kopya `slice_points`'lik dilimlerle: kilit dilim
+        başına alınıp bırakılır, büyük pencere (analiz) append'i uzun bekletmez.
+        Dilimler arasında gelen yeni örnekler pencereye girebilir.
+        """
+        with self._lock:
+            pyr = self._pyramids[name]
+            k = pyr.level_for(t0, t1, max_points)
+        parts: List[LODWindow] = []
+        start = t0
+        while True:
+            with self._lock:
+                w, complete = pyr.query_level(k, start, t1, slice_points)
+            parts.append(w)
+            if complete or not len(w.t):
+                break
+            start = float(np.nextafter(w.t[-1], np.inf))
+        if len(parts) == 1:
+            return parts[0]
+        return LODWindow(t=np.concatenate([p.t for p in parts]),
+                         vmin=np.concatenate([p.vmin for p in parts]),
+                         vmax=np.concatenate([p.vmax for p in parts]),
+                         vmean=np.concatenate([p.vmean for p in parts]), level=k)
+
+    def raw(self, name: str, t0: float, t1: float = np.inf) -> Tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            return self._pyramids[name].raw(t0, t1)
+
+    def span(self, name: str | None = None) -> Optional[Tuple[float, float]]:
+        """Tek sinyalin veya (None) tüm sinyallerin zaman kapsamı."""
+        with self._lock:
+            if name is not None:
+                return self._pyramids[name].span()
+            spans = [s for s in (p.span() for p in self._pyramids.values()) if s]
+        if not spans:
+            return None
+        return (min(s[0] for s in spans), max(s[1] for s in spans))
+
+    def nbytes(self) -> Dict[str, int]:
+        return {name: pyr.nbytes for name, pyr in self._pyramids.items()}
+
+    def capacities(self, name: str) -> Tuple[int, ...]:
+        return self._pyramids[name].capacities
+
+    def resize(self, name: str, capacities: Tuple[int, ...]) -> None:
+        with self._lock:
+            self._pyramids[name].resize(capacities)
+
+    def raw_rate(self, name: str) -> Optional[float]:
+        with self._lock:
+            return self._pyramids[name].raw_rate()
@@ -0,0 +1,224 @@
+"""
+Retention — pit UI geçmişinin bellek bütçesi altında tutulması.
+
+SignalHistory'deki her LODPyramid zaten katmanlıdır: seviye 0 ham örnekler,
+üst seviyeler giderek seyrekleşen min/max/mean özetleri. RetentionManager bu
+katmanların kapasitesini sinyal başına ayarlar:
+
+  1. Seviye 0: ölçülen örnekleme hızı × `full_rate_s` → son N saniye tam çözünürlük
+  2. Özet katmanlar: kalan bütçe eşit paylaştırılır (en fazla `tier_capacity` kova)
+  3. Bütçe yetmezse önce özet katmanlar (en eski veri) `min_capacity`'ye, sonra
+     ham pencere tabanına küçülür; o da yetmezse tabanlar da küçülür: özetler
+     pyramid'in alt sınırına (2 kova), ham pencere spill tabanına
+
+Spill açıkken ham pencere hiçbir adımda `hız × interval × 2`'nin altına inmez:
+ring iki spill tick'i arasında dönerse örnek arşive yazılmadan kaybolur. Bu
+taban bile bütçeyi aşarsa plan bütçe üstünde kalır ve konsola yazılır.
+
+Böylece yüzlerce yüksek hızlı sinyalde de toplam bellek bütçeyi aşmaz; gün
+boyunca eski koşular seyrekleşmiş olarak görünmeye devam eder.
+
+`spill_path` verilirse ham örnekler arka planda arşive (core/archive.py)
+yazılır; RAM'den düşen tam çözünürlüklü veri diskte kalır. Arşiv `close()`
+ile tamamlanır ve ArchiveReader / offline araçlarla okunur.
+
+Config reload'da eklenen sinyaller bir sonraki tick'te bütçeye girer; arşivin
+sinyal listesi açılışta sabitlendiği için spill'e girmezler.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.archive import ArchiveWriter
+from core.lod import SignalHistory
+from core.signals_def import SignalDef
+
+RAW_SLOT_BYTES = 16       # t + v
+TIER_SLOT_BYTES = 32      # t + min + max + mean
+FLOOR_CAPACITY = 2        # LODPyramid.resize alt sınırı
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    full_rate_s: float = 300.0              # son N saniye ham veri
+    budget_bytes: int = DEFAULT_BUDGET_BYTES
+    tier_capacity: int = 4096               # özet seviye başına hedef kova sayısı
+    min_capacity: int = 64
+    default_rate_hz: float = 20.0           # hız henüz ölçülmediyse
+    spill_path: Optional[Path] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SignalUsage:
+    name: str
+    nbytes: int
+    rate_hz: Optional[float]
+    full_rate_s: float                      # seviye 0'ın bu hızda kapsadığı süre
+    span_s: float                           # bellekte tutulan toplam geçmiş
+    capacities: Tuple[int, ...]
+
+
+class RetentionManager:
+    def __init__(self, history: SignalHistory, defs: Dict[str, SignalDef],
+                 policy: RetentionPolicy = RetentionPolicy(), interval: float = 5.0):
+        self._history = history
+        self._policy = policy
+        self._interval = interval
+        self._spill_names = history.names      # arşiv indeksleri
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._over_budget = False
+
+        self._spill: Optional[ArchiveWriter] = None
+        self._spilled_until: Dict[str, float] = {n: -math.inf for n in self._spill_names}
+        if policy.spill_path is not None:
+            self._spill = ArchiveWriter(policy.spill_path, [defs[n] for n in self._spill_names])
+
+        # Başlangıç tahsisi de bütçeye uysun
+        self.rebalance(force=True)
+
+    @property
+    def policy(self) -> RetentionPolicy:
+        return self._policy
+
+    # ── Planning ────────────────────────────────────────────
+    def plan(self) -> Dict[str, Tuple[int, ...]]:
+        """Bütçeye uyan seviye kapasiteleri (sinyal başına)."""
+        p = self._policy
+        levels = self._history.levels
+        names = self._history.names
+        rates = {n: self._history.raw_rate(n) or p.default_rate_hz for n in names}
+
+        # Ham pencere tabanı: spill açıksa tick'ine kadar ring dönmemeli
+        floors = {}
+        for n, rate in rates.items():
+            floor = FLOOR_CAPACITY
+            if self._spill is not None:
+                floor = max(floor, math.ceil(rate * self._interval * 2))
+            floors[n] = floor
+        raw_caps = {n: max(p.min_capacity, math.ceil(rate * p.full_rate_s * 1.1), floors[n])
+                    for n, rate in rates.items()}
+
+        tier_slots = len(names) * (levels - 1)
+        raw_bytes = sum(raw_caps.values()) * RAW_SLOT_BYTES
+        tier_cap = p.tier_capacity
+        if tier_slots:
+            tier_cap = min(p.tier_capacity, (p.budget_bytes - raw_bytes) // (tier_slots * TIER_SLOT_BYTES))
+
+        if tier_cap < p.min_capacity:
+            # Ham pencere bile sığmıyor: özetler minimumda, ham pencere tabanına doğru
+            # orantılı küçülür (taban korunur)
+            tier_cap = min(p.tier_capacity, p.min_capacity)
+            floor_bytes = sum(floors.values()) * RAW_SLOT_BYTES
+            extra = raw_bytes - floor_bytes
+            avail = p.budget_bytes - tier_slots * tier_cap * TIER_SLOT_BYTES - floor_bytes
+            scale = min(1.0, max(0.0, avail / extra)) if extra else 1.0
+            raw_caps = {n: floors[n] + int((c - floors[n]) * scale) for n, c in raw_caps.items()}
+
+            if avail < 0 and tier_slots:
+                # Tabanlar bile sığmıyor: özetler de alt sınıra doğru küçülür
+                tier_cap = max(FLOOR_CAPACITY, (p.budget_bytes - floor_bytes) // (tier_slots * TIER_SLOT_BYTES))
+
+        plan = {n: (raw_caps[n],) + (int(tier_cap),) * (levels - 1) for n in names}
+        self._check_budget(plan)
+        return plan
+
+    def _check_budget(self, plan: Dict[str, Tuple[int, ...]]) -> None:
+        total = sum(c[0] * RAW_SLOT_BYTES + sum(c[1:]) * TIER_SLOT_BYTES for c in plan.values())
+        over = total > self._policy.budget_bytes
+        if over and not self._over_budget:
+            print(f"Retention plan over budget: {total / 1e6:.1f} MB > "
+                  f"{self._policy.budget_bytes / 1e6:.1f} MB at minimum sizes "
+                  f"({len(plan)} signals)")
+        self._over_budget = over
+
+    def rebalance(self, force: bool = False) -> None:
+        """Planı uygula. Küçülme hemen; büyüme sadece %25'ten fazlaysa (titreşim olmasın)."""
+        plan = self.plan()
+        changes = []
+        for n, new in plan.items():
+            old = self._history.capacities(n)
+            if new == old:
+                continue
+            shrink = any(b < a for a, b in zip(old, new))
+            if force or shrink or sum(new) > sum(old) * 1.25:
+                changes.append((not shrink, n, new))
+        # Önce küçülenler: geçici tepe bütçeyi aşmasın
+        for _, n, new in sorted(changes):
+            self._history.resize(n, new)
+
+    # ── Reporting ───────────────────────────────────────────
+    def total_bytes(self) -> int:
+        return sum(self._history.nbytes().values())
+
+    def report(self) -> List[SignalUsage]:
+        out = []
+        nbytes = self._history.nbytes()
+        for n in self._history.names:
+            rate = self._history.raw_rate(n)
+            caps = self._history.capacities(n)
+            span = self._history.span(n)
+            out.append(SignalUsage(
+                name=n,
+                nbytes=nbytes[n],
+                rate_hz=rate,
+                full_rate_s=caps[0] / rate if rate else 0.0,
+                span_s=(span[1] - span[0]) if span else 0.0,
+                capacities=caps,
+            ))
+        return out
+
+    # ── Spill ───────────────────────────────────────────────
+    def spill(self) -> None:
+        """Son spill'den bu yana gelen ham örnekleri arşive ekle."""
+        if self._spill is None:
+            return
+        for i, n in enumerate(self._spill_names):
+            since = np.nextafter(self._spilled_until[n], math.inf)
+            t, v = self._history.raw(n, since)
+            if len(t):
+                self._spill.append(i, t, v)
+                self._spilled_until[n] = float(t[-1])
+
+    # ── Thread ──────────────────────────────────────────────
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="retention", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self._spill is not None:
+            self.spill()
+            self._spill.close()
+            self._spill = None
+
+    def _run(self) -> None:
+        wait = min(1.0, self._interval)     # ilk tick erken: gerçek hızlar hemen ölçülsün
+        while not self._stop.wait(wait):
+            self.spill()
+            self.rebalance()
+            wait = self._interval
+
+
+def format_report(usage: Sequence[SignalUsage]) -> str:
+    """Konsol için sinyal başına bellek tablosu."""
+    lines = [f"{'signal':<16}{'MB':>8}{'Hz':>9}{'full-rate s':>13}{'span s':>10}"]
+    for u in sorted(usage, key=lambda u: u.nbytes, reverse=True):
+        rate = f"{u.rate_hz:.1f}" if u.rate_hz else "–"
+        lines.append(f"{u.name:<16}{u.nbytes / 1e6:>8.2f}{rate:>9}{u.full_rate_s:>13.0f}{u.span_s:>10.0f}")
+    lines.append(f"{'total':<16}{sum(u.nbytes for u in usage) / 1e6:>8.2f}")
+    return "\n".join(lines)
@@ -0,0 +1,178 @@
+"""
+Session Log — ham oturum kaydı (sabit genişlikli kayıtlar).
+
+Dosya düzeni:
+    magic(8s) header_len(I) header(JSON, utf-8)
+    kayıt*: sig(u2) ts(f8) value(f8)      — 18 byte, little-endian
+
+Header sinyal tanımlarını (SignalDef) taşır; kayıttaki `sig` bu listedeki
+indekstir. `sig == LAP_MARKER` kaydı tur bitişidir (value = biten tur no). Sabit genişlik sayesinde okuyucu dosyayı chunk chunk NumPy
+structured array olarak okur ve son kayda doğrudan seek edebilir.
+
+Recorder SignalStore listener'ıdır: acquisition thread'i sadece belleğe
+ekler, diske yazma ayrı bir thread'de yapılır.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.signals_def import SignalDef
+
+MAGIC = b"FSTLOG1\0"
+_PREFIX = struct.Struct("<8sI")
+_RECORD = struct.Struct("<Hdd")
+
+LAP_MARKER = 0xFFFF
+
+RECORD_DTYPE = np.dtype([("sig", "<u2"), ("ts", "<f8"), ("value", "<f8")])
+DEFAULT_CHUNK_RECORDS = 1 << 20   # ~18 MB / chunk
+
+
+class SessionRecorder:
+    def __init__(self, path: str | Path, defs: Dict[str, SignalDef], flush_interval: float = 0.5):
+        self._path = Path(path)
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(defs)}
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+        self._flush_interval = flush_interval
+
+        header = json.dumps({
+            "version": 1,
+            "created": time.time(),
+            "t0": time.monotonic(),
+            "signals": [asdict(d) for d in defs.values()],
+        }).encode("utf-8")
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[BinaryIO] = self._path.open("wb")
+        self._file.write(_PREFIX.pack(MAGIC, len(header)))
+        self._file.write(header)
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._flush_loop, name="session-recorder", daemon=True)
+        self._thread.start()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record(self, name: str, value: float, ts: float) -> None:
+        """SignalStore update listener'ı."""
+        idx = self._index.get(name)
+        if idx is None:
+            return
+        with self._lock:
+            self._buf += _RECORD.pack(idx, ts, value)
+
+    def mark_lap(self, lap_number: int, ts: float | None = None) -> None:
+        t = time.monotonic() if ts is None else ts
+        with self._lock:
+            self._buf += _RECORD.pack(LAP_MARKER, t, float(lap_number))
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._flush()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _flush(self) -> None:
+        with self._lock:
+            data, self._buf = self._buf, bytearray()
+        if data and self._file:
+            self._file.write(data)
+            self._file.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            self._flush()
+
+
+class SessionReader:
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        if not self._path.exists():
+            raise FileNotFoundError(f"session log not found: {self._path}")
+
+        with self._path.open("rb") as f:
+            prefix = f.read(_PREFIX.size)
+            if len(prefix) < _PREFIX.size:
+                raise ValueError(f"{self._path} is not a session log")
+            magic, header_len = _PREFIX.unpack(prefix)
+            if magic != MAGIC:
+                raise ValueError(f"{self._path} is not a session log")
+            header = json.loads(f.read(header_len).decode("utf-8"))
+
+        self._data_offset = _PREFIX.size + header_len
+        self.created: float = header["created"]
+        self.t0: float = header["t0"]
+        self.defs: List[SignalDef] = [
+            SignalDef(**{**s, "sources": tuple(s.get("sources", ()))}) for s in header["signals"]
+        ]
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def n_records(self) -> int:
+        size = self._path.stat().st_size - self._data_offset
+        return max(0, size) // RECORD_DTYPE.itemsize
+
+    def iter_chunks(self, chunk_records: int = DEFAULT_CHUNK_RECORDS) -> Iterator[np.ndarray]:
+        """Dosyayı sırayla chunk chunk oku; bellek kullanımı chunk boyutuyla sınırlı."""
+        n = self.n_records
+        with self._path.open("rb") as f:
+            f.seek(self._data_offset)
+            remaining = n
+            while remaining > 0:
+                count = min(chunk_records, remaining)
+                chunk = np.fromfile(f, dtype=RECORD_DTYPE, count=count)
+                if len(chunk) == 0:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    def lap_markers(self, chunk_records: int = DEFAULT_CHUNK_RECORDS) -> Tuple[np.ndarray, np.ndarray]:
+        """Tur bitiş zamanları ve tur numaraları."""
+        ts: List[np.ndarray] = []
+        laps: List[np.ndarray] = []
+        for chunk in self.iter_chunks(chunk_records):
+            m = chunk[chunk["sig"] == LAP_MARKER]
+            ts.append(m["ts"])
+            laps.append(m["value"].astype(np.int64))
+        if not ts:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+        return np.concatenate(ts), np.concatenate(laps)
+
+    def time_range(self) -> Optional[Tuple[float, float]]:
+        """İlk ve son kaydın zamanı (sadece iki kayıt okunur)."""
+        n = self.n_records
+        if n == 0:
+            return None
+        records = np.memmap(self._path, dtype=RECORD_DTYPE, mode="r",
+                            offset=self._data_offset, shape=(n,))
+        try:
+            return float(records["ts"][0]), float(records["ts"][n - 1])
+        finally:
+            del records
+
+
+def split_by_signal(chunk: np.ndarray, n_signals: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Chunk'ı sinyal başına (ts, value) dizilerine ayır; kayıt sırası korunur."""
+    order = np.argsort(chunk["sig"], kind="stable")
+    ordered = chunk[order]
+    bounds = np.searchsorted(ordered["sig"], np.arange(n_signals + 1))
+    ts = ordered["ts"]
+    values = ordered["value"]
+    return [(ts[a:b], values[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
@@ -0,0 +1,240 @@
+"""
+Shared-memory SignalStore — acquisition ayrı process'te, UI aynı belleği okur.
+
+Bellek düzeni (little-endian):
+    header: magic(4s) version(I) n_slots(I) names_crc(I) ring_len(I)
+    slot i: seq(Q) value(d) ts(d)          — signal sırası = defs sırası
+    health: n_slots × N_COLUMNS float64    — core/health.py sayaç matrisi
+    count:  n_slots × Q                    — sinyal başına yazılan örnek sayısı
+    ring:   n_slots × ring_len × (ts, value) float64
+
+Her slot bir seqlock: yazıcı seq'i tek sayıya çeker, value/ts yazar, seq'i
+tekrar çift sayıya çeker. Okuyucu seq tek ise veya okuma sırasında değiştiyse
+tekrar dener. Pickle yok, kilit yok; UI process'in GIL'i acquisition'ı
+bekletmez. seq == 0 → sinyal hiç yazılmadı.
+
+Health sayaçları yazıcı process'te güncellenir, UI aynı matrisi okur.
+
+Slot sadece son değeri tutar; her örnek ayrıca sinyalin ring'ine yazılır
+(önce örnek, sonra count). Readonly tarafta `start_follow()` bir thread
+açar: ring'leri FOLLOW_INTERVAL_S'de bir boşaltır ve her örneği bu
+process'teki listener'lara (watchdog, history, capture) sırayla verir —
+UI örnekleme hızıyla sınırlı kalmaz. Okuyucu bir periyotta ring_len'den
+fazla geride kalırsa en eski örnekler kaybolur (konsola yazılır).
+
+`time.monotonic()` sistem geneli olduğundan ts'ler iki process'te de geçerlidir.
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+import zlib
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.health import HealthCounters
+from core.signal_store import SignalStore
+from core.signals_def import SignalDef
+
+_MAGIC = b"FSTS"
+_VERSION = 3
+_HEADER = struct.Struct("<4sIIII")
+_SLOT = struct.Struct("<Qdd")
+_SEQ = struct.Struct("<Q")
+_VALUE = struct.Struct("<dd")
+_SAMPLE = struct.Struct("<dd")     # ring kaydı: ts, value
+RING_LEN = 2048                    # 10 ms'de bir boşaltmada sinyal başına ~200 kHz pay
+FOLLOW_INTERVAL_S = 0.01
+_MAX_RETRIES = 1000   # yazıcı process yazım ortasında ölürse sonsuz döngü olmasın
+
+
+def _names_crc(defs: Dict[str, SignalDef]) -> int:
+    return zlib.crc32("\0".join(defs.keys()).encode("utf-8"))
+
+
+class SharedSignalStore(SignalStore):
+    def __init__(
+        self,
+        defs: Dict[str, SignalDef],
+        name: str | None = None,
+        create: bool = False,
+        readonly: bool = False,
+    ):
+        """
+        create=True  → yeni segment aç (sahibi unlink() eder)
+        create=False → `name` ile var olan segmente bağlan
+        readonly     → update() yasak; UI tarafı bu modda açar
+        """
+        super().__init__(defs)
+        self._slots: Dict[str, int] = {n: i for i, n in enumerate(defs)}
+        self._readonly = readonly
+        self._owner = create
+        n = len(defs)
+        slots_end = _HEADER.size + _SLOT.size * n
+        health_end = slots_end + HealthCounters.nbytes(n)
+        self._count_off = (health_end + 7) & ~7
+        self._ring_off = self._count_off + _SEQ.size * n
+        size = self._ring_off + n * RING_LEN * _SAMPLE.size
+
+        if create:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._buf = self._shm.buf
+            self._buf[:size] = bytes(size)
+            _HEADER.pack_into(self._buf, 0, _MAGIC, _VERSION, n, _names_crc(defs), RING_LEN)
+        else:
+            if name is None:
+                raise ValueError("name is required to attach to an existing store")
+            self._shm = shared_memory.SharedMemory(name=name)
+            self._buf = self._shm.buf
+            magic, version, n_slots, crc, ring_len = _HEADER.unpack_from(self._buf, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"Shared memory '{name}' is not a SignalStore segment")
+            if n_slots != n or crc != _names_crc(defs) or ring_len != RING_LEN:
+                raise ValueError(f"Shared memory '{name}' signal layout does not match defs")
+
+        self._health = HealthCounters(defs, self._buf[slots_end:health_end])
+        self._rings = np.ndarray((n, RING_LEN, 2), dtype=np.float64,
+                                 buffer=self._buf, offset=self._ring_off)
+
+        # Aynı process içinde birden fazla yazıcı thread (merge katmanı) olabilir
+        self._write_lock = threading.Lock()
+
+        # Okuyucu tarafı: sinyal başına tüketilen örnek sayısı
+        self._cursors: List[int] = [0] * n
+        self._lost = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def apply_defs(self, defs: Dict[str, SignalDef]):
+        raise ValueError("SharedSignalStore layout is fixed; restart to change signal definitions")
+
+    @property
+    def shm_name(self) -> str:
+        return self._shm.name
+
+    def close(self) -> None:
+        self.stop_follow()
+        self._health.release()
+        self._health = None
+        self._rings = None
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        if self._owner:
+            self._shm.unlink()
+
+    def update(self, name: str, value: float, ts: float | None = None) -> None:
+        # Sayaçlar da shm'de: readonly okuyucu (NaN dahil) hiçbir şeye dokunmasın
+        if self._readonly:
+            raise PermissionError("SharedSignalStore opened read-only")
+        super().update(name, value, ts)
+
+    def _offset(self, name: str) -> int:
+        return _HEADER.size + self._slots[name] * _SLOT.size
+
+    # ── Ring takibi (readonly taraf) ─────────────────────────
+    def start_follow(self, interval: float = FOLLOW_INTERVAL_S) -> None:
+        """Ring'leri arka planda boşaltıp örnekleri listener'lara ver."""
+        if self._thread is not None:
+            return
+        # Segment açılmadan önce yazılmış örnekler bu okuyucunun değil
+        self._cursors = [_SEQ.unpack_from(self._buf, self._count_off + i * _SEQ.size)[0]
+                         for i in range(len(self._cursors))]
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._follow_loop, args=(interval,),
+                                        name="shm-follow", daemon=True)
+        self._thread.start()
+
+    def stop_follow(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _follow_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.drain()
+
+    def drain(self) -> int:
+        """Son çağrıdan beri yazılan örnekleri listener'lara ver; örnek sayısını döner."""
+        buf = self._buf
+        total = 0
+        lost = 0
+        for name, i in self._slots.items():
+            off = self._count_off + i * _SEQ.size
+            c1 = _SEQ.unpack_from(buf, off)[0]
+            start = self._cursors[i]
+            if c1 == start:
+                continue
+            ring = self._rings[i].copy()
+            c2 = _SEQ.unpack_from(buf, off)[0]
+            # Kopya sırasında yazıcı c2'ye kadar ilerledi; c2 - RING_LEN ve öncesi ezilmiş olabilir
+            lo = max(start, c2 - RING_LEN + 1)
+            lost += lo - start
+            self._cursors[i] = c1
+            if lo >= c1:
+                continue
+            idx = np.arange(lo, c1) % RING_LEN
+            samples = ring[idx]
+            listeners = self._listeners
+            for t, v in samples.tolist():
+                for fn in listeners:
+                    fn(name, v, t)
+            total += len(samples)
+        if lost:
+            if not self._lost:
+                print(f"Shared memory reader fell behind: {lost} sample(s) dropped "
+                      f"(ring holds {RING_LEN} per signal)")
+            self._lost += lost
+        return total
+
+    @property
+    def lost_samples(self) -> int:
+        """Okuyucu geride kaldığı için ring'de ezilen örnekler (bu process)."""
+        return self._lost
+
+    # ── Storage ─────────────────────────────────────────────
+    def _write(self, name: str, v: float, t: float) -> None:
+        if self._readonly:
+            raise PermissionError("SharedSignalStore opened read-only")
+        i = self._slots[name]
+        off = _HEADER.size + i * _SLOT.size
+        count_off = self._count_off + i * _SEQ.size
+        buf = self._buf
+        with self._write_lock:
+            seq = _SEQ.unpack_from(buf, off)[0]
+            _SEQ.pack_into(buf, off, seq + 1)          # tek → yazım sürüyor
+            _VALUE.pack_into(buf, off + 8, v, t)
+            _SEQ.pack_into(buf, off, seq + 2)          # çift → tutarlı
+            # Ring: önce örnek, sonra count (okuyucu count'a kadar okur)
+            count = _SEQ.unpack_from(buf, count_off)[0]
+            _SAMPLE.pack_into(buf, self._ring_off + (i * RING_LEN + count % RING_LEN) * _SAMPLE.size, t, v)
+            _SEQ.pack_into(buf, count_off, count + 1)
+
+    def _read_slot(self, off: int) -> Optional[Tuple[float, float]]:
+        buf = self._buf
+        for _ in range(_MAX_RETRIES):
+            s1, v, t = _SLOT.unpack_from(buf, off)
+            if s1 == 0:
+                return None
+            if s1 & 1:
+                continue
+            if _SEQ.unpack_from(buf, off)[0] == s1:
+                return (v, t)
+        return None
+
+    def _read(self, name: str) -> Optional[Tuple[float, float]]:
+        return self._read_slot(self._offset(name))
+
+    def _read_all(self) -> Dict[str, Tuple[float, float]]:
+        out: Dict[str, Tuple[float, float]] = {}
+        for name in self._slots:
+            sample = self._read_slot(self._offset(name))
+            if sample is not None:
+                out[name] = sample
+        return out
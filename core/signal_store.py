@@ -4,9 +4,18 @@ import math
 import threading
 import time
 from dataclasses import dataclass
-from typing import Dict, Iterable, Tuple, Optional
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Iterable, Tuple, Optional
 
-from core.signals_def import SignalDef
+from core.health import HealthCounters, SignalHealth
+from core.signals_def import SignalDef, SignalDefDiff, diff_defs
+
+if TYPE_CHECKING:
+    from core.staleness import StalenessWatchdog
+
+# update() sonrası çağrılır: (name, value, ts) — producer thread'inde, hızlı olmalı
+UpdateListener = Callable[[str, float, float], None]
+# apply_defs() içinde, store yeni tanımlara geçmeden önce çağrılır: (defs, diff)
+DefsListener = Callable[[Dict[str, SignalDef], SignalDefDiff], None]
 
 
 @dataclass(frozen=True, slots=True)
@@ -23,13 +32,65 @@ class SignalStore:
         self._defs = defs
         self._lock = threading.Lock()
         self._data: Dict[str, Tuple[float, float]] = {}
+        self._listeners: Tuple[UpdateListener, ...] = ()
+        self._defs_listeners: Tuple[DefsListener, ...] = ()
+        self._retired: FrozenSet[str] = frozenset()
+        self._watchdog: Optional[StalenessWatchdog] = None
+        self._health = HealthCounters(defs)
 
     @property
     def defs(self) -> Dict[str, SignalDef]:
         return self._defs
 
+    def add_listener(self, fn: UpdateListener) -> None:
+        # Copy-on-write: update() kilitsiz iterate eder
+        self._listeners = self._listeners + (fn,)
+
+    def remove_listener(self, fn: UpdateListener) -> None:
+        self._listeners = tuple(l for l in self._listeners if l is not fn)
+
+    def add_defs_listener(self, fn: DefsListener) -> None:
+        """Config reload'da yeni sinyaller için yapı hazırlamak üzere çağrılır."""
+        self._defs_listeners = self._defs_listeners + (fn,)
+
+    def remove_defs_listener(self, fn: DefsListener) -> None:
+        self._defs_listeners = tuple(l for l in self._defs_listeners if l is not fn)
+
+    def apply_defs(self, defs: Dict[str, SignalDef]) -> SignalDefDiff:
+        """
+        Tanım setini çalışırken değiştir; acquisition durmaz.
+
+        Önce listener'lar, sayaçlar ve watchdog yeni sinyaller için hazırlanır,
+        sonra tanım dict'i tek atamayla değişir (copy-on-write): yeni sinyaller
+        kabul edilmeye başlar, çıkarılanlar emekli olur ve sessizce atılır.
+        """
+        if not defs:
+            raise ValueError("SignalStore requires non-empty defs")
+        defs = dict(defs)
+        diff = diff_defs(self._defs, defs)
+        if not diff:
+            return diff
+        for fn in self._defs_listeners:
+            fn(defs, diff)
+        self._health.apply_defs(defs)
+        if self._watchdog is not None:
+            self._watchdog.apply_defs(defs)
+        self._retired = (self._retired | frozenset(diff.removed)) - defs.keys()
+        self._defs = defs
+        with self._lock:
+            for name in diff.removed:
+                self._data.pop(name, None)
+        return diff
+
+    def attach_watchdog(self, watchdog: StalenessWatchdog) -> None:
+        """Stale durumu artık watchdog'dan okunur (okuyucular yeniden hesaplamaz)."""
+        self.add_listener(watchdog.touch)
+        self._watchdog = watchdog
+
     def update(self, name: str, value: float, ts: float | None = None) -> None:
         if name not in self._defs:
+            if name in self._retired:
+                return      # config'den çıkarıldı; kaynak hâlâ üretiyor
             raise KeyError(f"Unknown signal: {name}")
 
         try:
@@ -38,35 +99,41 @@ class SignalStore:
             raise ValueError(f"Signal '{name}' value must be numeric") from e
 
         if math.isnan(v) or math.isinf(v):
+            self._health.drop(name)
             return
 
         t = time.monotonic() if ts is None else float(ts)
 
-        with self._lock:
-            self._data[name] = (v, t)
+        self._write(name, v, t)
+        self._health.record(name, v, t)
+
+        for fn in self._listeners:
+            fn(name, v, t)
 
     def get(self, name: str, now: float | None = None) -> SignalValue:
         if name not in self._defs:
             raise KeyError(f"Unknown signal: {name}")
 
-        n = time.monotonic() if now is None else float(now)
-
-        with self._lock:
-            sample = self._data.get(name)
+        sample = self._read(name)
 
         if sample is None:
             return SignalValue(value=None, ts=None, stale=True)
 
         v, ts = sample
-        stale = (n - ts) > self._defs[name].stale_after_s
+        wd = self._watchdog
+        if wd is not None and now is None:
+            stale = wd.is_stale(name)
+        else:
+            n = time.monotonic() if now is None else float(now)
+            stale = (n - ts) > self._defs[name].stale_after_s
         return SignalValue(value=v, ts=ts, stale=stale)
 
     def get_many(self, names: Iterable[str]) -> Dict[str, SignalValue]:
         n = time.monotonic()
+        wd = self._watchdog
         out: Dict[str, SignalValue] = {}
 
-        with self._lock:
-            local = dict(self._data)
+        local = self._read_all()
 
         for name in names:
             if name not in self._defs:
@@ -78,10 +145,38 @@ class SignalStore:
                 continue
 
             v, ts = sample
-            stale = (n - ts) > self._defs[name].stale_after_s
+            if wd is not None:
+                stale = wd.is_stale(name)
+            else:
+                stale = (n - ts) > self._defs[name].stale_after_s
             out[name] = SignalValue(value=v, ts=ts, stale=stale)
 
         return out
 
     def snapshot(self) -> Dict[str, SignalValue]:
         return self.get_many(self._defs.keys())
+
+    # ── Health ──────────────────────────────────────────────
+    def health(self, name: str, now: float | None = None) -> SignalHealth:
+        if name not in self._defs:
+            raise KeyError(f"Unknown signal: {name}")
+        return self._health.get(name, now)
+
+    def health_all(self, now: float | None = None) -> Dict[str, SignalHealth]:
+        return self._health.get_all(now)
+
+    def reset_health(self) -> None:
+        self._health.reset()
+
+    # ── Storage (SharedSignalStore bunları override eder) ─────
+    def _write(self, name: str, v: float, t: float) -> None:
+        with self._lock:
+            self._data[name] = (v, t)
+
+    def _read(self, name: str) -> Optional[Tuple[float, float]]:
+        with self._lock:
+            return self._data.get(name)
+
+    def _read_all(self) -> Dict[str, Tuple[float, float]]:
+        with self._lock:
+            return dict(self._data)
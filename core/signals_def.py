@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
 
 @dataclass(frozen=True, slots=True)
@@ -11,3 +12,29 @@ class SignalDef: #her signal classi
     max: float
     stale_after_s: float
     description: str = ""
+    sources: Tuple[str, ...] = ()   # kaynak önceliği (ilk = primary), boş = ekleme sırası
+    resolution: Optional[float] = None   # arşivde nicemleme adımı, None = kayıpsız float
+
+
+@dataclass(frozen=True, slots=True)
+class SignalDefDiff:
+    """Çalışan tanım seti ile yeni tanım seti arasındaki fark (config reload)."""
+    added: Tuple[str, ...] = ()
+    changed: Tuple[str, ...] = ()     # limit / stale_after_s / unit / kaynak vb. değişti
+    removed: Tuple[str, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def describe(self) -> str:
+        parts = [f"{label} {', '.join(names)}" for label, names in
+                 (("added", self.added), ("changed", self.changed), ("removed", self.removed)) if names]
+        return "; ".join(parts) or "no changes"
+
+
+def diff_defs(old: Dict[str, SignalDef], new: Dict[str, SignalDef]) -> SignalDefDiff:
+    return SignalDefDiff(
+        added=tuple(n for n in new if n not in old),
+        changed=tuple(n for n in new if n in old and new[n] != old[n]),
+        removed=tuple(n for n in old if n not in new),
+    )
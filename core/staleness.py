@@ -0,0 +1,151 @@
+"""
+Staleness Watchdog — sinyal kopmalarını anında tespit eder.
+
+Her sinyal için heap'te tek bir deadline (son_ts + stale_after_s) tutulur.
+Watchdog thread'i en yakın deadline'a kadar uyur; süre dolunca sinyali stale
+işaretler ve fresh→stale event'i yayınlar. Yeni örnek gelince stale→fresh
+event'i yayınlanır. Stale durumu ucuz bir dict okumasıdır; SignalStore
+okuyucuları artık `now - ts` hesaplamaz.
+
+Sıcak yol (`touch`) sinyal fresh iken sadece bir dict yazmasıdır; kilitsiz
+olduğu için watchdog stale bayrağını koyduktan sonra son örneği tekrar okur,
+arada touch düştüyse geçişi geri alır (sahte stale event'i yok).
+Subscriber callback'leri watchdog thread'inde çağrılır.
+
+Config reload'da (`apply_defs`) yeni sinyal stale başlar; değişen
+`stale_after_s` fresh sinyal için hemen yeni deadline kurar; emekli sinyal
+artık izlenmez ve event üretmez.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.signals_def import SignalDef
+
+
+@dataclass(frozen=True, slots=True)
+class StaleEvent:
+    name: str
+    stale: bool      # True = fresh→stale, False = stale→fresh
+    ts: float        # geçiş anı (monotonic)
+
+
+StaleCallback = Callable[[StaleEvent], None]
+
+
+class StalenessWatchdog:
+    def __init__(self, defs: Dict[str, SignalDef]):
+        self._defs = defs
+        self._last: Dict[str, float] = {}
+        self._stale: Dict[str, bool] = {name: True for name in defs}  # hiç gelmedi → stale
+        self._heap: List[Tuple[float, str]] = []
+        self._pending: List[StaleEvent] = []
+        self._subscribers: Tuple[StaleCallback, ...] = ()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, fn: StaleCallback) -> None:
+        self._subscribers = self._subscribers + (fn,)
+
+    def unsubscribe(self, fn: StaleCallback) -> None:
+        self._subscribers = tuple(f for f in self._subscribers if f is not fn)
+
+    def is_stale(self, name: str) -> bool:
+        return self._stale[name]
+
+    def stale_signals(self) -> List[str]:
+        return [name for name, stale in self._stale.items() if stale and name in self._defs]
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="staleness-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def apply_defs(self, defs: Dict[str, SignalDef]) -> None:
+        with self._cond:
+            stale = dict(self._stale)
+            for name, d in defs.items():
+                old = self._defs.get(name)
+                if old is None:
+                    stale[name] = True
+                elif d.stale_after_s != old.stale_after_s and not stale[name]:
+                    # Eski kayıt heap'te kalır; hangisi önce düşerse o geçerli
+                    heapq.heappush(self._heap, (self._last[name] + d.stale_after_s, name))
+            for name in self._defs.keys() - defs.keys():
+                stale[name] = True      # anahtar kalır: geç gelen touch KeyError vermesin
+            self._stale = stale
+            self._defs = defs
+            self._cond.notify()
+
+    def touch(self, name: str, value: float, ts: float) -> None:
+        """SignalStore update listener'ı."""
+        self._last[name] = ts
+        if not self._stale[name]:
+            return
+
+        # stale → fresh: deadline'ı kur, watchdog thread'ine haber ver
+        with self._cond:
+            d = self._defs.get(name)
+            if d is None or not self._stale[name]:
+                return
+            self._stale[name] = False
+            heapq.heappush(self._heap, (ts + d.stale_after_s, name))
+            self._pending.append(StaleEvent(name=name, stale=False, ts=ts))
+            self._cond.notify()
+
+    def _collect(self, now: float) -> List[StaleEvent]:
+        events = self._pending
+        self._pending = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, name = heapq.heappop(heap)
+            d = self._defs.get(name)
+            if d is None or self._stale[name]:
+                continue        # emekli sinyal veya reload'dan kalan kopya kayıt
+            deadline = self._last[name] + d.stale_after_s
+            if deadline > now:
+                # Bu arada yeni örnek geldi → gerçek deadline ile tekrar kur
+                heapq.heappush(heap, (deadline, name))
+            else:
+                self._stale[name] = True
+                # touch kilitsiz: _last yazıp eski (False) _stale'i okumuş olabilir.
+                # Bayrağı koyduktan sonra _last'ı tekrar oku; yeni örnek geldiyse geri al.
+                fresh = self._last[name] + d.stale_after_s
+                if fresh > now:
+                    self._stale[name] = False
+                    heapq.heappush(heap, (fresh, name))
+                    continue
+                events.append(StaleEvent(name=name, stale=True, ts=deadline))
+        return events
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running:
+                    events = self._collect(time.monotonic())
+                    if events:
+                        break
+                    timeout = (self._heap[0][0] - time.monotonic()) if self._heap else None
+                    self._cond.wait(timeout)
+                if not self._running:
+                    return
+
+            for ev in events:
+                for fn in self._subscribers:
+                    fn(ev)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+# above / below: seviye aşıldı, rising / falling: seviyeyi kesen kenar, rate: |dv/dt| > seviye
+TRIGGER_KINDS = ("above", "below", "rising", "falling", "rate")
+
+
+@dataclass(frozen=True, slots=True)
+class TriggerDef: #tek capture tetiği (triggers.yaml)
+    name: str
+    signal: str
+    kind: str
+    level: float
+    hold_s: float = 0.0             # above/below/rate: koşulun sürmesi gereken süre
+    pre_s: float = 0.5
+    post_s: float = 0.5
+    rearm_s: float = 0.0            # tetikten sonra bu süre (en az post_s) tekrar tetiklenmez
+    signals: Tuple[str, ...] = ()   # kaydedilecek sinyaller, boş = hepsi
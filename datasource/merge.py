@@ -0,0 +1,188 @@
+"""
+Merged Data Source — birden fazla veri kaynağını tek SignalStore'a birleştirir.
+
+ECU (CAN), GPS, logger kutusu gibi kaynaklar aynı sinyali (ör. `speed`)
+üretebilir. Her sinyal için öncelik `SignalDef.sources` listesinden gelir
+(boşsa kaynakların eklenme sırası). Primary kaynak `stale_after_s` süresince
+sessiz kalırsa bir sonraki kaynak devralır (failover); primary geri gelince
+tekrar öne geçer.
+
+Her kaynak store yerine kendi `SourceSink`'ine yazar; kaynak kodu değişmez.
+Sıcak yol (aktif kaynağın sink.update'i) kilitsizdir: birkaç dict okuması + bir
+karşılaştırma. Aktif olmayan kaynağın örneğinde failover kararı kilit altında
+verilir (iki kaynak aynı anda devralmasın). NaN/inf örnek kaynağı canlı
+saydırmaz ve failover tetiklemez.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from core.signal_store import SignalStore
+from core.signals_def import SignalDef, SignalDefDiff
+
+
+class ClockAligner:
+    """
+    Kaynağın kendi saatini (GPS epoch, logger uptime) yerel monotonic'e çevirir.
+
+    offset ≈ min(yerel_alış - kaynak_ts): en az gecikmeli örnek en iyi tahmindir.
+    Saat kaymasını (drift) izlemek için offset yavaşça yukarı da sürünür.
+    """
+
+    def __init__(self, creep: float = 1e-3):
+        self._offset: Optional[float] = None
+        self._creep = creep
+
+    @property
+    def offset(self) -> Optional[float]:
+        return self._offset
+
+    def to_local(self, ts: float, now: float) -> float:
+        d = now - ts
+        off = self._offset
+        if off is None or d < off:
+            off = d
+        else:
+            off += (d - off) * self._creep
+        self._offset = off
+        return ts + off
+
+
+class SourceSink:
+    """Tek bir kaynağın gördüğü store arayüzü (`defs` + `update`)."""
+
+    def __init__(self, merge: "MergedDataSource", source: str, align_clock: bool):
+        self._merge = merge
+        self._source = source
+        self._clock = ClockAligner() if align_clock else None
+        self._last_seen: Dict[str, float] = {}
+
+    @property
+    def defs(self) -> Dict[str, SignalDef]:
+        return self._merge.store.defs
+
+    @property
+    def clock(self) -> Optional[ClockAligner]:
+        return self._clock
+
+    def last_seen(self, name: str) -> Optional[float]:
+        """Bu kaynaktan sinyalin son geçerli (sonlu) örneğinin geliş anı."""
+        return self._last_seen.get(name)
+
+    def update(self, name: str, value: float, ts: float | None = None) -> None:
+        now = time.monotonic()
+        if ts is None:
+            ts = now
+        elif self._clock is not None:
+            ts = self._clock.to_local(ts, now)
+
+        try:
+            finite = math.isfinite(value)
+        except TypeError:
+            finite = False
+        if not finite:
+            # Aktif kaynaksa store'a gitsin (drop sayacı / hata); kaynağı canlı saydırmaz
+            if self._merge.active_source(name) == self._source:
+                self._merge.store.update(name, value, ts)
+            return
+
+        self._last_seen[name] = now
+        if self._merge._accept(self._source, name, now):
+            self._merge.store.update(name, value, ts)
+
+
+class MergedDataSource:
+    def __init__(self, store: SignalStore):
+        self.store = store
+        self._order: List[str] = []
+        self._sinks: Dict[str, SourceSink] = {}
+        self._sources: Dict[str, Any] = {}
+        self._active: Dict[str, str] = {}                  # signal -> aktif kaynak
+        self._ranks: Dict[str, Dict[str, int]] = {}        # signal -> {kaynak: rank}
+        self._failover_lock = threading.Lock()
+
+    def add_source(self, name: str, factory: Callable[[SourceSink], Any],
+                   align_clock: bool = False) -> Any:
+        """
+        Kaynak ekle. `factory` sink'i store gibi alıp kaynağı döndürür:
+            merged.add_source("ecu", lambda sink: MockDataSource(sink))
+        `align_clock=True` → kaynak kendi saatiyle ts gönderiyor, hizalanır.
+        """
+        if name in self._sinks:
+            raise ValueError(f"Source '{name}' already added")
+        sink = SourceSink(self, name, align_clock)
+        source = factory(sink)
+        self._order.append(name)
+        self._sinks[name] = sink
+        self._sources[name] = source
+        self._rebuild_ranks()
+        return source
+
+    def source(self, name: str) -> Any:
+        return self._sources[name]
+
+    def active_source(self, signal: str) -> Optional[str]:
+        return self._active.get(signal)
+
+    def apply_defs(self, defs: Dict[str, SignalDef], diff: SignalDefDiff | None = None) -> None:
+        """
+        SignalStore defs listener'ı: kaynak öncelikleri yeni tanımlardan.
+
+        Aktif kaynağı listeden çıkarılan, önceliği düşen veya kendisi çıkarılan
+        sinyalin aktif kaydı silinir; yoksa hızlı yol eski kaynağı kabul etmeye
+        devam ederdi. Sıradaki örnekte seçim yeni sıraya göre yeniden yapılır.
+        """
+        with self._failover_lock:
+            self._rebuild_ranks(defs)
+            ranks = self._ranks
+            # Copy-on-write: _accept'in kilitsiz hızlı yolu eski ya da yeni dict'i görür
+            self._active = {
+                name: src for name, src in self._active.items()
+                if ranks.get(name, {}).get(src) == 0
+            }
+
+    def start(self) -> None:
+        for source in self._sources.values():
+            source.start()
+
+    def stop(self) -> None:
+        for source in self._sources.values():
+            source.stop()
+
+    def _rebuild_ranks(self, defs: Dict[str, SignalDef] | None = None) -> None:
+        ranks: Dict[str, Dict[str, int]] = {}
+        for name, d in (defs or self.store.defs).items():
+            order = d.sources if d.sources else self._order
+            ranks[name] = {src: i for i, src in enumerate(order)}
+        self._ranks = ranks
+
+    def _accept(self, source: str, name: str, now: float) -> bool:
+        if self._active.get(name) == source:
+            return True
+
+        ranks = self._ranks.get(name)
+        if ranks is None:
+            return True   # bilinmeyen sinyal → store KeyError versin
+        rank = ranks.get(source)
+        if rank is None:
+            return False  # bu sinyal için izinli kaynak değil
+
+        with self._failover_lock:
+            # Kilit beklenirken başka kaynak devralmış olabilir → tekrar oku
+            active = self._active.get(name)
+            if active == source:
+                return True
+            if active is None or rank < ranks.get(active, len(ranks)):
+                self._active[name] = source
+                return True
+
+            # Aktif kaynak sessiz mi? → failover
+            last = self._sinks[active].last_seen(name)
+            if last is None or (now - last) > self.store.defs[name].stale_after_s:
+                self._active[name] = source
+                return True
+            return False
@@ -1,17 +1,30 @@
 
-import threading
 import time
 import random
+from core.events import CRITICAL, DTC, FAULT, INFO, MODE, SHIFT, WARN, EventChannel
 from core.signal_store import SignalStore
 from core.lap_timer import LapTimer
+from datasource.scheduler import FixedRateScheduler, SchedulerStats
+
+# Ara sıra gelen sahte DTC'ler (kod, metin) — ortalama DTC_PERIOD_S'de bir
+MOCK_DTCS = (
+    (171, "P0171 System too lean"),
+    (118, "P0118 Coolant temp sensor high"),
+    (562, "P0562 System voltage low"),
+    (335, "P0335 Crank position sensor intermittent"),
+)
+DTC_PERIOD_S = 90.0
 
 class MockDataSource:
-    def __init__(self, store: SignalStore, lap_timer: LapTimer | None = None, interval: float = 0.05):
+    def __init__(self, store: SignalStore, lap_timer: LapTimer | None = None, interval: float = 0.05,
+                 policy: str = "skip", events: EventChannel | None = None):
         self._store = store
         self._lap_timer = lap_timer
+        self._events = events
         self._interval = interval
         self._running = False
-        self._thread: threading.Thread | None = None
+        self._paused = False
+        self._scheduler = FixedRateScheduler(interval, self._step, policy=policy, name="mock-source")
 
         # Simulation state
         self._rpm = 1000.0
@@ -33,112 +46,122 @@ class MockDataSource:
             return
         self._running = True
         self._paused = False
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
         if self._lap_timer:
-            self._lap_timer.start_session()
+            # Checkpoint'ten geri yüklenmiş oturum sıfırlanmasın
+            if not self._lap_timer.started:
+                self._lap_timer.start_session()
             self._next_lap_at = time.monotonic() + random.uniform(25, 45)
+        self._scheduler.start()
         print("Mock Data Source Started.")
 
     def stop(self):
         self._running = False
-        if self._thread:
-            self._thread.join()
+        self._scheduler.stop()
         print("Mock Data Source Stopped.")
 
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
     def pause(self):
         self._paused = True
-        print("Mock Data Source PAUSED (simulating CAN disconnect).")
+        self._emit(MODE, 0, "Mock data source paused (simulating CAN disconnect)")
+        self._emit(FAULT, 1, "ECU CAN timeout", level=CRITICAL)
 
     def resume(self):
         self._paused = False
-        print("Mock Data Source RESUMED.")
-
-    def _run(self):
-        t = 0.0
-        while self._running:
-            if self._paused:
-                time.sleep(self._interval)
-                continue
-
-            start_time = time.monotonic()
-            
-            # 1. TPS: Random walk
-            self._tps += random.uniform(-5, 5)
-            self._tps = max(0.0, min(100.0, self._tps))
-
-            # 2. RPM: Follows TPS with lag + noise
-            target_rpm = 1000 + (self._tps * 120) # Max ~13000
-            diff = target_rpm - self._rpm
-            self._rpm += diff * 0.1 # Lag
-            if self._rpm > 13500: self._rpm = 13500 # Limiter
-            
-            # 3. Gear shifting simulation
-            # Gear ratios (approximate, higher number = lower gear)
-            gear_ratios = [3.5, 2.0, 1.4, 1.0, 0.8, 0.7] # added 6th gear ratio
-            # Ensure gear doesn't exceed ratio list length
-            if self._gear > len(gear_ratios): self._gear = len(gear_ratios)
-            
-            ratio = gear_ratios[self._gear - 1]
-            
-            # Speed: Based on RPM and current gear ratio
-            self._speed = (self._rpm / 13000) * 120 / ratio
-            
-            # Gear shifting logic
-            if self._rpm > 6500 and self._gear < 6: # Updated max gear to 6
-                self._gear += 1
-                print(f"Shifted to gear {self._gear}")
-            elif self._rpm < 2500 and self._gear > 1 and self._speed > 10:  # Don't downshift at low speed
-                self._gear -= 1
-                print(f"Shifted to gear {self._gear}")
+        self._emit(MODE, 1, "Mock data source resumed")
+
+    def _emit(self, type: str, code: int, text: str = "", value: float = 0.0,
+              level: int = INFO) -> None:
+        if self._events:
+            self._events.emit(type, code=code, value=value, text=text, level=level)
+
+    def stats(self) -> SchedulerStats:
+        """Acquisition döngüsü sayaçları (achieved rate, jitter, overrun)."""
+        return self._scheduler.stats()
+
+    def _step(self):
+        # Scheduler her interval'de bir çağırır
+        if self._paused:
+            return
+
+        # 1. TPS: Random walk
+        self._tps += random.uniform(-5, 5)
+        self._tps = max(0.0, min(100.0, self._tps))
+
+        # 2. RPM: Follows TPS with lag + noise
+        target_rpm = 1000 + (self._tps * 120) # Max ~13000
+        diff = target_rpm - self._rpm
+        self._rpm += diff * 0.1 # Lag
+        if self._rpm > 13500: self._rpm = 13500 # Limiter
+        
+        # 3. Gear shifting simulation
+        # Gear ratios (approximate, higher number = lower gear)
+        gear_ratios = [3.5, 2.0, 1.4, 1.0, 0.8, 0.7] # added 6th gear ratio
+        # Ensure gear doesn't exceed ratio list length
+        if self._gear > len(gear_ratios): self._gear = len(gear_ratios)
+        
+        ratio = gear_ratios[self._gear - 1]
+        
+        # Speed: Based on RPM and current gear ratio
+        self._speed = (self._rpm / 13000) * 120 / ratio
+        
+        # Gear shifting logic
+        if self._rpm > 6500 and self._gear < 6: # Updated max gear to 6
+            self._gear += 1
+            self._emit(SHIFT, self._gear, value=self._rpm)
+        elif self._rpm < 2500 and self._gear > 1 and self._speed > 10:  # Don't downshift at low speed
+            self._gear -= 1
+            self._emit(SHIFT, self._gear, value=self._rpm)
            
-            # 4. Coolant: Slow heat up
-            if self._coolant < 90:
-                self._coolant += 0.05
-            else:
-                self._coolant += random.uniform(-0.1, 0.1)
-
-            # 5. Battery: Noise
-            self._battery = 13.8 + random.uniform(-0.2, 0.2)
-            
-            # 6. Lambda: Noise around 1.0
-            self._lambda = 1.0 + random.uniform(-0.05, 0.05)
-
-            # 7. Oil Pressure: Based on RPM
-            # Low RPM (1000) -> ~1.5 bar, High RPM (13000) -> ~5.5 bar
-            target_oil_press = 1.5 + (self._rpm / 3000.0)
-            if target_oil_press > 6.0: target_oil_press = 6.0
-            self._oil_pressure = target_oil_press + random.uniform(-0.1, 0.1)
-
-            # 8. Oil Temp: Follows coolant but slower
-            # Oil takes longer to heat up
-            if self._oil_temp < (self._coolant + 10): # Oil eventually runs hotter than coolant
-                self._oil_temp += 0.02
-            else:
-                self._oil_temp += random.uniform(-0.05, 0.05)
-
-            # 9. Fuel Pressure: Constant ~3.5 bar with noise
-            self._fuel_pressure = 3.5 + random.uniform(-0.1, 0.1)
-
-            # Update Store
-            self._store.update("rpm", self._rpm)
-            self._store.update("speed", self._speed)
-            self._store.update("tps", self._tps)
-            self._store.update("coolant", self._coolant)
-            self._store.update("battery", self._battery)
-            self._store.update("lambda", self._lambda)
-            self._store.update("oil_pressure", self._oil_pressure)
-            self._store.update("oil_temp", self._oil_temp)
-            self._store.update("fuel_pressure", self._fuel_pressure)
-            self._store.update("gear", float(self._gear))
-
-            # 10. Lap timer simulation
-            if self._lap_timer and time.monotonic() >= self._next_lap_at:
-                info = self._lap_timer.complete_lap()
-                if info:
-                    print(f"Lap {info.lap_number}: {self._lap_timer.format_time(info.lap_time)}"
-                          f"{' (PB!)' if info.is_personal_best else ''}")
-                self._next_lap_at = time.monotonic() + random.uniform(25, 45)
-
-            time.sleep(self._interval)
-            t += self._interval
+        # 4. Coolant: Slow heat up
+        if self._coolant < 90:
+            self._coolant += 0.05
+        else:
+            self._coolant += random.uniform(-0.1, 0.1)
+
+        # 5. Battery: Noise
+        self._battery = 13.8 + random.uniform(-0.2, 0.2)
+        
+        # 6. Lambda: Noise around 1.0
+        self._lambda = 1.0 + random.uniform(-0.05, 0.05)
+
+        # 7. Oil Pressure: Based on RPM
+        # Low RPM (1000) -> ~1.5 bar, High RPM (13000) -> ~5.5 bar
+        target_oil_press = 1.5 + (self._rpm / 3000.0)
+        if target_oil_press > 6.0: target_oil_press = 6.0
+        self._oil_pressure = target_oil_press + random.uniform(-0.1, 0.1)
+
+        # 8. Oil Temp: Follows coolant but slower
+        # Oil takes longer to heat up
+        if self._oil_temp < (self._coolant + 10): # Oil eventually runs hotter than coolant
+            self._oil_temp += 0.02
+        else:
+            self._oil_temp += random.uniform(-0.05, 0.05)
+
+        # 9. Fuel Pressure: Constant ~3.5 bar with noise
+        self._fuel_pressure = 3.5 + random.uniform(-0.1, 0.1)
+
+        # Update Store
+        self._store.update("rpm", self._rpm)
+        self._store.update("speed", self._speed)
+        self._store.update("tps", self._tps)
+        self._store.update("coolant", self._coolant)
+        self._store.update("battery", self._battery)
+        self._store.update("lambda", self._lambda)
+        self._store.update("oil_pressure", self._oil_pressure)
+        self._store.update("oil_temp", self._oil_temp)
+        self._store.update("fuel_pressure", self._fuel_pressure)
+        self._store.update("gear", float(self._gear))
+
+        # 10. DTC simulation: nadir, sürücüye uyarı olarak
+        if self._events and random.random() < self._interval / DTC_PERIOD_S:
+            code, text = random.choice(MOCK_DTCS)
+            self._emit(DTC, code, text, level=WARN)
+
+        # 11. Lap timer simulation
+        if self._lap_timer and time.monotonic() >= self._next_lap_at:
+            # Tur olayı LapTimer listener'ı üzerinden event kanalına düşer
+            self._lap_timer.complete_lap()
+            self._next_lap_at = time.monotonic() + random.uniform(25, 45)
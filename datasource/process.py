@@ -0,0 +1,91 @@
+"""
+Acquisition Process — veri kaynaklarını ayrı bir process'te çalıştırır.
+
+UI process'i SharedSignalStore segmentini açar (readonly) ve bu process'i
+başlatır; child aynı segmente bağlanıp MergedDataSource → store.update()
+zincirini kendi interpreter'ında çalıştırır. Böylece pyqtgraph redraw'ları
+veya layout pass'leri acquisition döngüsünü GIL üzerinden geciktirmez.
+
+Not: LapTimer UI process'inde kalır; bu modda mock tur simülasyonu yapılmaz
+(gerçek tetikleyici — GPS / IR beacon — UI tarafına bağlanır).
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from pathlib import Path
+
+
+def _acquisition_main(yaml_path: str, shm_name: str, stop_evt, pause_evt,
+                      record_path: str | None = None) -> None:
+    from core.config_loader import load_signal_defs
+    from core.session_log import SessionRecorder
+    from core.shm_store import SharedSignalStore
+    from datasource.merge import MergedDataSource
+    from datasource.mock import MockDataSource
+
+    defs = load_signal_defs(yaml_path)
+    store = SharedSignalStore(defs, name=shm_name)
+    recorder = None
+    if record_path:
+        recorder = SessionRecorder(record_path, defs)
+        store.add_listener(recorder.record)
+
+    sources = MergedDataSource(store)
+    mock_source = sources.add_source("ecu", lambda sink: MockDataSource(sink))
+    sources.start()
+
+    try:
+        paused = False
+        while not stop_evt.wait(0.05):
+            if pause_evt.is_set() != paused:
+                paused = pause_evt.is_set()
+                if paused:
+                    mock_source.pause()
+                else:
+                    mock_source.resume()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sources.stop()
+        if recorder:
+            recorder.close()
+        store.close()
+
+
+class AcquisitionProcess:
+    """MockDataSource ile aynı start/stop/pause/resume arayüzü."""
+
+    def __init__(self, yaml_path: str | Path, shm_name: str, record_path: str | None = None):
+        self._stop = mp.Event()
+        self._pause = mp.Event()
+        self._proc = mp.Process(
+            target=_acquisition_main,
+            args=(str(yaml_path), shm_name, self._stop, self._pause, record_path),
+            name="acquisition",
+            daemon=True,
+        )
+
+    @property
+    def paused(self) -> bool:
+        return self._pause.is_set()
+
+    def start(self) -> None:
+        self._proc.start()
+        print(f"Acquisition process started (pid {self._proc.pid}).")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        if not self._proc.is_alive():
+            return
+        self._stop.set()
+        self._proc.join(timeout)
+        if self._proc.is_alive():
+            self._proc.terminate()
+            self._proc.join()
+        print("Acquisition process stopped.")
+
+    def pause(self) -> None:
+        self._pause.set()
+
+    def resume(self) -> None:
+        self._pause.clear()
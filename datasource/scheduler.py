@@ -0,0 +1,146 @@
+"""
+Fixed-rate scheduler — veri kaynakları için sabit frekanslı döngü.
+
+Mutlak deadline'lar kullanır: `sleep(interval)` gibi iş süresi kadar kaymaz.
+Gecikme durumunda politika seçilebilir:
+  - "skip":     kaçırılan tick'ler atlanır, bir sonraki grid noktasına hizalanır
+  - "catch_up": kaçırılan tick'ler arka arkaya çalıştırılır (beklemeden)
+
+Mock ve ileride CAN / GPS kaynakları aynı döngüyü kullanır.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+POLICIES = ("skip", "catch_up")
+
+# Jitter histogram kova sınırları (ms) — son kova "> 50 ms"
+JITTER_BUCKETS_MS: Tuple[float, ...] = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0)
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulerStats:
+    nominal_hz: float
+    achieved_hz: float
+    ticks: int
+    overruns: int             # tick işi interval'den uzun sürdü
+    missed_deadlines: int     # atlanan (skip) veya geç çalışan (catch_up) tick'ler
+    max_jitter_ms: float
+    jitter_hist: Tuple[int, ...]  # len(JITTER_BUCKETS_MS) + 1
+
+
+class FixedRateScheduler:
+    def __init__(
+        self,
+        interval: float,
+        tick: Callable[[], None],
+        policy: str = "skip",
+        name: str = "scheduler",
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy '{policy}', expected one of {POLICIES}")
+
+        self._interval = interval
+        self._tick = tick
+        self._policy = policy
+        self._name = name
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._stats_lock = threading.Lock()
+        self._reset_stats()
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._reset_stats()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> SchedulerStats:
+        with self._stats_lock:
+            elapsed = (self._last_tick - self._first_tick) if self._ticks > 1 else 0.0
+            achieved = (self._ticks - 1) / elapsed if elapsed > 0 else 0.0
+            return SchedulerStats(
+                nominal_hz=1.0 / self._interval,
+                achieved_hz=achieved,
+                ticks=self._ticks,
+                overruns=self._overruns,
+                missed_deadlines=self._missed,
+                max_jitter_ms=self._max_jitter * 1000.0,
+                jitter_hist=tuple(self._hist),
+            )
+
+    def _reset_stats(self) -> None:
+        with self._stats_lock:
+            self._ticks = 0
+            self._overruns = 0
+            self._missed = 0
+            self._first_tick = 0.0
+            self._last_tick = 0.0
+            self._max_jitter = 0.0
+            self._hist = [0] * (len(JITTER_BUCKETS_MS) + 1)
+
+    def _record(self, started: float, lateness: float, work: float) -> None:
+        with self._stats_lock:
+            if self._ticks == 0:
+                self._first_tick = started
+            self._last_tick = started
+            self._ticks += 1
+            if work > self._interval:
+                self._overruns += 1
+            if lateness > self._max_jitter:
+                self._max_jitter = lateness
+            self._hist[bisect.bisect_left(JITTER_BUCKETS_MS, lateness * 1000.0)] += 1
+
+    def _run(self) -> None:
+        interval = self._interval
+        deadline = time.monotonic()
+
+        while not self._stop.is_set():
+            now = time.monotonic()
+            if now < deadline:
+                # Event.wait → stop() beklemeden döngüyü kırar
+                if self._stop.wait(deadline - now):
+                    break
+                now = time.monotonic()
+
+            lateness = now - deadline
+            self._tick()
+            work = time.monotonic() - now
+            self._record(now, lateness, work)
+
+            deadline += interval
+            behind = time.monotonic() - deadline
+            if behind > 0:
+                if self._policy == "skip":
+                    # Grid'e hizalı kal: kaçırılan tick'leri atla
+                    missed = int(behind // interval) + 1
+                    deadline += missed * interval
+                else:
+                    # catch_up: sonraki tick geç ama beklemeden çalışacak
+                    missed = 1
+                with self._stats_lock:
+                    self._missed += missed
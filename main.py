@@ -5,35 +5,172 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(BASE_DIR))
 
-from core.config_loader import load_signal_defs
+from core.checkpoint import DEFAULT_MAX_AGE_S, Checkpointer, load_checkpoint, restore_checkpoint
+from core.capture import CaptureManager
+from core.config_loader import load_dashboard_layout, load_signal_defs, load_triggers
+from core.config_watch import SignalConfigWatcher
+from core.events import DTC, FAULT, LAP, MODE, EventChannel
 from core.signal_store import SignalStore
 from core.lap_timer import LapTimer
+from core.lod import SignalHistory
+from core.retention import DEFAULT_BUDGET_BYTES, RetentionManager, RetentionPolicy, format_report
+from core.session_log import SessionRecorder
+from core.staleness import StalenessWatchdog
+from datasource.merge import MergedDataSource
 from datasource.mock import MockDataSource
 
+def _arg_value(flag: str) -> str | None:
+    """`--flag değer` biçimindeki argümanı döndür."""
+    if flag in sys.argv:
+        i = sys.argv.index(flag)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+        sys.exit(f"{flag} requires a value")
+    return None
+
 def main():
     driver_mode = "--driver" in sys.argv
+    process_mode = "--process" in sys.argv
+    record_path = _arg_value("--record")
+    checkpoint_path = _arg_value("--checkpoint")
+    history_mb = _arg_value("--history-mb")
+    spill_path = _arg_value("--spill")
+    triggers_path = _arg_value("--triggers")
+    capture_dir = _arg_value("--capture-dir")
 
     print("Initializing FST ECU Pit UI (Mock Stage)...")
-    defs = load_signal_defs(BASE_DIR / "config" / "signals.yaml")
-    store = SignalStore(defs)
+    signals_yaml = BASE_DIR / "config" / "signals.yaml"
+    defs = load_signal_defs(signals_yaml)
+    # Ekran yerleşimi: sürücüye göre farklı dosya verilebilir
+    layout = load_dashboard_layout(_arg_value("--layout") or BASE_DIR / "config" / "dashboard.yaml", defs)
+
+    # Kayıt varsa pit modunda da turlar işaretlensin (offline tur analizi için)
+    lap_timer = LapTimer() if driver_mode or record_path or checkpoint_path else None
+    # Ayrık olaylar (tur, vites, mod, fault/DTC); konsola sadece seyrek olanlar
+    events = EventChannel()
+    events.subscribe(lambda ev: print(ev.describe()), types=(LAP, MODE, FAULT, DTC))
+    if lap_timer:
+        lap_timer.add_listener(lambda info: events.emit(
+            LAP, code=info.lap_number, value=info.lap_time,
+            text=f"Lap {info.lap_number}: {LapTimer.format_time(info.lap_time)}"
+                 f"{' (PB!)' if info.is_personal_best else ''}",
+        ))
+    history = None
+    retention = None
+    captures = None
+    recorder = None
+    config_watcher = None
+
+    if process_mode:
+        # Acquisition ayrı process'te; UI shared memory'yi readonly okur
+        from core.shm_store import SharedSignalStore
+        from datasource.process import AcquisitionProcess
+
+        store = SharedSignalStore(defs, create=True, readonly=True)
+        sources = mock_source = AcquisitionProcess(signals_yaml, store.shm_name,
+                                                   record_path=record_path)
+    else:
+        store = SignalStore(defs)
+
+    # Process modunda listener'lar shm ring'lerinden beslenir (store.start_follow);
+    # watchdog, geçmiş ve capture iki modda da her örneği görür
+    watchdog = StalenessWatchdog(defs)
+    store.attach_watchdog(watchdog)
+    watchdog.start()
+    if not driver_mode:
+        # Pit UI geçmişi acquisition hızında LOD pyramid'e yazılır
+        history = SignalHistory(defs)
+        store.add_listener(history.append)
+        # Uzun test gününde bellek bütçesi: son N dk ham, öncesi seyrekleşmiş özet
+        policy = RetentionPolicy(
+            budget_bytes=int(float(history_mb) * 1024 * 1024) if history_mb else DEFAULT_BUDGET_BYTES,
+            spill_path=Path(spill_path) if spill_path else None,
+        )
+        retention = RetentionManager(history, defs, policy)
+        retention.start()
+        # Tetiklemeli capture: tetikler her güncellemede, store thread'inde değerlendirilir
+        triggers_yaml = Path(triggers_path) if triggers_path else BASE_DIR / "config" / "triggers.yaml"
+        if triggers_yaml.exists():
+            captures = CaptureManager(defs, load_triggers(triggers_yaml, defs), save_dir=capture_dir)
+            store.add_listener(captures.on_update)
+            captures.start()
+
+    if not process_mode:
+        if record_path:
+            recorder = SessionRecorder(record_path, defs)
+            store.add_listener(recorder.record)
+            if lap_timer:
+                lap_timer.add_listener(lambda info: recorder.mark_lap(info.lap_number))
+            print(f"Recording session to {recorder.path}")
+        # Kaynaklar merge katmanı üzerinden bağlanır (ileride: can, gps, logger)
+        sources = MergedDataSource(store)
+        mock_source = sources.add_source("ecu", lambda sink: MockDataSource(sink, lap_timer=lap_timer,
+                                                                       events=events))
 
-    lap_timer = LapTimer() if driver_mode else None
+        # signals.yaml değişince tanımlar çalışırken güncellenir (restart yok);
+        # yerleşim ve tetiklerin bağlı olduğu sinyaller çıkarılamaz
+        store.add_defs_listener(sources.apply_defs)
+        if history:
+            store.add_defs_listener(history.apply_defs)
+        if captures:
+            store.add_defs_listener(captures.apply_defs)
+        driver, pit = layout.driver, layout.pit
+        pinned = {driver.rpm_signal, *driver.critical, *(w.signal for w in driver.widgets)}
+        if pit.signals != tuple(defs):
+            # Açıkça listelenmiş pit sinyalleri; boş liste (= tüm sinyaller) reload'u izler
+            pinned.update(pit.signals)
+        pinned.update(s for lane in pit.lanes for s in lane)
+        if captures:
+            pinned.update(s for t in captures.triggers for s in (t.signal, *t.signals))
+        config_watcher = SignalConfigWatcher(signals_yaml, store, pinned)
+        config_watcher.start()
 
-    mock_source = MockDataSource(store, lap_timer=lap_timer)
-    mock_source.start()
+    # Çökme sonrası: tur sayısı, PB ve son geçmiş checkpoint'ten geri gelir
+    checkpointer = None
+    if checkpoint_path:
+        cp = load_checkpoint(checkpoint_path, max_age_s=DEFAULT_MAX_AGE_S)
+        if cp:
+            restore_checkpoint(cp, lap_timer, history)
+            print(f"Resumed from checkpoint ({cp.age:.0f}s old, lap {lap_timer.current_lap_number})")
+        checkpointer = Checkpointer(checkpoint_path, lap_timer, history)
+        checkpointer.start()
+    if process_mode:
+        if lap_timer and not lap_timer.started:
+            lap_timer.start_session()
+        store.start_follow()
+    sources.start()
 
     try:
         if driver_mode:
             print("Starting Driver Dashboard...")
             from ui.driver_dashboard import create_driver_ui
-            create_driver_ui(store, lap_timer=lap_timer, mock_source=mock_source)
+            create_driver_ui(store, layout.driver, lap_timer=lap_timer, mock_source=mock_source,
+                             watchdog=watchdog, events=events)
         else:
             print("Starting Pit UI...")
             from ui.main_window import create_ui
-            create_ui(store)
+            create_ui(store, history, layout.pit, captures)
     except KeyboardInterrupt:
         print("\nStopping...")
-        mock_source.stop()
+        sources.stop()
+    finally:
+        if config_watcher:
+            config_watcher.close()
+        if process_mode:
+            sources.stop()
+            store.stop_follow()
+        if checkpointer:
+            checkpointer.close()
+        if captures:
+            captures.close()
+        if retention:
+            retention.close()
+            print(format_report(retention.report()))
+        if recorder:
+            recorder.close()
+        if process_mode:
+            store.close()
+            store.unlink()
 
 if __name__ == "__main__":
     main()
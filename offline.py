@@ -0,0 +1,98 @@
+"""
+Offline araçlar — kayıtlı oturumlar üzerinde UI'sız işlemler.
+
+    python ecu_ui/offline.py export session.fstlog out/ --format parquet --resample 100
+    python ecu_ui/offline.py laps session.fstlog laps.npz --step 1.0
+    python ecu_ui/offline.py archive session.fstlog session.fstarc --chunk 10
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BASE_DIR))
+
+
+def cmd_export(args) -> int:
+    from analysis.export import export_session
+
+    started = time.perf_counter()
+    paths = export_session(args.log, args.out, fmt=args.format, resample_hz=args.resample)
+    for p in paths:
+        print(p)
+    print(f"Exported {len(paths)} file(s) in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+def cmd_laps(args) -> int:
+    from analysis.laps import GpsGate, analyze_session
+
+    gate = None
+    if args.gate:
+        try:
+            lat, lon, radius = (float(x) for x in args.gate.split(","))
+        except ValueError:
+            print("--gate must be LAT,LON,RADIUS_M", file=sys.stderr)
+            return 2
+        gate = GpsGate(lat, lon, radius)
+
+    started = time.perf_counter()
+    result = analyze_session(args.log, step_m=args.step, gate=gate, workers=args.workers)
+    result.save(args.out)
+    elapsed = time.perf_counter() - started
+
+    from core.lap_timer import LapTimer
+    for i, (n, t) in enumerate(zip(result.lap_numbers, result.lap_times)):
+        mark = "  (ref)" if i == result.reference else ""
+        print(f"Lap {n:3d}: {LapTimer.format_time(float(t))}{mark}")
+    print(f"{len(result.lap_numbers)} laps, {len(result.corner_distance)} corners "
+          f"→ {args.out} in {elapsed:.2f}s")
+    return 0
+
+
+def cmd_archive(args) -> int:
+    from core.archive import archive_session
+
+    started = time.perf_counter()
+    out = archive_session(args.log, args.out, chunk_s=args.chunk)
+    raw, packed = Path(args.log).stat().st_size, out.stat().st_size
+    print(f"{raw / 1e6:.1f} MB → {packed / 1e6:.1f} MB ({raw / max(packed, 1):.1f}x) "
+          f"→ {out} in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="FST ECU offline tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("export", help="Session log → CSV / Parquet")
+    p.add_argument("log", help="Kayıtlı oturum (.fstlog)")
+    p.add_argument("out", help="Çıktı klasörü")
+    p.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    p.add_argument("--resample", type=float, metavar="HZ",
+                   help="Tüm sinyalleri ortak zaman tabanına örnekle (tek dosya)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("laps", help="Tur karşılaştırma analizi → .npz")
+    p.add_argument("log", help="Kayıtlı oturum (.fstlog)")
+    p.add_argument("out", help="Çıktı dosyası (.npz)")
+    p.add_argument("--step", type=float, default=1.0, help="Mesafe ekseni adımı (m)")
+    p.add_argument("--gate", metavar="LAT,LON,RADIUS_M",
+                   help="Tur işaretleri yerine GPS gate ile turlara böl")
+    p.add_argument("--workers", type=int, help="Process sayısı (varsayılan: CPU sayısı)")
+    p.set_defaults(func=cmd_laps)
+
+    p = sub.add_parser("archive", help="Session log → sıkıştırılmış arşiv (.fstarc)")
+    p.add_argument("log", help="Kayıtlı oturum (.fstlog)")
+    p.add_argument("out", help="Çıktı dosyası (.fstarc)")
+    p.add_argument("--chunk", type=float, default=10.0, help="Chunk süresi (s)")
+    p.set_defaults(func=cmd_archive)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
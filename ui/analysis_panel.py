@@ -0,0 +1,173 @@
+"""
+Analysis panel — seçili sinyalin görünen penceresi için FFT / histogram / kayan istatistik.
+
+Hesap hiçbir zaman Qt thread'inde yapılmaz: istek AnalysisPool'a gider, sonuç
+worker thread'inden köprü sinyaliyle UI thread'ine döner. Görünüm değişince
+bekleyen işler iptal edilir; sadece son isteğin sonucu çizilir.
+
+Canlı takipte pencere her frame kayar; pencere sınırları `WINDOW_STEP_S`'e
+yuvarlanır ve istek `DEBOUNCE_MS` bekletilir → saniyede birkaç iş, aynı
+pencere önbellekten gelir.
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import Future
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QVBoxLayout, QWidget
+
+from analysis.worker import AnalysisPool, AnalysisResult
+from core.lod import SignalHistory
+from core.signals_def import SignalDef
+
+WINDOW_STEP_S = 0.5
+DEBOUNCE_MS = 250
+ROLLING_WINDOW_S = 1.0
+HIST_BINS = 50
+
+KIND_LABELS = (("fft", "FFT"), ("histogram", "Histogram"), ("rolling", "Rolling stats"))
+
+
+class _ResultBridge(QObject):
+    """Worker thread'inde biten Future'ı UI thread'ine taşır."""
+
+    done = Signal(object)
+
+    def on_done(self, fut: Future) -> None:
+        self.done.emit(fut)
+
+
+class AnalysisPanel(QWidget):
+    def __init__(self, defs: Dict[str, SignalDef], history: SignalHistory,
+                 signals: Sequence[str], t_offset: float = 0.0, parent=None):
+        super().__init__(parent)
+        self._defs = defs
+        self._t_offset = t_offset
+        self._pool = AnalysisPool(history)
+        self._bridge = _ResultBridge()
+        self._bridge.done.connect(self._on_done)
+        self._window: Optional[Tuple[float, float]] = None
+        self._pending: Optional[Future] = None
+
+        self.kind_box = QComboBox()
+        for kind, label in KIND_LABELS:
+            self.kind_box.addItem(label, kind)
+        self.signal_box = QComboBox()
+        self.status = QLabel("")
+        self.plot = pg.PlotWidget()
+        self.plot.showGrid(x=True, y=True)
+        self._main = self.plot.plot(pen='y')
+        self._low = self.plot.plot(pen=pg.mkPen('c', width=1))
+        self._high = self.plot.plot(pen=pg.mkPen('c', width=1))
+
+        controls = QHBoxLayout()
+        controls.addWidget(self.kind_box)
+        controls.addWidget(self.signal_box, 1)
+        controls.addWidget(self.status)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.addLayout(controls)
+        layout.addWidget(self.plot, 1)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._submit)
+        self.kind_box.currentIndexChanged.connect(self._schedule)
+        self.signal_box.currentIndexChanged.connect(self._schedule)
+        self.set_signals(signals)
+
+    # ── Public ──────────────────────────────────────────────
+    def set_defs(self, defs: Dict[str, SignalDef]) -> None:
+        """Config reload: histogram aralığı yeni min/max'tan."""
+        self._defs = defs
+        self._schedule()
+
+    def set_signals(self, signals: Sequence[str]) -> None:
+        current = self.signal_box.currentText()
+        self.signal_box.blockSignals(True)
+        self.signal_box.clear()
+        self.signal_box.addItems(list(signals))
+        if current in signals:
+            self.signal_box.setCurrentText(current)
+        self.signal_box.blockSignals(False)
+        self._schedule()
+
+    def set_window(self, t0: float, t1: float) -> None:
+        """Görünen aralık (monotonic). Adım değişmediyse iş açılmaz."""
+        window = (math.floor(t0 / WINDOW_STEP_S) * WINDOW_STEP_S,
+                  math.ceil(t1 / WINDOW_STEP_S) * WINDOW_STEP_S)
+        if window != self._window:
+            self._window = window
+            self._schedule()
+
+    def close_pool(self) -> None:
+        self._timer.stop()
+        self._pending = None
+        self._pool.close()
+
+    # ── İş akışı ────────────────────────────────────────────
+    def _schedule(self) -> None:
+        # Yeni görünüm: eski işler artık anlamsız
+        self._pool.cancel_all()
+        self._pending = None
+        self._timer.start(DEBOUNCE_MS)
+
+    def _submit(self) -> None:
+        sig = self.signal_box.currentText()
+        if not sig or self._window is None:
+            return
+        kind = self.kind_box.currentData()
+        if kind == "histogram":
+            d = self._defs[sig]
+            params = {"bins": HIST_BINS, "range": (d.min, d.max)}
+        elif kind == "rolling":
+            params = {"window_s": ROLLING_WINDOW_S}
+        else:
+            params = {}
+        fut = self._pool.submit(kind, sig, *self._window, params)
+        self._pending = fut
+        fut.add_done_callback(self._bridge.on_done)
+
+    def _on_done(self, fut: Future) -> None:
+        if fut is not self._pending or fut.cancelled():
+            return
+        self._pending = None
+        exc = fut.exception()
+        if exc is not None:
+            self.status.setText(f"error: {exc}")
+            return
+        self._show(fut.result())
+
+    def _show(self, r: AnalysisResult) -> None:
+        unit = self._defs[r.signal].unit
+        x = r.x
+        self._low.setData([], [])
+        self._high.setData([], [])
+        if r.kind == "fft":
+            self._main.setData(x, r.series["amplitude"], stepMode=None, fillLevel=None)
+            self.plot.setLabel('bottom', 'Frequency (Hz)')
+            self.plot.setLabel('left', f"Amplitude ({unit})")
+            info = f", peak {x[1:][np.argmax(r.series['amplitude'][1:])]:.2f} Hz" if len(x) > 1 else ""
+        elif r.kind == "histogram":
+            width = x[1] - x[0] if len(x) > 1 else 1.0
+            edges = np.append(x - width / 2, x[-1] + width / 2) if len(x) else np.empty(0)
+            self._main.setData(edges, r.series["count"], stepMode="center",
+                               fillLevel=0, brush=(255, 255, 0, 80))
+            self.plot.setLabel('bottom', f"{r.signal} ({unit})")
+            self.plot.setLabel('left', 'Count')
+            info = ""
+        else:
+            t = x - self._t_offset
+            self._main.setData(t, r.series["mean"], stepMode=None, fillLevel=None)
+            self._low.setData(t, r.series["min"])
+            self._high.setData(t, r.series["max"])
+            self.plot.setLabel('bottom', 'Time (s)')
+            self.plot.setLabel('left', f"{r.signal} ({unit})")
+            info = f", σ {np.mean(r.series['std']):.3g}" if len(t) else ""
+        src = "raw" if r.level == 0 else f"LOD {r.level}"
+        self.status.setText(f"{r.n_samples} samples ({src}){info}")
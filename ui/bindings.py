@@ -0,0 +1,87 @@
+"""
+Widget bindings — layout tanımlarını başlangıçta düz kayıtlara derler.
+
+Her gösterge bir `Binding` olur: hangi sinyal, hazır formatter ve durum başına
+(stale / normal / warn) önceden üretilmiş stylesheet tablosu. Refresh döngüsü
+bu kayıtları sırayla gezer; stylesheet sadece durum değişince, metin sadece
+değişince Qt'ye verilir.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Tuple
+
+from PySide6.QtWidgets import QLabel
+
+from core.layout_def import WidgetDef
+from core.signal_store import SignalValue
+
+STATE_STALE = 0
+STATE_NORMAL = 1
+STATE_WARN = 2
+
+
+def label_style(color: str, size: int, weight: int, family: str) -> str:
+    return f"""
+        color: {color};
+        font-size: {size}px;
+        font-family: {family};
+        font-weight: {weight};
+    """
+
+
+def compile_formatter(fmt: str) -> Callable[[float], str]:
+    if fmt == "gear":
+        return lambda v: str(int(v)) if int(v) > 0 else "N"
+    if ":d}" in fmt:
+        # Tamsayı kalıbı: eski davranış gibi kırp (int())
+        return lambda v: fmt.format(int(v))
+    return fmt.format
+
+
+@dataclass(slots=True)
+class Binding:
+    label: QLabel
+    signal: str
+    format: Callable[[float], str]
+    stale_text: str
+    warn_above: float
+    warn_below: float
+    styles: Tuple[str, str, str]     # STATE_* ile indekslenir
+    state: int = -1
+    text: str = ""
+
+    def apply(self, sample: SignalValue) -> None:
+        v = sample.value
+        if sample.stale or v is None:
+            state = STATE_STALE
+            text = self.stale_text
+        else:
+            state = STATE_WARN if (v > self.warn_above or v < self.warn_below) else STATE_NORMAL
+            text = self.format(v)
+
+        if state != self.state:
+            self.label.setStyleSheet(self.styles[state])
+            self.state = state
+        if text != self.text:
+            self.label.setText(text)
+            self.text = text
+
+
+def compile_binding(wd: WidgetDef, label: QLabel, family: str, stale_color: str) -> Binding:
+    normal = label_style(wd.color, wd.font_size, wd.weight, family)
+    return Binding(
+        label=label,
+        signal=wd.signal,
+        format=compile_formatter(wd.format),
+        stale_text=wd.stale_text,
+        warn_above=math.inf if wd.warn_above is None else wd.warn_above,
+        warn_below=-math.inf if wd.warn_below is None else wd.warn_below,
+        styles=(
+            label_style(stale_color, wd.font_size, wd.weight, family),
+            normal,
+            label_style(wd.warn_color, wd.font_size, 700, family),
+        ),
+    )
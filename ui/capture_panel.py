@@ -0,0 +1,89 @@
+"""
+Capture panel — tetiklemeli capture'ların listesi ve anında inceleme.
+
+Yeni capture worker thread'inde hazır olur, köprü sinyaliyle UI thread'ine
+gelir ve listenin başına eklenir; liste manager'ın sınırında (max_captures)
+tutulur, en eski capture ve verisi düşer. Seçilen capture LanePlot'ta çizilir
+(Capture.query SignalHistory ile aynı imzada; ham örnekler, zaman tetik
+anına göre); tetik anı dikey çizgiyle işaretlenir.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence
+
+import pyqtgraph as pg
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtWidgets import QListWidget, QListWidgetItem, QSplitter, QVBoxLayout, QWidget
+
+from core.capture import Capture, CaptureManager
+from core.signals_def import SignalDef
+from ui.lane_plot import LanePlot
+
+
+class _CaptureBridge(QObject):
+    """Capture worker thread'inden gelen capture'ları UI thread'ine taşır."""
+
+    added = Signal(object)
+
+    def on_capture(self, cap: Capture) -> None:
+        self.added.emit(cap)
+
+
+class CapturePanel(QWidget):
+    def __init__(self, defs: Dict[str, SignalDef], manager: CaptureManager,
+                 groups: Sequence[Sequence[str]] = (), parent=None):
+        super().__init__(parent)
+        self._manager = manager
+        self._defs = dict(defs)
+        self._captures: List[Capture] = []
+
+        self.list = QListWidget()
+        self.list.currentRowChanged.connect(self._on_select)
+        self.plot = LanePlot(defs, [], groups)
+        self.plot.setLabel('bottom', 'Time from trigger (s)')
+        self.plot.addItem(pg.InfiniteLine(pos=0.0, angle=90, pen=pg.mkPen('r', style=Qt.PenStyle.DashLine)))
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        splitter.addWidget(self.list)
+        splitter.addWidget(self.plot)
+        splitter.setStretchFactor(1, 1)
+        splitter.setSizes([260, 900])
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.addWidget(splitter)
+
+        self._bridge = _CaptureBridge()
+        self._bridge.added.connect(self._add)
+        for cap in manager.captures():
+            self._add(cap)
+        manager.add_listener(self._bridge.on_capture)
+
+    def set_defs(self, defs: Dict[str, SignalDef]) -> None:
+        """Config reload: çıkarılan sinyaller eski capture'lar için tanımlı kalır."""
+        self._defs = {**self._defs, **defs}
+        self.plot.set_defs(self._defs)
+
+    def detach(self) -> None:
+        self._manager.remove_listener(self._bridge.on_capture)
+
+    def _add(self, cap: Capture) -> None:
+        # En yeni üstte
+        self._captures.insert(0, cap)
+        text = cap.describe() + ("  [truncated]" if cap.truncated else "")
+        self.list.insertItem(0, QListWidgetItem(text))
+        # Manager ile aynı sınır: düşen capture'ın dondurulmuş penceresi bellekte kalmasın
+        while len(self._captures) > self._manager.max_captures:
+            self._captures.pop()
+            self.list.takeItem(self.list.count() - 1)
+        if self.list.currentRow() <= 0:
+            self.list.setCurrentRow(0)
+
+    def _on_select(self, row: int) -> None:
+        if not 0 <= row < len(self._captures):
+            return
+        cap = self._captures[row]
+        tr = cap.trigger
+        self.plot.set_signals(cap.signals)
+        self.plot.set_x_range(-tr.pre_s, tr.post_s)
+        self.plot.update_traces(cap, cap.t0, cap.t1, self.plot.plot_width(), cap.ts)
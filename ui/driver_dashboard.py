@@ -2,21 +2,32 @@
 Driver Dashboard — sürücü ekranı (v2 – professional motorsport design).
 
 Sadece SignalStore'dan okur; veri kaynağı (mock / CAN) soyutlanmıştır.
+
+Layout'ta `frame_rate` açıksa RPM bar ve tur saati ayrı bir frame saatiyle
+(mutlak deadline, geç kalınca frame atlanır) 60 Hz / ekran hızında çizilir;
+kalan göstergeler 20 Hz tick'te kalır. `interpolate` listesindeki sinyaller
+store zaman damgalarıyla son iki örnek arasında interpolasyonla gösterilir.
+RPM bar arka planı pixmap'te önbelleklenir; dolu segment sayısı değişince
+sadece eski ile yeni uç arasındaki segmentler yeniden çizilir. Tur saati ve
+delta glyph önbellekli etiketlerdir (GlyphLabel), sadece değişen rakamlar çizilir.
 """
 
 from __future__ import annotations
 
 import sys
-from typing import Dict, List
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QTimer, QRectF
+from PySide6.QtCore import QObject, Qt, QTimer, QRectF, Signal
 from PySide6.QtGui import (
     QColor,
     QFont,
     QFontDatabase,
+    QFontMetrics,
     QLinearGradient,
     QPainter,
     QPen,
+    QPixmap,
 )
 from PySide6.QtWidgets import (
     QApplication,
@@ -29,8 +40,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from core.signal_store import SignalStore
+from core.layout_def import DriverLayout
+from core.signal_store import SignalStore, SignalValue
 from core.lap_timer import LapTimer
+from core.events import CRITICAL, WARN, Event, EventChannel
+from core.staleness import StaleEvent, StalenessWatchdog
+from ui.bindings import Binding, compile_binding
 
 # ── Lap display colors ──────────────────────────────────────
 CLR_LAP_TIME  = "#AAAAAA"
@@ -38,6 +53,14 @@ CLR_DELTA_POS = "#CC1100"      # kırmızı — PB'den yavaş
 CLR_DELTA_NEG = "#1DB954"      # yeşil — PB'den hızlı
 CLR_PB_FLASH  = "#B266FF"      # mor — yeni PB
 CLR_STALE     = "#331111"      # koyu kırmızı — stale veri
+CLR_EVT_WARN  = "#F5A623"      # amber — uyarı olayı
+CLR_EVT_CRIT  = "#CC0000"      # kırmızı — kritik olay (fault / DTC)
+
+EVENT_FLASH_MS = 3000          # uyarı banner'ının ekranda kalma süresi
+EVENT_BLINK_MS = 250
+
+REFRESH_MS = 50                # göstergeler (20 Hz)
+DEFAULT_FRAME_HZ = 60.0        # ekran yenileme hızı okunamazsa
 
 # ── Colour palette ──────────────────────────────────────────
 CLR_BG        = "#0A0A0A"
@@ -81,65 +104,105 @@ def _seg_color(ratio: float) -> QColor:
     return SEG_COLORS[-1][1]
 
 
+def _set_label(label: QLabel, text: str, style: str) -> None:
+    """Stil / metin sadece değişince uygulanır (setStyleSheet tüm stil çözümünü tekrarlar)."""
+    if label.styleSheet() != style:
+        label.setStyleSheet(style)
+    if label.text() != text:
+        label.setText(text)
+
+
 # ── RPM Bar Widget ──────────────────────────────────────────
 class RPMBar(QWidget):
     """Professional gradient RPM bar with tick marks."""
 
-    def __init__(self, parent=None):
+    SEGMENTS = 70
+    GAP = 2
+
+    def __init__(self, rpm_max: float = RPM_MAX, redline: float = RPM_REDLINE, parent=None):
         super().__init__(parent)
         self._rpm = 0.0
+        self._filled = 0
+        self._rpm_max = rpm_max
+        self._redline = redline
+        self._background: Optional[QPixmap] = None   # boş segmentler + tick'ler
+        self._colors = [_seg_color(i / self.SEGMENTS) for i in range(self.SEGMENTS)]
         self.setMinimumHeight(48)
         self.setMaximumHeight(56)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
 
     def set_rpm(self, rpm: float) -> None:
-        self._rpm = max(0.0, min(RPM_MAX, rpm))
-        self.update()
-
-    def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing)
-
+        self._rpm = max(0.0, min(self._rpm_max, rpm))
+        filled = int((self._rpm / self._rpm_max) * self.SEGMENTS)
+        # Segment sayısı değişmediyse piksel de değişmez → repaint yok;
+        # değiştiyse sadece eski ile yeni dolu uç arasındaki segmentler kirli
+        if filled != self._filled:
+            lo, hi = sorted((filled, self._filled))
+            self._filled = filled
+            bar_h = self.height() - 18
+            r = self._segment_rect(lo, bar_h).united(self._segment_rect(hi - 1, bar_h))
+            self.update(r.toAlignedRect().adjusted(-1, 0, 1, 0))
+
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+
+    def _segment_rect(self, i: int, bar_h: int) -> QRectF:
+        seg_w = (self.width() - (self.SEGMENTS - 1) * self.GAP) / self.SEGMENTS
+        return QRectF(i * (seg_w + self.GAP), 2, seg_w, bar_h - 4)
+
+    def _render_background(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pm = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pm.setDevicePixelRatio(dpr)
         w = self.width()
-        h = self.height()
-        bar_y = 0
-        bar_h = h - 18  # tick label alanı için altta boşluk
-
-        # Background
-        p.fillRect(0, 0, w, h, QColor(CLR_BG))
-
-        # Segments
-        total = 70
-        gap = 2
-        seg_w = (w - (total - 1) * gap) / total
-        filled = int((self._rpm / RPM_MAX) * total)
+        bar_h = self.height() - 18  # tick label alanı için altta boşluk
 
-        for i in range(total):
-            x = i * (seg_w + gap)
-            ratio = i / total
-
-            if i < filled:
-                color = _seg_color(ratio)
-            else:
-                color = QColor(CLR_DIM)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.fillRect(0, 0, w, self.height(), QColor(CLR_BG))
 
-            p.fillRect(QRectF(x, bar_y + 2, seg_w, bar_h - 4), color)
+        dim = QColor(CLR_DIM)
+        for i in range(self.SEGMENTS):
+            p.fillRect(self._segment_rect(i, bar_h), dim)
 
         # Tick marks ve labels
         p.setPen(QPen(QColor(CLR_TICK), 1))
-        tick_font = QFont(FONT_FAMILY, 8)
-        p.setFont(tick_font)
-
-        for rpm_val in range(0, RPM_MAX + 1, 2000):
-            x = (rpm_val / RPM_MAX) * w
+        p.setFont(QFont(FONT_FAMILY, 8))
+        for rpm_val in range(0, int(self._rpm_max) + 1, 2000):
+            x = (rpm_val / self._rpm_max) * w
             p.drawLine(int(x), bar_h, int(x), bar_h + 4)
             label = str(rpm_val // 1000) if rpm_val >= 1000 else "0"
             p.drawText(QRectF(x - 12, bar_h + 4, 24, 14),
                        Qt.AlignmentFlag.AlignCenter, label)
+        p.end()
+        return pm
+
+    def _background_src(self, rect: QRectF) -> QRectF:
+        dpr = self._background.devicePixelRatio()
+        return QRectF(rect.x() * dpr, rect.y() * dpr, rect.width() * dpr, rect.height() * dpr)
+
+    def paintEvent(self, event):
+        if self._background is None:
+            self._background = self._render_background()
+
+        clip = QRectF(event.rect())
+        p = QPainter(self)
+        p.drawPixmap(clip, self._background, self._background_src(clip))
+        bar_h = self.height() - 18
+
+        # Sadece kirli alana düşen dolu segmentler
+        seg_w = (self.width() - (self.SEGMENTS - 1) * self.GAP) / self.SEGMENTS
+        step = seg_w + self.GAP
+        first = max(0, int(clip.left() // step))
+        last = min(self._filled, int(clip.right() // step) + 1)
+        for i in range(first, last):
+            p.fillRect(self._segment_rect(i, bar_h), self._colors[i])
 
         # Redline marker: ince kırmızı çizgi
-        rl_x = (RPM_REDLINE / RPM_MAX) * w
+        rl_x = (self._redline / self._rpm_max) * self.width()
         p.setPen(QPen(QColor("#CC1100"), 2))
-        p.drawLine(int(rl_x), bar_y, int(rl_x), bar_h)
+        p.drawLine(int(rl_x), 0, int(rl_x), bar_h)
 
         p.end()
 
@@ -177,6 +240,98 @@ class WarningIndicator(QWidget):
         p.end()
 
 
+# ── Glyph label (tur saati / delta) ─────────────────────────
+class GlyphLabel(QWidget):
+    """Sabit boyutlu, glyph önbellekli etiket — tur saati ve delta.
+
+    Bu metinler her frame / tick'te değişir: QLabel.setText her seferinde
+    layout'u yeniden hesaplatır, drawText de metni her çağrıda yeniden dizer.
+    Burada boyut `template`'ten bir kez sabitlenir ve her (renk, karakter) bir
+    kez pixmap'e çizilip önbelleklenir. Rakamlar eşit genişlikte (tabular) →
+    metin akarken kaymaz; metin değişince sadece ilk farklı karakterden
+    sonrası yeniden çizilir (tipik olarak son 1-2 rakam: birkaç drawPixmap).
+    """
+
+    def __init__(self, text: str, color: str, font_px: int, template: str,
+                 weight: QFont.Weight = QFont.Weight.Normal, parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._color = QColor(color)
+        self._bg = QColor(CLR_BG)
+        self._font = QFont(FONT_FAMILY)
+        self._font.setStyleHint(QFont.StyleHint.Monospace)
+        self._font.setPixelSize(font_px)
+        self._font.setWeight(weight)
+        self._fm = QFontMetrics(self._font)
+        self._digit_w = max(self._fm.horizontalAdvance(d) for d in "0123456789")
+        self._glyphs: Dict[Tuple[int, str], QPixmap] = {}
+        self._widths: Dict[str, int] = {}
+        self.setFixedSize(self._advance(template) + 4, self._fm.height() + 4)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def _char_w(self, ch: str) -> int:
+        w = self._widths.get(ch)
+        if w is None:
+            w = self._digit_w if ch.isdigit() else self._fm.horizontalAdvance(ch)
+            self._widths[ch] = w
+        return w
+
+    def _advance(self, text: str) -> int:
+        return sum(self._char_w(ch) for ch in text)
+
+    def _glyph(self, ch: str) -> QPixmap:
+        key = (self._color.rgb(), ch)
+        pm = self._glyphs.get(key)
+        if pm is None:
+            dpr = self.devicePixelRatioF()
+            w, h = self._char_w(ch), self._fm.height()
+            pm = QPixmap(int(w * dpr), int(h * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(self._bg)
+            p = QPainter(pm)
+            p.setFont(self._font)
+            p.setPen(self._color)
+            p.drawText(QRectF(0, 0, w, h), Qt.AlignmentFlag.AlignCenter, ch)
+            p.end()
+            self._glyphs[key] = pm
+        return pm
+
+    def text(self) -> str:
+        return self._text
+
+    def set_text(self, text: str, color: str | None = None) -> None:
+        if color is not None and QColor(color) != self._color:
+            self._color = QColor(color)
+            self._text = text
+            self.update()
+            return
+        old = self._text
+        if text == old:
+            return
+        self._text = text
+        # Ortak önek aynı piksellerde kalır → sadece sonrası kirli
+        i = 0
+        for a, b in zip(old, text):
+            if a != b:
+                break
+            i += 1
+        x = 2 + self._advance(text[:i])
+        self.update(x, 0, self.width() - x, self.height())
+
+    def paintEvent(self, event):
+        clip = event.rect()
+        left = clip.left()
+        p = QPainter(self)
+        p.fillRect(clip, self._bg)
+        x, y = 2, (self.height() - self._fm.height()) // 2
+        for ch in self._text:
+            w = self._char_w(ch)
+            if x + w > left:
+                p.drawPixmap(x, y, self._glyph(ch))
+            x += w
+        p.end()
+
+
 # ── Battery Bar Placeholder ─────────────────────────────────
 class BatteryBar(QWidget):
     """İnce akü göstergesi."""
@@ -210,13 +365,109 @@ class BatteryBar(QWidget):
         p.end()
 
 
+# ── Watchdog → Qt thread köprüsü ────────────────────────────
+class _StaleBridge(QObject):
+    """Watchdog thread'inden gelen event'leri UI thread'ine taşır."""
+
+    changed = Signal(str, bool)
+
+    def on_event(self, ev: StaleEvent) -> None:
+        self.changed.emit(ev.name, ev.stale)
+
+
+class _EventBridge(QObject):
+    """Üretici thread'inden gelen uyarı olaylarını UI thread'ine taşır."""
+
+    raised = Signal(object)
+
+    def on_event(self, ev: Event) -> None:
+        self.raised.emit(ev)
+
+
+# ── Interpolasyon / frame saati ─────────────────────────────
+class _SampleInterp:
+    """Son iki örnek arasında doğrusal interpolasyon (store zaman damgalarıyla).
+
+    Gösterim bir örnek periyodu geriden gelir: yeni örnek geldiğinde önceki
+    değerden başlanır, bir periyot içinde yeni değere varılır → basamak yok.
+    """
+
+    __slots__ = ("t0", "v0", "t1", "v1")
+
+    def __init__(self):
+        self.t0 = self.v0 = self.t1 = self.v1 = None
+
+    def push(self, s: SignalValue) -> None:
+        if s.ts is None or s.ts == self.t1:
+            return
+        self.t0, self.v0 = self.t1, self.v1
+        self.t1, self.v1 = s.ts, s.value
+
+    def at(self, now: float) -> Optional[float]:
+        if self.t0 is None or self.t1 <= self.t0:
+            return self.v1
+        a = (now - self.t1) / (self.t1 - self.t0)
+        a = 0.0 if a < 0.0 else 1.0 if a > 1.0 else a
+        return self.v0 + (self.v1 - self.v0) * a
+
+
+class _FramePacer(QObject):
+    """Mutlak deadline'lı frame saati (FixedRateScheduler'ın UI thread'i karşılığı).
+
+    Her frame sonraki deadline'a single-shot PreciseTimer kurar; geç kalınırsa
+    kaçırılan frame'ler atlanır (skip), art arda çizim yapılmaz.
+    """
+
+    def __init__(self, hz: float, frame: Callable[[float], None], parent=None):
+        super().__init__(parent)
+        self._period = 1.0 / hz
+        self._frame = frame
+        self._deadline = 0.0
+        self.frames = 0
+        self.dropped = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def hz(self) -> float:
+        return 1.0 / self._period
+
+    def start(self) -> None:
+        self._deadline = time.monotonic()
+        self._timer.start(0)
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        self._frame(now)
+        self.frames += 1
+
+        self._deadline += self._period
+        behind = time.monotonic() - self._deadline
+        if behind > 0:
+            missed = int(behind // self._period) + 1
+            self._deadline += missed * self._period
+            self.dropped += missed
+        self._timer.start(max(0, int((self._deadline - time.monotonic()) * 1000)))
+
+
 # ── Main Dashboard Window ───────────────────────────────────
 class DriverDashboard(QMainWindow):
-    def __init__(self, store: SignalStore, lap_timer: LapTimer | None = None, mock_source=None):
+    def __init__(self, store: SignalStore, layout: DriverLayout, lap_timer: LapTimer | None = None,
+                 mock_source=None, watchdog: StalenessWatchdog | None = None,
+                 events: EventChannel | None = None):
         super().__init__()
         self.store = store
+        self._layout = layout
+        self._critical = layout.critical
         self.lap_timer = lap_timer
         self._mock_source = mock_source
+        self._watchdog = watchdog
+        self._events = events
         self.setWindowTitle("FST Driver Dashboard")
         self.setStyleSheet(f"background-color: {CLR_BG};")
 
@@ -227,7 +478,7 @@ class DriverDashboard(QMainWindow):
         root.setSpacing(0)
 
         # ── RPM Bar ──
-        self.rpm_bar = RPMBar()
+        self.rpm_bar = RPMBar(layout.rpm_max, layout.rpm_redline)
         root.addWidget(self.rpm_bar)
 
         # ── NO SIGNAL banner (hidden by default) ──
@@ -245,6 +496,16 @@ class DriverDashboard(QMainWindow):
         self.no_signal_label.hide()
         root.addWidget(self.no_signal_label)
 
+        # ── Event banner: WARN / CRITICAL olaylarda yanıp söner ──
+        self.event_label = QLabel("")
+        self.event_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.event_label.setFixedHeight(56)
+        self.event_label.hide()
+        root.addWidget(self.event_label)
+        self._event_blinks = 0
+        self._blink_timer = QTimer(self)
+        self._blink_timer.timeout.connect(self._blink)
+
         # ── Thin separator ──
         sep1 = QWidget()
         sep1.setFixedHeight(1)
@@ -252,50 +513,47 @@ class DriverDashboard(QMainWindow):
         root.addWidget(sep1)
         root.addSpacing(8)
 
-        # ── Gear number (center, enormous) ──
-        self.gear_label = QLabel("N")
-        self.gear_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.gear_label.setStyleSheet(f"""
-            color: {CLR_GEAR};
-            font-size: 260px;
-            font-family: '{FONT_FAMILY}', sans-serif;
-            font-weight: 200;
-        """)
-        root.addWidget(self.gear_label, stretch=3)
-
-        # ── Speed ──
-        speed_container = QWidget()
-        speed_layout = QHBoxLayout(speed_container)
-        speed_layout.setContentsMargins(0, 0, 0, 0)
-        speed_layout.setSpacing(4)
-        speed_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        self.speed_label = QLabel("0")
-        self.speed_label.setAlignment(
-            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBaseline
-        )
-        self.speed_label.setStyleSheet(f"""
-            color: {CLR_SPEED};
-            font-size: 120px;
-            font-family: '{FONT_FAMILY}', sans-serif;
-            font-weight: 300;
-        """)
-        speed_layout.addWidget(self.speed_label)
-
-        unit_label = QLabel("km/h")
-        unit_label.setAlignment(
-            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom
-        )
-        unit_label.setStyleSheet(f"""
-            color: {CLR_UNIT};
-            font-size: 40px;
-            font-family: '{FONT_FAMILY}', sans-serif;
-            font-weight: 300;
-            padding-bottom: 22px;
-        """)
-        speed_layout.addWidget(unit_label)
+        # ── Layout'tan göstergeler: center (dev), main (birimli), bottom (readout) ──
+        self.bindings: List[Binding] = []
+        self.labels: Dict[str, QLabel] = {}
+        bottom_defs = []
+        for wd in layout.widgets:
+            if wd.slot == "bottom":
+                bottom_defs.append(wd)
+                continue
+
+            label = QLabel(wd.stale_text)
+            self._bind(wd, label, f"'{FONT_FAMILY}', sans-serif")
+            if wd.slot == "center":
+                label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                root.addWidget(label, stretch=3)
+                continue
+
+            container = QWidget()
+            row = QHBoxLayout(container)
+            row.setContentsMargins(0, 0, 0, 0)
+            row.setSpacing(4)
+            row.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            label.setAlignment(
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBaseline
+            )
+            row.addWidget(label)
+
+            if wd.unit:
+                unit_label = QLabel(wd.unit)
+                unit_label.setAlignment(
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom
+                )
+                unit_label.setStyleSheet(f"""
+                    color: {CLR_UNIT};
+                    font-size: {wd.font_size // 3}px;
+                    font-family: '{FONT_FAMILY}', sans-serif;
+                    font-weight: 300;
+                    padding-bottom: {wd.font_size * 11 // 60}px;
+                """)
+                row.addWidget(unit_label)
 
-        root.addWidget(speed_container)
+            root.addWidget(container)
 
         # ── Lap Time Row ──
         if self.lap_timer:
@@ -310,14 +568,8 @@ class DriverDashboard(QMainWindow):
             lap_row.setSpacing(24)
 
             # Current lap elapsed
-            self.lap_elapsed_label = QLabel("LAP  0:00.000")
-            self.lap_elapsed_label.setStyleSheet(f"""
-                color: {CLR_LAP_TIME};
-                font-size: 28px;
-                font-family: '{FONT_FAMILY}', monospace;
-                font-weight: 400;
-            """)
-            lap_row.addWidget(self.lap_elapsed_label)
+            self.lap_clock = GlyphLabel("LAP  0:00.000", CLR_LAP_TIME, 28, "LAP  00:00.000")
+            lap_row.addWidget(self.lap_clock)
 
             lap_row.addStretch()
 
@@ -334,13 +586,7 @@ class DriverDashboard(QMainWindow):
             lap_row.addStretch()
 
             # Delta
-            self.delta_label = QLabel("Δ  –.–––")
-            self.delta_label.setStyleSheet(f"""
-                color: {CLR_UNIT};
-                font-size: 36px;
-                font-family: '{FONT_FAMILY}', monospace;
-                font-weight: 700;
-            """)
+            self.delta_label = GlyphLabel("Δ  –.–––", CLR_UNIT, 36, "Δ  +00.000", QFont.Weight.Bold)
             lap_row.addWidget(self.delta_label)
 
             root.addLayout(lap_row)
@@ -366,47 +612,141 @@ class DriverDashboard(QMainWindow):
 
         bottom.addStretch()
 
-        # Coolant temp readout
-        self.coolant_label = QLabel("CLT  –°C")
-        self.coolant_label.setStyleSheet(f"""
-            color: {CLR_LAP_TIME};
-            font-size: 32px;
-            font-family: '{FONT_FAMILY}', monospace;
-            font-weight: 500;
-        """)
-        bottom.addWidget(self.coolant_label)
-
-        bottom.addSpacing(16)
-
-        # Oil pressure readout
-        self.oil_p_label = QLabel("OIL  – bar")
-        self.oil_p_label.setStyleSheet(f"""
-            color: {CLR_LAP_TIME};
-            font-size: 32px;
-            font-family: '{FONT_FAMILY}', monospace;
-            font-weight: 500;
-        """)
-        bottom.addWidget(self.oil_p_label)
-
-        bottom.addSpacing(16)
+        # Critical readouts (layout)
+        for wd in bottom_defs:
+            label = QLabel(wd.stale_text)
+            self._bind(wd, label, f"'{FONT_FAMILY}', monospace")
+            bottom.addWidget(label)
+            bottom.addSpacing(16)
 
         self.battery_bar = BatteryBar()
         bottom.addWidget(self.battery_bar, alignment=Qt.AlignmentFlag.AlignRight)
 
         root.addLayout(bottom)
 
-        # ── Refresh timer (20 Hz) ──
-        self._timer = QTimer()
-        self._timer.timeout.connect(self._refresh)
-        self._timer.start(50)
+        # Refresh'te okunacak sinyaller (tekrarsız, sabit)
+        self._signals = tuple(dict.fromkeys(
+            (layout.rpm_signal, *layout.critical, *(b.signal for b in self.bindings))
+        ))
+
+        # ── Stale event'leri: banner timeout anında tepki verir ──
+        if self._watchdog:
+            self._stale_bridge = _StaleBridge(self)
+            self._stale_bridge.changed.connect(self._on_stale_changed)
+            self._watchdog.subscribe(self._stale_bridge.on_event)
+
+        # ── Uyarı olayları: log taranmaz, sadece WARN+ olaylar push edilir ──
+        if self._events:
+            self._event_bridge = _EventBridge(self)
+            self._event_bridge.raised.connect(self._on_event)
+            self._events.subscribe(self._event_bridge.on_event, min_level=WARN)
+
+        # ── Interpolasyon: sinyal başına son iki örnek ──
+        self._interp: Dict[str, _SampleInterp] = {s: _SampleInterp() for s in layout.interpolate}
+
+        # ── Frame saati: RPM bar + tur saati her frame; kalan göstergeler her N.
+        #    frame'de (ayrı timer yok → aynı paint geçişinde çizilirler) ──
+        self._pacer: Optional[_FramePacer] = None
+        self._timer: Optional[QTimer] = None
+        if layout.frame_hz is not None:
+            hz = layout.frame_hz or self.screen().refreshRate() or DEFAULT_FRAME_HZ
+            self._frame_signals = tuple(dict.fromkeys((layout.rpm_signal, *self._interp)))
+            self._refresh_every = max(1, round(hz * REFRESH_MS / 1000))
+            self._pacer = _FramePacer(hz, self._frame, self)
+            self._pacer.start()
+        else:
+            # ── Refresh timer (20 Hz) ──
+            self._timer = QTimer()
+            self._timer.timeout.connect(self._refresh)
+            self._timer.start(REFRESH_MS)
+
+    def _bind(self, wd, label: QLabel, family: str) -> None:
+        binding = compile_binding(wd, label, family, CLR_STALE)
+        binding.label.setStyleSheet(binding.styles[0])
+        self.bindings.append(binding)
+        self.labels[wd.signal] = label
+
+    # ── Stale events ────────────────────────────────────────
+    def _on_stale_changed(self, name: str, stale: bool):
+        if name not in self._critical:
+            return
+        if any(self._watchdog.is_stale(s) for s in self._critical):
+            self.no_signal_label.show()
+        else:
+            self.no_signal_label.hide()
+
+    # ── Warning events ──────────────────────────────────────
+    def _on_event(self, ev: Event):
+        color = CLR_EVT_CRIT if ev.level >= CRITICAL else CLR_EVT_WARN
+        self.event_label.setStyleSheet(f"""
+            color: #FFFFFF;
+            background-color: {color};
+            font-size: 36px;
+            font-family: '{FONT_FAMILY}', sans-serif;
+            font-weight: 800;
+            padding: 6px;
+        """)
+        self.event_label.setText(ev.text or ev.type.upper())
+        self.event_label.show()
+        self._event_blinks = EVENT_FLASH_MS // EVENT_BLINK_MS
+        self._blink_timer.start(EVENT_BLINK_MS)
+
+    def _blink(self):
+        self._event_blinks -= 1
+        if self._event_blinks <= 0:
+            self._blink_timer.stop()
+            self.event_label.hide()
+            return
+        self.event_label.setVisible(not self.event_label.isVisible())
+
+    def closeEvent(self, event):
+        if self._pacer:
+            self._pacer.stop()
+        if self._watchdog:
+            self._watchdog.unsubscribe(self._stale_bridge.on_event)
+        if self._events:
+            self._events.unsubscribe(self._event_bridge.on_event)
+        super().closeEvent(event)
+
+    # ── Frame (frame_rate açıkken) ──────────────────────────
+    def _frame(self, now: float):
+        snap = self.store.get_many(self._frame_signals)
+        for name, interp in self._interp.items():
+            interp.push(snap[name])
+        self._set_rpm(snap[self._layout.rpm_signal], now)
+        if self.lap_timer:
+            self._set_lap_clock()
+        if self._pacer.frames % self._refresh_every == 0:
+            self._refresh()
+
+    def _value(self, name: str, s: SignalValue, now: float) -> SignalValue:
+        """İnterpolasyon listesindeyse ara değer, değilse örneğin kendisi."""
+        interp = self._interp.get(name)
+        if interp is None or s.stale or s.value is None:
+            return s
+        return SignalValue(value=interp.at(now), ts=s.ts, stale=False)
+
+    def _set_rpm(self, r_sig: SignalValue, now: float):
+        r_sig = self._value(self._layout.rpm_signal, r_sig, now)
+        if r_sig.stale or r_sig.value is None:
+            self.rpm_bar.set_rpm(0)
+        else:
+            self.rpm_bar.set_rpm(r_sig.value)
+
+    def _set_lap_clock(self):
+        self.lap_clock.set_text(f"LAP  {self.lap_timer.format_time(self.lap_timer.elapsed)}")
 
     # ── Refresh ─────────────────────────────────────────────
     def _refresh(self):
-        snap = self.store.snapshot()
+        # Sadece ekrandaki sinyaller okunur
+        now = time.monotonic()
+        snap = self.store.get_many(self._signals)
+        if self._pacer is None:
+            for name, interp in self._interp.items():
+                interp.push(snap[name])
 
         # Check if any critical signal is stale
-        critical = ["rpm", "speed", "gear"]
-        any_stale = any(snap[s].stale for s in critical)
+        any_stale = any(snap[s].stale for s in self._critical)
 
         # NO SIGNAL banner
         if any_stale:
@@ -414,140 +754,50 @@ class DriverDashboard(QMainWindow):
         else:
             self.no_signal_label.hide()
 
-        # Gear
-        g_sig = snap["gear"]
-        if g_sig.stale or g_sig.value is None:
-            self.gear_label.setText("–")
-            self.gear_label.setStyleSheet(f"""
-                color: {CLR_STALE};
-                font-size: 260px;
-                font-family: '{FONT_FAMILY}', sans-serif;
-                font-weight: 200;
-            """)
-        else:
-            g = int(g_sig.value)
-            self.gear_label.setText(str(g) if g > 0 else "N")
-            self.gear_label.setStyleSheet(f"""
-                color: {CLR_GEAR};
-                font-size: 260px;
-                font-family: '{FONT_FAMILY}', sans-serif;
-                font-weight: 200;
-            """)
-
-        # RPM
-        r_sig = snap["rpm"]
-        if r_sig.stale or r_sig.value is None:
-            self.rpm_bar.set_rpm(0)
-        else:
-            self.rpm_bar.set_rpm(r_sig.value)
-
-        # Speed
-        s_sig = snap["speed"]
-        if s_sig.stale or s_sig.value is None:
-            self.speed_label.setText("–")
-            self.speed_label.setStyleSheet(f"""
-                color: {CLR_STALE};
-                font-size: 120px;
-                font-family: '{FONT_FAMILY}', sans-serif;
-                font-weight: 300;
-            """)
-        else:
-            self.speed_label.setText(str(int(s_sig.value)))
-            self.speed_label.setStyleSheet(f"""
-                color: {CLR_SPEED};
-                font-size: 120px;
-                font-family: '{FONT_FAMILY}', sans-serif;
-                font-weight: 300;
-            """)
+        # RPM (frame saati açıksa orada çizilir)
+        if self._pacer is None:
+            self._set_rpm(snap[self._layout.rpm_signal], now)
 
-        # Coolant temp (warn > 100°C, stale → dim)
-        c_sig = snap["coolant"]
-        if c_sig.stale or c_sig.value is None:
-            self.coolant_label.setStyleSheet(f"""
-                color: {CLR_STALE};
-                font-size: 32px;
-                font-family: '{FONT_FAMILY}', monospace;
-                font-weight: 500;
-            """)
-            self.coolant_label.setText("CLT  –°C")
-        else:
-            ct = c_sig.value
-            color = CLR_DELTA_POS if ct > 100 else CLR_LAP_TIME
-            self.coolant_label.setStyleSheet(f"""
-                color: {color};
-                font-size: 32px;
-                font-family: '{FONT_FAMILY}', monospace;
-                font-weight: {'700' if ct > 100 else '500'};
-            """)
-            self.coolant_label.setText(f"CLT  {int(ct)}°C")
-
-        # Oil pressure (warn < 1.5 bar, stale → dim)
-        o_sig = snap["oil_pressure"]
-        if o_sig.stale or o_sig.value is None:
-            self.oil_p_label.setStyleSheet(f"""
-                color: {CLR_STALE};
-                font-size: 32px;
-                font-family: '{FONT_FAMILY}', monospace;
-                font-weight: 500;
-            """)
-            self.oil_p_label.setText("OIL  – bar")
-        else:
-            op = o_sig.value
-            color = CLR_DELTA_POS if op < 1.5 else CLR_LAP_TIME
-            self.oil_p_label.setStyleSheet(f"""
-                color: {color};
-                font-size: 32px;
-                font-family: '{FONT_FAMILY}', monospace;
-                font-weight: {'700' if op < 1.5 else '500'};
-            """)
-            self.oil_p_label.setText(f"OIL  {op:.1f} bar")
+        # Göstergeler: derlenmiş binding kayıtları
+        for b in self.bindings:
+            b.apply(self._value(b.signal, snap[b.signal], now))
 
         # Lap timer
         if self.lap_timer:
             # Current lap elapsed
-            elapsed = self.lap_timer.elapsed
-            self.lap_elapsed_label.setText(
-                f"LAP  {self.lap_timer.format_time(elapsed)}"
-            )
+            if self._pacer is None:
+                self._set_lap_clock()
 
             # Last lap
             last = self.lap_timer.last_lap
             if last:
                 time_str = self.lap_timer.format_time(last.lap_time)
                 if last.is_personal_best:
-                    self.last_lap_label.setStyleSheet(f"""
+                    _set_label(self.last_lap_label, f"PB!  {time_str}", f"""
                         color: {CLR_PB_FLASH};
                         font-size: 28px;
                         font-family: '{FONT_FAMILY}', monospace;
                         font-weight: 700;
                     """)
-                    self.last_lap_label.setText(f"PB!  {time_str}")
                 else:
-                    self.last_lap_label.setStyleSheet(f"""
+                    _set_label(self.last_lap_label, f"LAST  {time_str}", f"""
                         color: {CLR_LAP_TIME};
                         font-size: 28px;
                         font-family: '{FONT_FAMILY}', monospace;
                         font-weight: 400;
                     """)
-                    self.last_lap_label.setText(f"LAST  {time_str}")
 
             # Delta
             delta = self.lap_timer.delta
             if delta is not None:
                 delta_str = self.lap_timer.format_delta(delta)
                 color = CLR_DELTA_NEG if delta < 0 else CLR_DELTA_POS
-                self.delta_label.setStyleSheet(f"""
-                    color: {color};
-                    font-size: 36px;
-                    font-family: '{FONT_FAMILY}', monospace;
-                    font-weight: 700;
-                """)
-                self.delta_label.setText(f"Δ  {delta_str}")
+                self.delta_label.set_text(f"Δ  {delta_str}", color)
 
     # ── Keyboard shortcut ───────────────────────────────────
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Space and self._mock_source:
-            if self._mock_source._paused:
+            if self._mock_source.paused:
                 self._mock_source.resume()
             else:
                 self._mock_source.pause()
@@ -556,8 +806,10 @@ class DriverDashboard(QMainWindow):
 
 
 # ── Entry point ─────────────────────────────────────────────
-def create_driver_ui(store: SignalStore, lap_timer: LapTimer | None = None, mock_source=None):
+def create_driver_ui(store: SignalStore, layout: DriverLayout, lap_timer: LapTimer | None = None,
+                     mock_source=None, watchdog: StalenessWatchdog | None = None,
+                     events: EventChannel | None = None):
     app = QApplication(sys.argv)
-    window = DriverDashboard(store, lap_timer, mock_source)
+    window = DriverDashboard(store, layout, lap_timer, mock_source, watchdog, events)
     window.showFullScreen()
     sys.exit(app.exec())
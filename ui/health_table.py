@@ -0,0 +1,89 @@
+"""
+Health table — pit UI'da sinyal başına veri kalitesi tablosu.
+
+SignalStore.health_all() saniyede iki kez okunur (kendi timer'ı, grafik
+tick'inden bağımsız). Sorunlu hücreler renklenir: kopukluk sürüyorsa kırmızı,
+stale episode / aralık dışı / atılan örnek / yüksek jitter varsa turuncu.
+Config reload'da sinyal listesi değişirse satırlar yeniden kurulur.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QHeaderView, QTableWidget, QTableWidgetItem
+
+from core.health import JITTER_LABELS, SignalHealth
+from core.signal_store import SignalStore
+
+REFRESH_MS = 500
+JITTER_WARN = 0.05        # aralıkların %5'inden fazlası periyottan %25+ sapıyorsa
+
+CLR_WARN = QColor("#b36b00")
+CLR_BAD = QColor("#a00000")
+
+COLUMNS = ("Signal", "Rate Hz", "Jitter >25%", "Max gap s", "Gap s",
+           "Stale", "Out of range", "Dropped", "Updates")
+
+
+class HealthTable(QTableWidget):
+    def __init__(self, store: SignalStore, parent=None):
+        super().__init__(0, len(COLUMNS), parent)
+        self._store = store
+        self._names: List[str] = []
+        self.setHorizontalHeaderLabels(COLUMNS)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.verticalHeader().setVisible(False)
+        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._set_rows(list(store.defs))
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self._timer.start(REFRESH_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self) -> None:
+        health = self._store.health_all()
+        defs = self._store.defs
+        # Reload sırasında sayaçlar tanımlardan bir an önce güncellenir
+        names = [n for n in health if n in defs]
+        if names != self._names:
+            self._set_rows(names)
+        for r, name in enumerate(names):
+            self._fill(r, health[name], defs[name].stale_after_s)
+
+    def _set_rows(self, names: List[str]) -> None:
+        self._names = names
+        self.setRowCount(len(names))
+        for r, name in enumerate(names):
+            self.setItem(r, 0, QTableWidgetItem(name))
+            for c in range(1, len(COLUMNS)):
+                self.setItem(r, c, QTableWidgetItem(""))
+
+    def _fill(self, row: int, h: SignalHealth, stale_after: float) -> None:
+        live_gap = h.gap_s is not None and h.gap_s > stale_after
+        cells = (
+            (f"{h.rate_hz:.1f}" if h.rate_hz else "–", None),
+            (f"{h.jitter_ratio:.1%}", CLR_WARN if h.jitter_ratio > JITTER_WARN else None),
+            (f"{h.max_gap_s:.3f}", CLR_WARN if h.max_gap_s > stale_after else None),
+            (f"{h.gap_s:.3f}" if h.gap_s is not None else "–", CLR_BAD if live_gap else None),
+            (str(h.stale_episodes), CLR_BAD if live_gap else CLR_WARN if h.stale_episodes else None),
+            (str(h.out_of_range), CLR_WARN if h.out_of_range else None),
+            (str(h.dropped), CLR_WARN if h.dropped else None),
+            (str(h.updates), None),
+        )
+        for c, (text, color) in enumerate(cells, start=1):
+            item = self.item(row, c)
+            item.setText(text)
+            item.setBackground(color if color is not None else QColor(0, 0, 0, 0))
+        self.item(row, 2).setToolTip(
+            "\n".join(f"{label}: {n}" for label, n in zip(JITTER_LABELS, h.jitter)))
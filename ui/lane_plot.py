@@ -0,0 +1,124 @@
+"""
+Lane plot — tüm izler tek pyqtgraph canvas'ında, üst üste şeritlerde.
+
+Her sinyal SignalDef min/max ile kendi şeridine normalize edilir (taşan değer
+şerit sınırında kırpılır). İlişkili kanallar (rpm/tps/speed gibi) aynı şeride
+bindirilir. Tek viewbox, tek X ekseni; her frame renk başına tek bir
+`setData` çağrısı: izler NaN ayraçlarıyla uç uca eklenir (connect="finite").
+Ayrı PlotWidget'ların viewbox / eksen / sahne yükü yoktur.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtCore import Signal
+
+from core.lod import SignalHistory
+from core.signals_def import SignalDef
+
+LANE_FILL = 0.85                       # şerit yüksekliğinin iz için kullanılan kısmı
+PALETTE = ('y', 'c', 'm', 'g', 'w')    # şerit içindeki sıra → renk
+
+
+class LanePlot(pg.PlotWidget):
+    # Kullanıcı mouse ile kaydırdı/zoomladı: (x0, x1)
+    rangeChangedManually = Signal(float, float)
+
+    def __init__(self, defs: Dict[str, SignalDef], signals: Sequence[str],
+                 groups: Sequence[Sequence[str]] = (), parent=None):
+        super().__init__(parent)
+        self._defs = defs
+        self._groups = [tuple(g) for g in groups]
+        self._signals: List[str] = []
+        # (sinyal, renk sırası, şerit tabanı, min, ölçek)
+        self._traces: List[Tuple[str, int, float, float, float]] = []
+        self._curves: List[pg.PlotDataItem] = []
+        self._separators: List[pg.InfiniteLine] = []
+
+        self.setLabel('bottom', 'Time (s)')
+        self.showGrid(x=True, y=False)
+        # İzler uç uca eklendiği için x monoton değil → clipToView kullanılamaz;
+        # sorgu zaten sadece görünen aralığı döndürür
+        self.setMouseEnabled(x=True, y=False)
+        self.getViewBox().sigRangeChangedManually.connect(self._on_manual)
+        self.set_signals(signals)
+
+    # ── Public ──────────────────────────────────────────────
+    def set_defs(self, defs: Dict[str, SignalDef]) -> None:
+        """Config reload: değişen min/max ile şeritleri yeniden ölçekle."""
+        self._defs = defs
+        self.set_signals([s for s in self._signals if s in defs])
+
+    def set_signals(self, signals: Sequence[str]) -> None:
+        """Şeritleri yeniden kur: önce seçili gruplar, kalan sinyaller tek başına."""
+        chosen = list(signals)
+        self._signals = chosen
+        selected = set(chosen)
+        lanes: List[Tuple[str, ...]] = []
+        used = set()
+        for group in self._groups:
+            members = tuple(s for s in group if s in selected and s not in used)
+            if members:
+                lanes.append(members)
+                used.update(members)
+        lanes += [(s,) for s in chosen if s not in used]
+
+        n = len(lanes)
+        self._traces = []
+        ticks = []
+        for i, lane in enumerate(lanes):
+            base = float(n - 1 - i)     # ilk şerit en üstte
+            for k, sig in enumerate(lane):
+                d = self._defs[sig]
+                span = d.max - d.min
+                scale = LANE_FILL / span if span > 0 else 0.0
+                self._traces.append((sig, k, base, d.min, scale))
+            ticks.append((base + LANE_FILL / 2, " / ".join(lane)))
+        self.getAxis('left').setTicks([ticks])
+
+        depth = max((len(lane) for lane in lanes), default=0)
+        while len(self._curves) < depth:
+            self._curves.append(self.plot(pen=PALETTE[len(self._curves) % len(PALETTE)]))
+        for curve in self._curves:
+            curve.setData([], [])
+
+        for line in self._separators:
+            self.removeItem(line)
+        self._separators = []
+        for i in range(1, n):
+            line = pg.InfiniteLine(pos=float(i), angle=0, pen=pg.mkPen('#444444'))
+            self.addItem(line)
+            self._separators.append(line)
+        self.setYRange(0, max(n, 1), padding=0)
+
+    def set_x_range(self, x0: float, x1: float) -> None:
+        self.setXRange(x0, x1, padding=0)
+
+    def plot_width(self) -> int:
+        return max(100, int(self.getViewBox().width()))
+
+    def update_traces(self, history: SignalHistory, t0: float, t1: float,
+                      max_points: int, t_offset: float) -> None:
+        """Görünen aralığı sorgula, renk başına tek dizide birleştir ve çiz."""
+        xs: List[List[np.ndarray]] = [[] for _ in self._curves]
+        ys: List[List[np.ndarray]] = [[] for _ in self._curves]
+        gap = np.array([np.nan])
+        for sig, k, base, vmin, scale in self._traces:
+            x, y = history.query(sig, t0, t1, max_points).trace()
+            if len(x) == 0:
+                continue
+            xs[k] += (x - t_offset, gap)
+            ys[k] += (base + np.clip((y - vmin) * scale, 0.0, LANE_FILL), gap)
+
+        for curve, x, y in zip(self._curves, xs, ys):
+            if x:
+                curve.setData(np.concatenate(x), np.concatenate(y), connect="finite")
+            else:
+                curve.setData([], [])
+
+    def _on_manual(self, *_) -> None:
+        x0, x1 = self.getViewBox().viewRange()[0]
+        self.rangeChangedManually.emit(x0, x1)
@@ -1,82 +1,198 @@
 import sys
 import time
-from typing import Dict, List
+from typing import Dict
 
 import pyqtgraph as pg
-from PySide6.QtCore import QTimer
-from PySide6.QtWidgets import QApplication, QGridLayout, QMainWindow, QWidget
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtWidgets import QApplication, QDockWidget, QMainWindow, QSplitter, QStackedWidget
 
+from core.capture import CaptureManager
+from core.layout_def import PitLayout
+from core.lod import LODWindow, SignalHistory
 from core.signal_store import SignalStore
+from core.signals_def import SignalDef, SignalDefDiff
+from ui.analysis_panel import AnalysisPanel
+from ui.capture_panel import CapturePanel
+from ui.health_table import HealthTable
+from ui.lane_plot import LanePlot
+from ui.plot_grid import SignalPicker, VirtualPlotGrid
+
+LIVE_WINDOW_S = 10.0  # canlı takipte gösterilen son N saniye
+
+
+class _DefsBridge(QObject):
+    """Config reload'u (watcher thread'i) UI thread'ine taşır."""
+
+    changed = Signal(object)
+
+    def on_defs(self, defs: Dict[str, SignalDef], diff: SignalDefDiff) -> None:
+        self.changed.emit(defs)
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, store: SignalStore):
+    def __init__(self, store: SignalStore, history: SignalHistory | None = None,
+                 layout: PitLayout | None = None, captures: CaptureManager | None = None):
         super().__init__()
         self.store = store
-        self.signals = list(store.defs.keys())
-        self.data: Dict[str, List[float]] = {sig: [] for sig in self.signals}
-        self.times: List[float] = []
+        self.signals = list(layout.signals) if layout else list(store.defs.keys())
+        # Boş pit.signals (= tüm sinyaller) reload'da yeni tanım listesini izler
+        self._all_signals = self.signals == list(store.defs)
+        columns = layout.columns if layout else 3
+        groups = layout.lanes if layout else ()
+
+        # history None → pencere kendi geçmişini tutar; her örnek listener'dan gelir
+        # (snapshot'ı UI tick'inde okumak hızlı sinyalleri seyreltirdi)
+        self._own_history = history is None
+        self.history = history if history is not None else SignalHistory(store.defs)
+        if self._own_history:
+            # remove_*listener kimliğe bakar; bound method'lar saklanır
+            self._history_hooks = (self.history.append, self.history.apply_defs)
+            store.add_listener(self._history_hooks[0])
+            store.add_defs_listener(self._history_hooks[1])
+        self._t0 = time.monotonic()
+        self._follow = True   # Home: canlı takip, End: tüm oturum, mouse: serbest
+        self._lanes_mode = bool(layout and layout.mode == "lanes")   # L: grid ↔ lanes
 
         self.setWindowTitle("FST ECU Pit UI")
         self.setGeometry(100, 100, 1200, 800)
 
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        layout = QGridLayout(central_widget)
-
-        self.plots: Dict[str, pg.PlotWidget] = {}
-        self.curves: Dict[str, pg.PlotCurveItem] = {}
-
-        row, col = 0, 0
-        for sig in self.signals:
-            plot = pg.PlotWidget(title=sig.upper())
-            plot.setLabel('left', store.defs[sig].unit)
-            plot.setLabel('bottom', 'Time (s)')
-            plot.showGrid(x=True, y=True)
-            curve = plot.plot(pen='y')
-            self.plots[sig] = plot
-            self.curves[sig] = curve
-            layout.addWidget(plot, row, col)
-            col += 1
-            if col == 3:
-                col = 0
-                row += 1
+        # Sadece görünen grafikler widget olarak var; geçmiş tüm sinyaller için birikir
+        self.grid = VirtualPlotGrid(store.defs, self.signals, columns)
+        self.grid.rangeChangedManually.connect(self._on_manual_range)
+        self.lanes = LanePlot(store.defs, self.signals, groups)
+        self.lanes.rangeChangedManually.connect(self._on_manual_range)
+        self.picker = SignalPicker(store.defs, self.signals)
+        self.picker.selectionChanged.connect(self.grid.set_signals)
+        self.picker.selectionChanged.connect(self.lanes.set_signals)
+
+        self.plots = QStackedWidget()
+        self.plots.addWidget(self.grid)
+        self.plots.addWidget(self.lanes)
+        self.plots.setCurrentWidget(self.lanes if self._lanes_mode else self.grid)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        splitter.addWidget(self.picker)
+        splitter.addWidget(self.plots)
+        splitter.setStretchFactor(1, 1)
+        splitter.setSizes([200, 1000])
+        self.setCentralWidget(splitter)
+
+        # A: analiz paneli (FFT / histogram / kayan istatistik, worker pool'da)
+        self.analysis = AnalysisPanel(store.defs, self.history, self.signals, self._t0)
+        self.picker.selectionChanged.connect(self.analysis.set_signals)
+        self.analysis_dock = QDockWidget("Analysis", self)
+        self.analysis_dock.setWidget(self.analysis)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.analysis_dock)
+        self.analysis_dock.hide()
+
+        # H: sinyal sağlığı tablosu (hız, jitter, boşluk, aralık dışı, atılan)
+        self.health = HealthTable(store)
+        self.health_dock = QDockWidget("Signal health", self)
+        self.health_dock.setWidget(self.health)
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.health_dock)
+        self.health_dock.hide()
+
+        # C: tetiklemeli capture listesi (yeni capture gelince kendiliğinden açılır)
+        self.captures = None
+        if captures is not None:
+            self.captures = CapturePanel(store.defs, captures, groups)
+            self.captures_dock = QDockWidget("Captures", self)
+            self.captures_dock.setWidget(self.captures)
+            self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.captures_dock)
+            self.captures_dock.hide()
+            self.captures.list.model().rowsInserted.connect(lambda *_: self.captures_dock.show())
+        self._x_range = (-LIVE_WINDOW_S, 0.0)
+
+        # signals.yaml reload: picker / grafikler yeni tanımlara geçer
+        self._defs_bridge = _DefsBridge()
+        self._defs_bridge.changed.connect(self._on_defs)
+        store.add_defs_listener(self._defs_bridge.on_defs)
 
         # Timer for updates
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_plots)
         self.timer.start(50)  # 20 Hz
 
-        self.start_time = time.time()
+    def _on_defs(self, defs: Dict[str, SignalDef]):
+        # Yerinde: panellere verilen aynı liste güncel kalır
+        if self._all_signals:
+            self.signals[:] = defs
+        else:
+            self.signals[:] = [s for s in self.signals if s in defs]
+        self.grid.set_defs(defs)
+        self.lanes.set_defs(defs)
+        self.analysis.set_defs(defs)
+        if self.captures is not None:
+            self.captures.set_defs(defs)
+        # Seçimden çıkan sinyal varsa selectionChanged grafiklere de yayılır
+        self.picker.set_defs(defs)
+
+    def _on_manual_range(self, x0: float, x1: float):
+        self._follow = False
+        self._x_range = (x0, x1)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_Home:
+            self._follow = True
+        elif event.key() == Qt.Key.Key_End:
+            self._follow = False
+            span = self.history.span()
+            if span:
+                self._x_range = (span[0] - self._t0, span[1] - self._t0)
+        elif event.key() == Qt.Key.Key_L:
+            self._lanes_mode = not self._lanes_mode
+            self.plots.setCurrentWidget(self.lanes if self._lanes_mode else self.grid)
+        elif event.key() == Qt.Key.Key_A:
+            self.analysis_dock.setVisible(not self.analysis_dock.isVisible())
+        elif event.key() == Qt.Key.Key_H:
+            self.health_dock.setVisible(not self.health_dock.isVisible())
+        elif event.key() == Qt.Key.Key_C and self.captures is not None:
+            self.captures_dock.setVisible(not self.captures_dock.isVisible())
+        else:
+            super().keyPressEvent(event)
 
     def update_plots(self):
-        current_time = time.time() - self.start_time
-        self.times.append(current_time)
-
-        snapshot = self.store.snapshot()
-        for sig in self.signals:
-            val = snapshot[sig].value
-            if val is not None:
-                self.data[sig].append(val)
-            else:
-                # If no value, repeat last or 0
-                last_val = self.data[sig][-1] if self.data[sig] else 0
-                self.data[sig].append(last_val)
-
-        # Keep only last 100 points for performance
-        max_points = 100
-        if len(self.times) > max_points:
-            self.times = self.times[-max_points:]
-            for sig in self.signals:
-                self.data[sig] = self.data[sig][-max_points:]
-
-        # Update curves
-        for sig in self.signals:
-            self.curves[sig].setData(self.times, self.data[sig])
-
-
-def create_ui(store: SignalStore):
+        if self._follow:
+            now = time.monotonic() - self._t0
+            self._x_range = (now - LIVE_WINDOW_S, now)
+
+        x0, x1 = self._x_range
+        t0, t1 = x0 + self._t0, x1 + self._t0
+        if self.analysis_dock.isVisible():
+            self.analysis.set_window(t0, t1)
+
+        if self._lanes_mode:
+            self.lanes.set_x_range(x0, x1)
+            self.lanes.update_traces(self.history, t0, t1, self.lanes.plot_width(), self._t0)
+            return
+
+        self.grid.set_x_range(x0, x1)
+        # Ekrandaki piksel kadar nokta yeter; uygun LOD seviyesi seçilir
+        max_points = self.grid.plot_width()
+
+        # Sadece görünen grafikler sorgulanır / çizilir
+        for sig, curve in self.grid.visible_items():
+            w = self.history.query(sig, t0, t1, max_points)
+            self._set_curve(curve, w)
+
+    def closeEvent(self, event):
+        self.store.remove_defs_listener(self._defs_bridge.on_defs)
+        if self._own_history:
+            self.store.remove_listener(self._history_hooks[0])
+            self.store.remove_defs_listener(self._history_hooks[1])
+        self.analysis.close_pool()
+        if self.captures is not None:
+            self.captures.detach()
+        super().closeEvent(event)
+
+    def _set_curve(self, curve: pg.PlotDataItem, w: LODWindow):
+        x, y = w.trace()
+        curve.setData(x - self._t0, y)
+
+
+def create_ui(store: SignalStore, history: SignalHistory | None = None,
+              layout: PitLayout | None = None, captures: CaptureManager | None = None):
     app = QApplication(sys.argv)
-    window = MainWindow(store)
+    window = MainWindow(store, history, layout, captures)
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
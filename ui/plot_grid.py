@@ -0,0 +1,218 @@
+"""
+Virtualized plot grid — yüzlerce sinyal için kaydırılabilir pit grafik alanı.
+
+Sadece ekranda görünen satırlar kadar PlotWidget oluşturulur (havuz). Kaydırınca
+havuzdaki widget'lar yeni sinyallere bağlanır; gizli sinyaller için widget,
+curve veya setData yoktur. Geçmiş (SignalHistory) bundan bağımsız birikir.
+
+SignalPicker: isim / açıklama filtresiyle hızlı sinyal seçimi.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pyqtgraph as pg
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QScrollArea,
+    QVBoxLayout,
+    QWidget,
+)
+
+from core.signals_def import SignalDef
+
+ROW_HEIGHT = 220   # px / satır
+
+
+class _PlotSlot:
+    __slots__ = ("plot", "curve", "signal")
+
+    def __init__(self, parent: QWidget):
+        self.plot = pg.PlotWidget(parent)
+        self.plot.setLabel('bottom', 'Time (s)')
+        self.plot.showGrid(x=True, y=True)
+        self.plot.setClipToView(True)
+        self.curve = self.plot.plot(pen='y')
+        self.signal: Optional[str] = None
+        self.plot.hide()
+
+
+class VirtualPlotGrid(QScrollArea):
+    # Kullanıcı bir grafiği mouse ile kaydırdı/zoomladı: (x0, x1)
+    rangeChangedManually = Signal(float, float)
+
+    def __init__(self, defs: Dict[str, SignalDef], signals: Sequence[str], columns: int = 3,
+                 row_height: int = ROW_HEIGHT, parent=None):
+        super().__init__(parent)
+        self._defs = defs
+        self._signals: List[str] = list(signals)
+        self._columns = max(1, columns)
+        self._row_height = row_height
+        self._pool: List[_PlotSlot] = []
+        self._visible: List[Tuple[str, pg.PlotDataItem]] = []
+        self._x_range: Optional[Tuple[float, float]] = None
+
+        self._canvas = QWidget()
+        self.setWidget(self._canvas)
+        self.setWidgetResizable(False)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.verticalScrollBar().valueChanged.connect(self._relayout)
+
+    # ── Public ──────────────────────────────────────────────
+    def set_defs(self, defs: Dict[str, SignalDef]) -> None:
+        """Config reload: grafikler yeni birimlerle yeniden bağlanır."""
+        self._defs = defs
+        self.set_signals([s for s in self._signals if s in defs])
+
+    def set_signals(self, signals: Sequence[str]) -> None:
+        self._signals = list(signals)
+        for slot in self._pool:
+            slot.signal = None
+        self._relayout()
+
+    def visible_items(self) -> List[Tuple[str, pg.PlotDataItem]]:
+        """Ekrandaki (sinyal, curve) çiftleri — sadece bunlar güncellenir."""
+        return self._visible
+
+    def plot_width(self) -> int:
+        return max(100, self.viewport().width() // self._columns)
+
+    def set_x_range(self, x0: float, x1: float) -> None:
+        self._x_range = (x0, x1)
+        for slot in self._pool:
+            if slot.signal is not None:
+                slot.plot.setXRange(x0, x1, padding=0)
+
+    # ── Layout ──────────────────────────────────────────────
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._relayout()
+
+    def _ensure_pool(self, size: int) -> None:
+        while len(self._pool) < size:
+            slot = _PlotSlot(self._canvas)
+            vb = slot.plot.getViewBox()
+            vb.sigRangeChangedManually.connect(lambda *_, v=vb: self._on_manual(v))
+            self._pool.append(slot)
+
+    def _on_manual(self, vb: pg.ViewBox) -> None:
+        x0, x1 = vb.viewRange()[0]
+        self.set_x_range(x0, x1)
+        self.rangeChangedManually.emit(x0, x1)
+
+    def _relayout(self, *_) -> None:
+        cols = self._columns
+        rows = (len(self._signals) + cols - 1) // cols
+        width = self.viewport().width()
+        height = self.viewport().height()
+        self._canvas.resize(width, rows * self._row_height)
+
+        top = self.verticalScrollBar().value()
+        first_row = top // self._row_height
+        last_row = min(rows, (top + height) // self._row_height + 1)
+        visible_rows = max(0, last_row - first_row)
+        self._ensure_pool((height // self._row_height + 2) * cols)
+
+        # Görünür satırlar için gereken sinyaller → mevcut bağlamayı koru, kalanı yeniden bağla
+        wanted = {}
+        for r in range(first_row, first_row + visible_rows):
+            for c in range(cols):
+                i = r * cols + c
+                if i < len(self._signals):
+                    wanted[self._signals[i]] = (r, c)
+
+        free = [s for s in self._pool if s.signal not in wanted]
+        placed = {s.signal: s for s in self._pool if s.signal in wanted}
+        col_w = width // cols
+        self._visible = []
+
+        for sig, (r, c) in wanted.items():
+            slot = placed.get(sig)
+            if slot is None:
+                slot = free.pop()
+                self._bind(slot, sig)
+            slot.plot.setGeometry(c * col_w, r * self._row_height, col_w, self._row_height)
+            slot.plot.show()
+            self._visible.append((sig, slot.curve))
+
+        for slot in free:
+            slot.signal = None
+            slot.curve.setData([], [])
+            slot.plot.hide()
+
+    def _bind(self, slot: _PlotSlot, sig: str) -> None:
+        slot.signal = sig
+        slot.plot.setTitle(sig.upper())
+        slot.plot.setLabel('left', self._defs[sig].unit)
+        slot.curve.setData([], [])
+        if self._x_range:
+            slot.plot.setXRange(*self._x_range, padding=0)
+
+
+class SignalPicker(QWidget):
+    """Filtrelenebilir, işaretlenebilir sinyal listesi."""
+
+    selectionChanged = Signal(list)
+
+    def __init__(self, defs: Dict[str, SignalDef], selected: Sequence[str], parent=None):
+        super().__init__(parent)
+        self._defs = defs
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self._filter = QLineEdit()
+        self._filter.setPlaceholderText("Filter signals…")
+        self._filter.textChanged.connect(self._apply_filter)
+        layout.addWidget(self._filter)
+
+        self._list = QListWidget()
+        self._fill(selected)
+        self._list.itemChanged.connect(self._emit)
+        layout.addWidget(self._list)
+
+    def set_defs(self, defs: Dict[str, SignalDef]) -> None:
+        """Config reload: yeni sinyaller işaretsiz eklenir, çıkarılanlar listeden düşer."""
+        before = self.selected()
+        selected = [n for n in before if n in defs]
+        self._defs = defs
+        self._list.blockSignals(True)
+        self._list.clear()
+        self._fill(selected)
+        self._list.blockSignals(False)
+        self._apply_filter(self._filter.text())
+        if selected != before:
+            self._emit()
+
+    def _fill(self, selected: Sequence[str]) -> None:
+        chosen = set(selected)
+        # Seçili sinyaller layout sırasıyla önde, kalanlar arkada
+        order = list(selected) + [n for n in self._defs if n not in chosen]
+        for name in order:
+            item = QListWidgetItem(name)
+            item.setToolTip(self._defs[name].description)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if name in chosen else Qt.CheckState.Unchecked)
+            self._list.addItem(item)
+
+    def selected(self) -> List[str]:
+        out = []
+        for i in range(self._list.count()):
+            item = self._list.item(i)
+            if item.checkState() == Qt.CheckState.Checked:
+                out.append(item.text())
+        return out
+
+    def _apply_filter(self, text: str) -> None:
+        needle = text.strip().lower()
+        for i in range(self._list.count()):
+            item = self._list.item(i)
+            name = item.text()
+            hay = f"{name} {self._defs[name].description}".lower()
+            item.setHidden(bool(needle) and needle not in hay)
+
+    def _emit(self, *_) -> None:
+        self.selectionChanged.emit(self.selected())